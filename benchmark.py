@@ -0,0 +1,299 @@
+"""Benchmark Harness for OptSim"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from problems import Problem, OneMaxProblem, KnapsackProblem, CountingProblem
+from logger import Logger
+from rl_env import OneMaxEnv
+from solvers import GASolver, SASolver, RLSolver, ExactKnapsackSolver
+
+PROBLEMS = {"onemax": OneMaxProblem, "knapsack": KnapsackProblem}
+
+class BenchmarkLogger(Logger):
+    """Silent Logger that records when the best fitness first reaches `target`."""
+
+    def __init__(self, target: Optional[float]):
+        super().__init__(print_every=0)
+        self.target = target
+        self.start = time.perf_counter()
+        self.time_to_target: Optional[float] = None
+
+    def log(self, generation: int, best_fitness: float, avg_fitness: float, best_solution: Any = None,
+            population: List[Any] = None, gene_frequency: Optional[np.ndarray] = None, **extra: Any):
+        if self.time_to_target is None and self.target is not None and best_fitness >= self.target:
+            self.time_to_target = time.perf_counter() - self.start
+        super().log(generation, best_fitness, avg_fitness, best_solution, population, gene_frequency, **extra)
+
+# Solver runners take a (counting) problem and a logger and return the best individual
+
+def _run_ga(problem: Problem, logger: Logger) -> Any:
+    solver = GASolver(problem, logger, pop_size=50, mutation_rate=0.01, generations=100)
+    return solver.solve()
+
+def _run_sa(problem: Problem, logger: Logger) -> Any:
+    solver = SASolver(problem, logger, initial_temp=100.0, cooling_rate=0.999, min_temp=0.01, max_steps=5000)
+    return solver.solve()
+
+def _run_rl(problem: Problem, logger: Logger) -> Any:
+    env = OneMaxEnv(problem, index_states=True)
+    solver = RLSolver(env, actions=list(range(problem.size)), alpha=0.5, gamma=0.9, epsilon=0.2)
+    solver.train(episodes=200, max_steps=problem.size * 2)
+    solver.solve(max_steps=problem.size * 2)
+    # RLSolver does not log; record the greedy episode's outcome
+    logger.log(1, env.current_fitness, env.current_fitness, problem.decode(env.state))
+    return env.state
+
+# name -> (runner, supported problems)
+SOLVERS: Dict[str, Tuple[Callable[[Problem, Logger], Any], Tuple[str, ...]]] = {
+    "ga": (_run_ga, ("onemax", "knapsack")),
+    "sa": (_run_sa, ("onemax", "knapsack")),
+    "rl": (_run_rl, ("onemax",)),
+}
+
+# Metrics compared against a baseline: name -> +1 if higher is worse, -1 if lower is worse
+COMPARED_METRICS = {"wall_time": 1, "peak_memory": 1, "evals_per_sec": -1, "final_fitness": -1}
+
+def reference_target(problem: Problem, problem_name: str, target_ratio: float) -> Optional[float]:
+    """Target fitness: `target_ratio` times the known optimum (None if the optimum is too costly to compute)."""
+    if problem_name == "onemax":
+        return target_ratio * problem.size
+    exact = ExactKnapsackSolver(problem)
+    if exact.cells() > exact.max_cells:
+        return None
+    exact.solve()
+    return target_ratio * exact.optimum
+
+def run_case(solver_name: str, problem_name: str, size: int, seed: int,
+             target_ratio: float = 0.95, measure_memory: bool = True) -> Dict[str, Any]:
+    """
+    Run one solver/problem/size/seed combination and return its metrics.
+
+    The timed run and the memory run (with `tracemalloc`, which slows
+    execution) are separate repetitions with the same seed.
+    """
+    runner = SOLVERS[solver_name][0]
+    random.seed(seed)
+    np.random.seed(seed)
+    problem = PROBLEMS[problem_name](size)
+    target = reference_target(problem, problem_name, target_ratio)
+
+    def run(counter: CountingProblem, logger: BenchmarkLogger) -> Any:
+        random.seed(seed)
+        np.random.seed(seed)
+        with redirect_stdout(io.StringIO()):
+            logger.start = time.perf_counter()
+            return runner(counter, logger)
+
+    counter = CountingProblem(problem)
+    logger = BenchmarkLogger(target)
+    start = time.perf_counter()
+    best = run(counter, logger)
+    wall_time = time.perf_counter() - start
+
+    peak_memory = None
+    if measure_memory:
+        tracemalloc.start()
+        run(CountingProblem(problem), BenchmarkLogger(target))
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "solver": solver_name,
+        "problem": problem_name,
+        "size": size,
+        "seed": seed,
+        "wall_time": wall_time,
+        "evaluations": counter.evaluations,
+        "evals_per_sec": counter.evaluations / wall_time if wall_time > 0 else None,
+        "peak_memory": peak_memory,
+        "target": target,
+        "time_to_target": logger.time_to_target,
+        "final_fitness": problem.evaluate(best),
+    }
+
+def run_benchmark(solvers: List[str], problems: List[str], sizes: List[int], seeds: List[int],
+                  target_ratio: float = 0.95, measure_memory: bool = True) -> Dict[str, Any]:
+    """Run the full matrix; unsupported solver/problem pairs are skipped."""
+    results = []
+    for solver_name in solvers:
+        for problem_name in problems:
+            if problem_name not in SOLVERS[solver_name][1]:
+                print(f"Skipping {solver_name} on {problem_name} (unsupported)")
+                continue
+            for size in sizes:
+                for seed in seeds:
+                    result = run_case(solver_name, problem_name, size, seed, target_ratio, measure_memory)
+                    results.append(result)
+                    print(format_result(result))
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "target_ratio": target_ratio,
+        },
+        "results": results,
+    }
+
+def format_result(result: Dict[str, Any]) -> str:
+    ttt = result["time_to_target"]
+    memory = result["peak_memory"]
+    return (f"{result['solver']:>4} {result['problem']:>8} n={result['size']:<6} seed={result['seed']:<3} "
+            f"time={result['wall_time']:.3f}s evals/s={result['evals_per_sec'] or 0:,.0f} "
+            f"peak={'-' if memory is None else f'{memory / 2**20:.2f}MiB'} "
+            f"ttt={'-' if ttt is None else f'{ttt:.3f}s'} fitness={result['final_fitness']}")
+
+def summarize(report: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Median of each compared metric over seeds, keyed by ``solver/problem/size``."""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for result in report["results"]:
+        groups.setdefault(f"{result['solver']}/{result['problem']}/{result['size']}", []).append(result)
+    summary = {}
+    for key, results in groups.items():
+        summary[key] = {}
+        for metric in COMPARED_METRICS:
+            values = [r[metric] for r in results if r[metric] is not None]
+            if values:
+                summary[key][metric] = statistics.median(values)
+    return summary
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.1) -> List[str]:
+    """
+    Compare per-configuration medians with a baseline report.
+
+    Returns a message for every metric that got worse by more than
+    `tolerance` (relative); configurations missing from either side are ignored.
+    """
+    current, previous = summarize(report), summarize(baseline)
+    regressions = []
+    for key in sorted(current.keys() & previous.keys()):
+        for metric, worse in COMPARED_METRICS.items():
+            if metric not in current[key] or metric not in previous[key] or not previous[key][metric]:
+                continue
+            change = (current[key][metric] - previous[key][metric]) / abs(previous[key][metric])
+            flag = "REGRESSION" if change * worse > tolerance else ""
+            print(f"{key:<24} {metric:<14} {previous[key][metric]:>14.4g} -> {current[key][metric]:>14.4g} "
+                  f"({change * 100:+.1f}%) {flag}")
+            if flag:
+                regressions.append(f"{key} {metric}: {change * 100:+.1f}%")
+    return regressions
+
+# Modules a --no-plots CLI run must never import
+STARTUP_FORBIDDEN = ("matplotlib",)
+# Short job used to audit the imports of a real --no-plots run
+STARTUP_JOB = ["--solver", "sa", "--size", "20", "--no-plots", "--log-every", "0"]
+
+def _best_runtime(command: List[str], repeats: int, cwd: Optional[str] = None) -> float:
+    # Fastest of the runs: scheduler and disk noise only ever add time
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def measure_startup(repeats: int = 10) -> Dict[str, Any]:
+    """
+    Cold-start cost of the CLI.
+
+    Times fresh interpreters running ``import main`` against a bare
+    interpreter (best of `repeats`) and runs a short ``--no-plots`` job
+    under ``-X importtime`` to list any `STARTUP_FORBIDDEN` modules it loads.
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    baseline = _best_runtime([sys.executable, "-c", "pass"], repeats)
+    import_time = _best_runtime([sys.executable, "-c", "import main"], repeats, cwd=root)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        job = subprocess.run([sys.executable, "-X", "importtime", os.path.join(root, "main.py")] + STARTUP_JOB,
+                             cwd=workdir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    imported = {line.rsplit("|", 1)[-1].strip() for line in job.stderr.splitlines() if line.startswith("import time:")}
+    forbidden = sorted(name for name in imported if name.split(".")[0] in STARTUP_FORBIDDEN)
+
+    return {
+        "interpreter": baseline,
+        "import_main": import_time,
+        "overhead": import_time - baseline,
+        "forbidden_imports": forbidden,
+    }
+
+def run_startup_check(budget: float, repeats: int = 10) -> bool:
+    """Print the startup measurements; True if within `budget` seconds and no forbidden module was loaded."""
+    startup = measure_startup(repeats)
+    print(f"Interpreter start: {startup['interpreter'] * 1000:.1f} ms, 'import main': {startup['import_main'] * 1000:.1f} ms "
+          f"(overhead {startup['overhead'] * 1000:.1f} ms, budget {budget * 1000:.0f} ms)")
+    ok = True
+    if startup["overhead"] > budget:
+        print("Startup budget exceeded")
+        ok = False
+    if startup["forbidden_imports"]:
+        print(f"A --no-plots run imported: {', '.join(startup['forbidden_imports'][:5])}"
+              f"{' ...' if len(startup['forbidden_imports']) > 5 else ''}")
+        ok = False
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="OptSim Benchmark")
+    parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), default=list(SOLVERS), help="Solvers to run")
+    parser.add_argument("--problems", nargs="+", choices=list(PROBLEMS), default=list(PROBLEMS), help="Problems to run")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[20, 100], help="Problem sizes")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0, 1, 2], help="Random seeds")
+    parser.add_argument("--target-ratio", type=float, default=0.95,
+                        help="Time-to-target threshold as a fraction of the known optimum")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run")
+    parser.add_argument("--output", help="JSON report path (default: logs/benchmark_<timestamp>.json)")
+    parser.add_argument("--compare", metavar="BASELINE", help="Baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative change flagged as a regression")
+    parser.add_argument("--startup", action="store_true",
+                        help="Only measure CLI cold start; exit 1 if it exceeds --startup-budget")
+    parser.add_argument("--startup-budget", type=float, default=0.2,
+                        help="Allowed 'import main' time over a bare interpreter, in seconds")
+    args = parser.parse_args()
+
+    if args.startup:
+        sys.exit(0 if run_startup_check(args.startup_budget) else 1)
+
+    report = run_benchmark(args.solvers, args.problems, args.sizes, args.seeds,
+                           target_ratio=args.target_ratio, measure_memory=not args.no_memory)
+
+    output = args.output
+    if output is None:
+        if not os.path.exists("logs"):
+            os.makedirs("logs")
+        output = f"logs/benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark report saved to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.compare}:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print(f"No regressions against {args.compare}")
+
+if __name__ == "__main__":
+    main()
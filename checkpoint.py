@@ -0,0 +1,107 @@
+"""Solver Checkpoints"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import os
+import pickle
+import random
+from typing import Any, Dict, Optional
+import numpy as np
+
+FORMAT_NAME = "optsim-checkpoint"
+FORMAT_VERSION = 1
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]):
+    """
+    Write `checkpoint` as a binary pickle, atomically.
+
+    The data goes to a temporary file that replaces `path` only once it is
+    complete and synced, so a run killed mid-write leaves the previous
+    checkpoint intact.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({"format": FORMAT_NAME, "version": FORMAT_VERSION, **checkpoint}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def load_checkpoint(path: str) -> Dict[str, Any]:
+    """Read a checkpoint written by `save_checkpoint`."""
+    with open(path, 'rb') as f:
+        checkpoint = pickle.load(f)
+    if not isinstance(checkpoint, dict) or checkpoint.get("format") != FORMAT_NAME:
+        raise ValueError(f"{path} is not an OptSim checkpoint")
+    if checkpoint["version"] > FORMAT_VERSION:
+        raise ValueError(f"{path} uses checkpoint format version {checkpoint['version']}, "
+                         f"newer than the supported version {FORMAT_VERSION}")
+    return checkpoint
+
+def rng_state() -> Dict[str, Any]:
+    """State of the global `random` and legacy NumPy generators used by the solvers."""
+    return {"random": random.getstate(), "numpy": np.random.get_state()}
+
+def restore_rng(state: Dict[str, Any]):
+    """Restore generator states captured by `rng_state`."""
+    random.setstate(state["random"])
+    np.random.set_state(state["numpy"])
+
+class Checkpointer:
+    """
+    Periodic checkpoints of a running solver.
+
+    Solvers that accept a checkpointer call `due(iteration)` after every
+    generation / step / episode and, when it returns True, `save(self,
+    iteration)`. A checkpoint holds the solver's `get_state()`, the random
+    generator states and the position of the solver's logger, plus the
+    `metadata` given here (e.g. the CLI options and problem instance needed
+    to rebuild the run). `restore` applies a loaded checkpoint to a freshly
+    built solver, whose next `solve()` / `train()` continues from there.
+
+    Args:
+        path: Checkpoint file (overwritten at every save)
+        every: Iterations between checkpoints
+        metadata: Extra picklable data stored with every checkpoint
+    """
+
+    def __init__(self, path: str, every: int = 100, metadata: Optional[Dict[str, Any]] = None):
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.path = path
+        self.every = every
+        self.metadata = metadata or {}
+        self.saved = 0
+
+    def due(self, iteration: int) -> bool:
+        """Whether a checkpoint should be written after `iteration`."""
+        return iteration % self.every == 0
+
+    def save(self, solver: Any, iteration: int):
+        """Write the current state of `solver` (and its logger, if any)."""
+        logger = getattr(solver, "logger", None)
+        save_checkpoint(self.path, {
+            "solver": type(solver).__name__,
+            "iteration": iteration,
+            "state": solver.get_state(),
+            "rng": rng_state(),
+            "logger": logger.get_state() if logger is not None else None,
+            "metadata": self.metadata,
+        })
+        self.saved += 1
+
+    @staticmethod
+    def restore(solver: Any, checkpoint: Dict[str, Any]):
+        """Load a checkpoint into `solver`, its logger and the random generators."""
+        if checkpoint["solver"] != type(solver).__name__:
+            raise ValueError(f"Checkpoint was written by {checkpoint['solver']}, not {type(solver).__name__}")
+        solver.set_state(checkpoint["state"])
+        logger = getattr(solver, "logger", None)
+        if logger is not None and checkpoint["logger"] is not None:
+            logger.set_state(checkpoint["logger"])
+        restore_rng(checkpoint["rng"])
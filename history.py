@@ -0,0 +1,196 @@
+"""Binary History Format"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import json
+import os
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List
+import numpy as np
+
+HEADER_FILE = "header.json"
+FORMAT_NAME = "optsim-history"
+FORMAT_VERSION = 1
+
+def _row_bytes(column: Dict[str, Any]) -> int:
+    return np.dtype(column["dtype"]).itemsize * int(np.prod(column["shape"], dtype=np.int64))
+
+class HistoryWriter:
+    """
+    Columnar binary writer for Logger history.
+
+    A history is a directory holding one raw little-endian file per column
+    plus a small JSON header describing dtypes and per-row shapes:
+
+    - ``generation`` (int64), ``best_fitness`` / ``avg_fitness`` (float64)
+    - ``entropy`` (float64) and ``gene_frequency`` (float32 rows), when logged
+    - ``best_solution``: bit-packed rows (``np.packbits``, uint8)
+
+    Rows are appended as they are logged, so a partially written history
+    (e.g. after a crash) can still be read; the row count is derived from
+    the file sizes. `resume` reopens an existing history at a given row
+    count to continue a checkpointed run.
+
+    Args:
+        path: History directory (created if missing)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.columns: Dict[str, Dict[str, Any]] = {}
+        self._files: Dict[str, Any] = {}
+        self.rows = 0
+        os.makedirs(path, exist_ok=True)
+
+    def _columns_for(self, entry: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        columns = {
+            "generation": {"dtype": "<i8", "shape": []},
+            "best_fitness": {"dtype": "<f8", "shape": []},
+            "avg_fitness": {"dtype": "<f8", "shape": []},
+        }
+        if entry.get("entropy") is not None:
+            columns["entropy"] = {"dtype": "<f8", "shape": []}
+        if entry.get("gene_frequency") is not None:
+            columns["gene_frequency"] = {"dtype": "<f4", "shape": [len(entry["gene_frequency"])]}
+        if entry.get("best_solution") is not None:
+            genes = len(entry["best_solution"])
+            columns["best_solution"] = {"dtype": "|u1", "shape": [(genes + 7) // 8], "packed_bits": genes}
+        return columns
+
+    def _open(self, entry: Dict[str, Any]):
+        self.columns = self._columns_for(entry)
+        for name in self.columns:
+            self.columns[name]["file"] = f"{name}.bin"
+            self._files[name] = open(os.path.join(self.path, self.columns[name]["file"]), 'wb')
+
+        header = {"format": FORMAT_NAME, "version": FORMAT_VERSION, "columns": self.columns}
+        with open(os.path.join(self.path, HEADER_FILE), 'w') as f:
+            json.dump(header, f, indent=2)
+
+    def append(self, entry: Dict[str, Any]):
+        """Append one Logger history entry."""
+        if not self._files:
+            self._open(entry)
+
+        for name, column in self.columns.items():
+            value = entry.get(name)
+            if name == "best_solution":
+                row = np.packbits(np.asarray(value, dtype=np.uint8))
+            else:
+                row = np.asarray(value, dtype=column["dtype"])
+            self._files[name].write(row.tobytes())
+        self.rows += 1
+
+    def flush(self):
+        """Flush buffered rows to disk."""
+        for f in self._files.values():
+            f.flush()
+
+    def resume(self, rows: int):
+        """
+        Reopen the history for appending after its first `rows` rows.
+
+        Rows written after that point (e.g. after the last checkpoint of a
+        killed run) are discarded.
+        """
+        self.close()
+        self.rows = rows
+        if rows == 0:
+            return
+        with open(os.path.join(self.path, HEADER_FILE)) as f:
+            self.columns = json.load(f)["columns"]
+        for name, column in self.columns.items():
+            f = open(os.path.join(self.path, column["file"]), 'r+b')
+            f.truncate(rows * _row_bytes(column))
+            f.seek(0, os.SEEK_END)
+            self._files[name] = f
+
+    def close(self):
+        """Flush and close all column files."""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class PackedRows(Sequence):
+    """Lazy sequence of bit-packed rows, unpacked to lists of ints on access."""
+
+    def __init__(self, packed: np.ndarray, bits: int):
+        self.packed = packed
+        self.bits = bits
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return np.unpackbits(self.packed[index])[:self.bits].tolist()
+
+class HistoryReader(Mapping):
+    """
+    Read-only view of a binary history, backed by memory-mapped column files.
+
+    Behaves like the column mapping returned by `Logger.get_stats()`, so it
+    can be passed directly to the `Visualizer` plotting methods; columns are
+    paged in from disk on access instead of being loaded up front.
+
+    Args:
+        path: History directory written by `HistoryWriter`
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, HEADER_FILE)) as f:
+            header = json.load(f)
+        if header.get("format") != FORMAT_NAME:
+            raise ValueError(f"{path} is not an OptSim history")
+        self.columns = header["columns"]
+        self._arrays: Dict[str, np.ndarray] = {}
+
+        # Row count from the file sizes, so partially written histories stay readable
+        self.rows = min(self._file_rows(name) for name in self.columns)
+
+    def _file_rows(self, name: str) -> int:
+        column = self.columns[name]
+        return os.path.getsize(os.path.join(self.path, column["file"])) // _row_bytes(column)
+
+    def _array(self, name: str) -> np.ndarray:
+        if name not in self._arrays:
+            column = self.columns[name]
+            if self.rows == 0:
+                self._arrays[name] = np.empty([0] + column["shape"], dtype=column["dtype"])
+            else:
+                self._arrays[name] = np.memmap(os.path.join(self.path, column["file"]), dtype=column["dtype"],
+                                               mode='r', shape=tuple([self.rows] + column["shape"]))
+        return self._arrays[name]
+
+    def __getitem__(self, name: str):
+        if name not in self.columns:
+            raise KeyError(name)
+        if name == "best_solution":
+            return PackedRows(self._array(name), self.columns[name]["packed_bits"])
+        return self._array(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+def save_history(history: List[Dict[str, Any]], path: str):
+    """Write in-memory Logger history entries to a binary history directory."""
+    with HistoryWriter(path) as writer:
+        for entry in history:
+            writer.append(entry)
+
+def load_history(path: str) -> HistoryReader:
+    """Open a binary history directory for reading."""
+    return HistoryReader(path)
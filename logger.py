@@ -1,41 +1,246 @@
 """Logging Utility"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
 import csv
-from typing import List, Dict, Any
+import time
+from array import array
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from history import HistoryWriter, save_history
 
 class Logger:
-    """Class for logging evolutionary statistics."""
+    """
+    Class for logging evolutionary statistics.
 
-    def __init__(self):
-        self.history: List[Dict[str, Any]] = []
+    By default every entry is printed and kept in memory until `save_to_csv`.
+    For long runs the logger can instead stream rows to disk as they arrive,
+    throttle console output and keep only the most recent entries in memory.
+    Generation, best and average fitness are always recorded compactly for
+    the whole run (see `get_stats`), so fitness plots stay complete.
 
-    def log(self, generation: int, best_fitness: float, avg_fitness: float, best_solution: Any = None, population: List[Any] = None):
-        """Log statistics for a generation."""
+    When a population is logged, only per-gene aggregates are stored by
+    default: `gene_frequency` (share of ones at each gene position) and
+    `entropy` (mean per-gene binary entropy, a diversity measure in [0, 1]).
+    Full population snapshots are kept only with `keep_population`.
+
+    Individuals are recorded as logged. With a `decode` function (e.g.
+    `problem.decode` for bit-packed genomes) they stay compact in memory
+    and are converted to gene sequences only when a row is printed, written
+    to CSV or the binary history, or returned by `get_history` for plotting.
+
+    Args:
+        stream_path: CSV file written incrementally while logging (None keeps everything in memory)
+        print_every: Print every N-th generation (0 disables count-based printing)
+        print_interval: Also print when this many seconds have passed since the last printed line
+        window: Keep only the last N entries in `history` (None keeps all)
+        buffer_size: I/O buffer size in bytes for the streamed CSV file
+        keep_population: Store full population snapshots in the history
+        binary_path: Directory for a columnar binary history written incrementally (see history.py)
+        decode: Converts a logged individual to its gene sequence on output (None: log as is)
+
+    `get_state` / `set_state` capture and restore the recorded history and
+    the position in the streamed CSV and binary files, so a checkpointed
+    run can resume logging where it stopped.
+    """
+
+    # Entry fields not written to CSV (nested per-individual / per-gene data)
+    CSV_EXCLUDE = ("population", "gene_frequency")
+
+    def __init__(self, stream_path: Optional[str] = None, print_every: int = 1,
+                 print_interval: Optional[float] = None, window: Optional[int] = None,
+                 buffer_size: int = 1 << 16, keep_population: bool = False,
+                 binary_path: Optional[str] = None, decode: Optional[Callable[[Any], Any]] = None):
+        self.history = deque(maxlen=window) if window else []
+        self.stream_path = stream_path
+        self.print_every = print_every
+        self.print_interval = print_interval
+        self.buffer_size = buffer_size
+        self.keep_population = keep_population
+        self.decode = decode
+        self._generations = array('q')
+        self._best_fitness = array('d')
+        self._avg_fitness = array('d')
+        self._last_print = time.perf_counter()
+        self._stream = None
+        self._writer = None
+        self.binary_path = binary_path
+        self._binary = HistoryWriter(binary_path) if binary_path else None
+
+    def log(self, generation: int, best_fitness: float, avg_fitness: float, best_solution: Any = None, population: List[Any] = None,
+            gene_frequency: Optional[np.ndarray] = None, **extra: Any):
+        """
+        Log statistics for a generation.
+
+        A precomputed `gene_frequency` vector can be passed instead of the
+        population. Additional keyword arguments (e.g. per-island statistics)
+        are stored as extra columns of the history entry.
+        """
         entry = {
             "generation": generation,
             "best_fitness": best_fitness,
             "avg_fitness": avg_fitness,
             "best_solution": best_solution,
-            "population": population
+            "population": None
         }
+        if population is not None:
+            if gene_frequency is None:
+                rows = population if self.decode is None else [self.decode(ind) for ind in population]
+                gene_frequency = np.asarray(rows, dtype=np.uint8).mean(axis=0)
+            if self.keep_population:
+                entry["population"] = population.copy() if isinstance(population, np.ndarray) else list(population)
+        if gene_frequency is not None:
+            entry["gene_frequency"] = np.asarray(gene_frequency, dtype=np.float32)
+            entry["entropy"] = self.gene_entropy(gene_frequency)
+        entry.update(extra)
         self.history.append(entry)
-        print(f"Gen {generation}: Best Fitness = {best_fitness}, Avg Fitness = {avg_fitness:.2f}, Best Sol = {best_solution}")
+        self._generations.append(generation)
+        self._best_fitness.append(best_fitness)
+        self._avg_fitness.append(avg_fitness)
+
+        if self.stream_path:
+            self._write_row(self._decoded(entry))
+        if self._binary is not None:
+            self._binary.append(self._decoded(entry))
+
+        if self._should_print(generation):
+            if self.decode is not None and best_solution is not None:
+                best_solution = self.decode(best_solution)
+            print(f"Gen {generation}: Best Fitness = {best_fitness}, Avg Fitness = {avg_fitness:.2f}, Best Sol = {best_solution}")
+
+    def _decoded(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """`entry` with its individuals as gene sequences (the entry itself without a `decode` function)."""
+        if self.decode is None:
+            return entry
+        decoded = dict(entry)
+        if entry.get("best_solution") is not None:
+            decoded["best_solution"] = self.decode(entry["best_solution"])
+        if entry.get("population") is not None:
+            decoded["population"] = [self.decode(ind) for ind in entry["population"]]
+        return decoded
+
+    @staticmethod
+    def gene_entropy(gene_frequency: np.ndarray) -> float:
+        """Mean binary entropy over gene positions (0 = converged, 1 = maximally diverse)."""
+        p = np.asarray(gene_frequency, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            entropy = -(p * np.log2(p) + (1 - p) * np.log2(1 - p))
+        return float(np.nan_to_num(entropy).mean())
+
+    def _should_print(self, generation: int) -> bool:
+        if self.print_every and generation % self.print_every == 0:
+            self._last_print = time.perf_counter()
+            return True
+        if self.print_interval is not None:
+            now = time.perf_counter()
+            if now - self._last_print >= self.print_interval:
+                self._last_print = now
+                return True
+        return False
+
+    def _write_row(self, entry: Dict[str, Any]):
+        if self._writer is None:
+            fieldnames = [key for key in entry if key not in self.CSV_EXCLUDE]
+            self._stream = open(self.stream_path, 'w', newline='', buffering=self.buffer_size)
+            self._writer = csv.DictWriter(self._stream, fieldnames=fieldnames, extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow(entry)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Recorded entries and output-file positions (flushes the streamed files)."""
+        stream_offset = None
+        if self._stream is not None:
+            self._stream.flush()
+            stream_offset = self._stream.tell()
+        if self._binary is not None:
+            self._binary.flush()
+        return {
+            "history": list(self.history),
+            "generations": self._generations,
+            "best_fitness": self._best_fitness,
+            "avg_fitness": self._avg_fitness,
+            "stream_offset": stream_offset,
+            "stream_fields": self._writer.fieldnames if self._writer is not None else None,
+            "binary_rows": self._binary.rows if self._binary is not None else 0,
+        }
+
+    def set_state(self, state: Dict[str, Any]):
+        """
+        Restore a state from `get_state`.
+
+        The streamed CSV and binary history are truncated to the recorded
+        positions and appended to from there.
+        """
+        self.history.clear()
+        self.history.extend(state["history"])
+        self._generations = array('q', state["generations"])
+        self._best_fitness = array('d', state["best_fitness"])
+        self._avg_fitness = array('d', state["avg_fitness"])
+
+        if self.stream_path:
+            self._close_stream()
+            if state["stream_offset"] is not None:
+                self._stream = open(self.stream_path, 'r+', newline='', buffering=self.buffer_size)
+                self._stream.truncate(state["stream_offset"])
+                self._stream.seek(state["stream_offset"])
+                self._writer = csv.DictWriter(self._stream, fieldnames=state["stream_fields"], extrasaction='ignore')
+        if self._binary is not None:
+            self._binary.resume(state["binary_rows"])
 
     def get_history(self) -> List[Dict[str, Any]]:
-        """Return the logged history."""
-        return self.history
+        """Return the logged history (the last `window` entries when windowed), individuals decoded."""
+        if self.decode is not None:
+            return [self._decoded(entry) for entry in self.history]
+        return list(self.history) if isinstance(self.history, deque) else self.history
+
+    def get_stats(self) -> Dict[str, array]:
+        """Return generation, best and average fitness of every logged entry as columns."""
+        return {
+            "generation": self._generations,
+            "best_fitness": self._best_fitness,
+            "avg_fitness": self._avg_fitness,
+        }
+
+    def _close_stream(self):
+        """Flush and close the streamed CSV file."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+            self._writer = None
+
+    def close(self):
+        """Flush and close the streamed CSV file and binary history."""
+        self._close_stream()
+        if self._binary is not None:
+            self._binary.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def save_binary(self, path: str):
+        """Save the in-memory history as a columnar binary history directory."""
+        if self._binary is not None and path == self._binary.path:
+            self._binary.close()
+            return
+        save_history(self.get_history(), path)
 
     def save_to_csv(self, filename: str):
         """Save history to a CSV file."""
+        if self.stream_path and filename == self.stream_path:
+            # Rows are already on disk
+            self.close()
+            return
         if not self.history:
             return
         
-        keys = self.history[0].keys()
+        keys = [key for key in self.history[0].keys() if key not in self.CSV_EXCLUDE]
         with open(filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=keys)
+            writer = csv.DictWriter(f, fieldnames=keys, extrasaction='ignore')
             writer.writeheader()
-            writer.writerows(self.history)
+            writer.writerows(self._decoded(entry) for entry in self.history)
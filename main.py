@@ -1,157 +1,683 @@
 """Main entry point for OptSim"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
 import os
+import time
 import argparse
 from datetime import datetime
-from problems import OneMaxProblem, KnapsackProblem
+# Startup path: the problem and solver packages load their modules on first
+# use (problem classes, solvers and rl_env are imported by the functions that
+# need them), and matplotlib (visualizer) is only imported by whatever renders
+# plots, so short runs with --no-plots never pay for it.
+from problems import ProblemWrapper
 from logger import Logger
-from visualizer import Visualizer
-from solvers import GASolver, RLSolver, SASolver
-from rl_env import OneMaxEnv
+from rendering import PlotRenderer
+from profiling import Profiler
+from checkpoint import Checkpointer, load_checkpoint
+import solvers
 import version
 
-def run_ga(problem_name="onemax", problem_size=100):
+def build_problem(problem_name="onemax", problem_size=100, cache_size=0, workers=1, backend="process",
+                  packed=False, base=None):
+    """
+    Create the problem instance.
+
+    With `packed` individuals are stored bit-packed in Python ints. A `base`
+    problem (e.g. restored from a checkpoint) is used instead of a new one.
+
+    With `workers` > 1 population evaluation runs on a thread/process pool;
+    with `cache_size` > 0 fitness values are cached in front of it, so only
+    cache misses are sent to the workers.
+    """
+    from problems import (OneMaxProblem, KnapsackProblem, PackedOneMaxProblem, PackedKnapsackProblem,
+                          CachedProblem)
+    if base is not None:
+        problem = base
+    elif problem_name == "knapsack":
+        problem = PackedKnapsackProblem(size=problem_size) if packed else KnapsackProblem(size=problem_size)
+    else:
+        problem = PackedOneMaxProblem(size=problem_size) if packed else OneMaxProblem(size=problem_size)
+
+    if workers > 1:
+        from problems import make_evaluator
+        problem = make_evaluator(problem, workers=workers, backend=backend)
+    if cache_size > 0:
+        problem = CachedProblem(problem, maxsize=cache_size)
+    return problem
+
+def report_cache(problem):
+    """Print fitness cache statistics if the problem is cached."""
+    from problems import CachedProblem
+    if isinstance(problem, CachedProblem):
+        info = problem.cache_info()
+        print(f"Fitness cache: {info['hits']} hits, {info['misses']} misses "
+              f"({info['hit_rate'] * 100:.1f}% hit rate, {info['size']}/{info['maxsize']} entries)")
+
+def exact_optimum(problem, max_cells=2 * 10 ** 7):
+    """Exact DP optimum of a Knapsack instance, or None if it is not a Knapsack or too large to solve."""
+    if not hasattr(problem, "capacity"):
+        return None
+    exact = solvers.ExactKnapsackSolver(problem, max_cells=max_cells)
+    if exact.cells() > max_cells:
+        return None
+    exact.solve()
+    return exact.optimum
+
+def report_gap(problem, best_solution):
+    """Print the optimality gap against the exact DP optimum for Knapsack instances small enough to solve."""
+    optimum = exact_optimum(problem)
+    if optimum is None:
+        return
+    from solvers.exact_solver import optimality_gap
+    gap = optimality_gap(problem.evaluate(best_solution), optimum)
+    print(f"Optimum (exact DP): {optimum}, gap: {gap * 100:.2f}%")
+
+def known_optimum(problem):
+    """Best achievable fitness if known: the genome length for OneMax, the exact DP optimum for small Knapsacks."""
+    if hasattr(problem, "capacity"):
+        return exact_optimum(problem)
+    return problem.size
+
+def build_termination(problem, stop_options=None):
+    """
+    Combine the requested stopping rules into one criterion.
+
+    `stop_options` keys: `target` (a fitness value or ``"auto"`` for the
+    known optimum), `stagnation` (iterations without improvement),
+    `time_limit` (seconds) and `max_evals`; unset keys are ignored.
+    """
+    options = stop_options or {}
+    criteria = []
+    target = options.get("target")
+    if target == "auto":
+        target = known_optimum(problem)
+        if target is None:
+            print("No known optimum for this instance; --target auto ignored.")
+        else:
+            print(f"Target fitness: {target} (known optimum)")
+    if target is not None:
+        criteria.append(solvers.TargetFitness(float(target)))
+    if options.get("stagnation"):
+        criteria.append(solvers.Stagnation(options["stagnation"]))
+    if options.get("time_limit"):
+        criteria.append(solvers.TimeLimit(options["time_limit"]))
+    if options.get("max_evals"):
+        criteria.append(solvers.MaxEvaluations(options["max_evals"]))
+    return solvers.AnyOf(criteria)
+
+def base_problem(problem):
+    """The problem instance underneath any cache/evaluator wrappers."""
+    while isinstance(problem, ProblemWrapper):
+        problem = problem.problem
+    return problem
+
+def run_timestamp(checkpoint_options=None):
+    """Timestamp naming the run's log files; a resumed run keeps the original one."""
+    resume = (checkpoint_options or {}).get("resume")
+    if resume is not None:
+        return resume["metadata"]["timestamp"]
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+def resumed_problem(checkpoint_options=None):
+    """Problem instance saved in the checkpoint being resumed, if any."""
+    resume = (checkpoint_options or {}).get("resume")
+    return resume["metadata"]["problem"] if resume is not None else None
+
+def build_checkpointer(problem, timestamp, checkpoint_options=None):
+    """
+    Create a `Checkpointer` when a checkpoint path was given.
+
+    `checkpoint_options` keys: `path`, `every`, `run` (the CLI options,
+    stored so `--resume` can rebuild the run) and `resume` (a loaded
+    checkpoint to continue from). The problem instance and log timestamp are
+    saved too, so a resumed run optimizes the same instance and appends to
+    the same logs.
+    """
+    options = checkpoint_options or {}
+    if not options.get("path"):
+        return None
+    metadata = {"run": options["run"], "problem": base_problem(problem), "timestamp": timestamp}
+    return Checkpointer(options["path"], every=options["every"], metadata=metadata)
+
+def restore_checkpoint(solver, checkpoint_options=None):
+    """Load the checkpoint being resumed into `solver` and its logger."""
+    resume = (checkpoint_options or {}).get("resume")
+    if resume is None:
+        return
+    Checkpointer.restore(solver, resume)
+    print(f"Resuming {resume['solver']} from iteration {resume['iteration']}")
+
+def build_profiler(profile, supported=True):
+    """Create a `Profiler` when profiling was requested and the chosen solver is instrumented."""
+    if not profile:
+        return None
+    if not supported:
+        print("Profiling is only available for the ga, sa and tabular rl solvers; ignoring --profile.")
+        return None
+    return Profiler(track_allocations=True)
+
+def save_profile(profiler, path):
+    """Print the profiler summary and write it as JSON to `path`."""
+    if profiler is None:
+        return
+    print(profiler.report())
+    profiler.save(path)
+    print(f"Profile saved to {path}")
+
+def build_logger(log_filename, log_options=None, problem=None):
+    """
+    Create the run logger.
+
+    For bit-packed problems the logger keeps individuals packed and decodes
+    them (`problem.decode`) only when rows are printed, written or plotted.
+
+    `log_options` holds `Logger` keyword arguments (`print_every`,
+    `print_interval`, `window`, `keep_population`) plus `stream`: when set, rows are written to
+    `log_filename` while the solver runs, and `binary`: when set, a columnar
+    binary history is also written next to it (`.hist` directory).
+    """
+    options = dict(log_options or {})
+    stream = options.pop("stream", False)
+    binary = options.pop("binary", False)
+    binary_path = os.path.splitext(log_filename)[0] + ".hist" if binary else None
+    decode = problem.decode if problem is not None and problem.packed else None
+    return Logger(stream_path=log_filename if stream else None, binary_path=binary_path, decode=decode, **options)
+
+def build_renderer(render, log_filename):
+    """Plot renderer for a run: inline, none, or a background worker writing its output to `<log>_render.log`."""
+    if render == "none":
+        return PlotRenderer(enabled=False)
+    if render == "background":
+        return PlotRenderer(background=True, log_path=os.path.splitext(log_filename)[0] + "_render.log")
+    return PlotRenderer()
+
+def finish_rendering(renderer):
+    """Hand the queued plots to the background worker, if any."""
+    process = renderer.finish()
+    if process is not None:
+        print(f"Rendering plots in the background (pid {process.pid}, output in {renderer.log_path})")
+
+def replot(history_path, max_points=5000):
+    """Re-create the fitness plot and heatmap of a past run from its binary history."""
+    from history import load_history
+    from visualizer import Visualizer
+    history = load_history(history_path)
+    visualizer = Visualizer()
+    base = os.path.splitext(history_path.rstrip("/"))[0]
+    
+    print(f"Replotting {history.rows} logged generations from {history_path}")
+    visualizer.plot_fitness(history, f"{base}_fitness.png", max_points=max_points)
+    if "gene_frequency" in history:
+        visualizer.plot_population_heatmap(history, f"{base}_heatmap.png", max_points=max_points)
+
+def run_ga(problem_name="onemax", problem_size=100, vectorized=False, cache_size=0,
+           workers=1, backend="process", packed=False, log_options=None, profile=False, stop_options=None,
+           checkpoint_options=None, render="background", selection="tournament"):
     print(f"Genetic Algorithm Optimizer v{version.__version__}")
     
     # 1. Define the problem
-    if problem_name == "knapsack":
-        problem = KnapsackProblem(size=problem_size)
-    else:
-        problem = OneMaxProblem(size=problem_size)
+    problem = build_problem(problem_name, problem_size, cache_size, workers, backend, packed,
+                            base=resumed_problem(checkpoint_options))
         
     # 2. Setup logging
-    logger = Logger()
+    if not os.path.exists("logs"):
+        os.makedirs("logs")
     
-    # 3. Initialize Visualizer
-    visualizer = Visualizer()
+    timestamp = run_timestamp(checkpoint_options)
+    log_filename = f"logs/ga_{problem_name}_log_{timestamp}.csv"
+    logger = build_logger(log_filename, log_options, problem)
+    
+    # 3. Initialize plot rendering
+    renderer = build_renderer(render, log_filename)
     
     # 4. Setup Solver
-    solver = GASolver(
-        problem=problem, 
-        logger=logger, 
-        pop_size=50, 
-        mutation_rate=0.01, 
-        generations=50
-    )
+    profiler = build_profiler(profile, supported=not vectorized)
+    termination = build_termination(problem, stop_options)
+    if vectorized:
+        solver = solvers.VectorizedGASolver(
+            problem=problem, 
+            logger=logger, 
+            pop_size=50, 
+            mutation_rate=0.01, 
+            generations=50,
+            termination=termination,
+            selection=selection
+        )
+    else:
+        solver = solvers.GASolver(
+            problem=problem, 
+            logger=logger, 
+            pop_size=50, 
+            mutation_rate=0.01, 
+            generations=50,
+            profiler=profiler,
+            termination=termination,
+            checkpointer=build_checkpointer(problem, timestamp, checkpoint_options),
+            selection=selection
+        )
+        restore_checkpoint(solver, checkpoint_options)
     
     # 5. Run optimization
     print(f"Starting optimization for {problem_name}...")
-    best_solution = solver.solve()
+    try:
+        best_solution = solver.solve()
+    finally:
+        if workers > 1:
+            problem.close()  # Shut down the evaluation worker pool
     print("Optimization complete.")
     
     
     # 6. Show results
     print(f"Best solution fitness: {problem.evaluate(best_solution)}")
+    report_gap(problem, best_solution)
+    report_cache(problem)
+    save_profile(profiler, log_filename.replace(".csv", "_profile.json"))
     
     # 7. Save Logs and Visualizations
-    if not os.path.exists("logs"):
-        os.makedirs("logs")
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
     # Save plots to logs directory with timestamp
-    visualizer.plot_fitness(logger.get_history(), f"logs/ga_{problem_name}_{problem_size}_fitness_{timestamp}.png")
-    visualizer.plot_population_heatmap(logger.get_history(), f"logs/ga_{problem_name}_{problem_size}_heatmap_{timestamp}.png")
+    renderer.submit("plot_fitness", logger.get_stats(), f"logs/ga_{problem_name}_{problem_size}_fitness_{timestamp}.png")
+    renderer.submit("plot_population_heatmap", logger.get_history(), f"logs/ga_{problem_name}_{problem_size}_heatmap_{timestamp}.png")
     
     # Generate animation for OneMax to show best individual evolution
     if problem_name == "onemax":
-        visualizer.animate_best_individual(logger.get_history(), f"logs/ga_{problem_name}_{problem_size}_animation_{timestamp}.gif", fps=2)
+        renderer.submit("animate_best_individual", logger.get_history(), f"logs/ga_{problem_name}_{problem_size}_animation_{timestamp}.gif", fps=2)
     
     if problem_name == "knapsack":
-        visualizer.plot_knapsack_solution(problem, best_solution, f"logs/ga_{problem_name}_{problem_size}_solution_{timestamp}.png")
+        renderer.submit("plot_knapsack_solution", base_problem(problem), problem.decode(best_solution), f"logs/ga_{problem_name}_{problem_size}_solution_{timestamp}.png")
 
     # Save CSV log
-    log_filename = f"logs/ga_{problem_name}_log_{timestamp}.csv"
     logger.save_to_csv(log_filename)
+    logger.close()
     print(f"Logs saved to {log_filename}")
+    if logger.binary_path:
+        print(f"Binary history saved to {logger.binary_path}")
+    finish_rendering(renderer)
 
-def run_rl(problem_size=8):
+def run_rl(problem_size=8, cache_size=0, packed=False, q_table="auto", envs=1, method="tabular", profile=False,
+           stop_options=None, checkpoint_options=None):
     # RL example currently hardcoded for OneMax for simplicity of state representation
     # Could be extended for Knapsack if state representation is adapted (e.g. current weight + item index)
     print(f"RL Optimizer v{version.__version__}")
-    
-    if problem_size > 12:
-        print("Warning: RL Q-Learning scales poorly with problem size. Capping at 12.")
-        problem_size = 12
+    from rl_env import OneMaxEnv, OneMaxVecEnv
         
-    problem = OneMaxProblem(size=problem_size)
-    env = OneMaxEnv(problem)
+    problem = build_problem("onemax", problem_size, cache_size, packed=packed,
+                            base=resumed_problem(checkpoint_options))
+    actions = list(range(problem_size))
+    
+    profiler = build_profiler(profile, supported=method == "tabular" and envs <= 1)
+    termination = build_termination(problem, stop_options)
     
-    actions = list(range(problem_size)) 
+    if method == "linear":
+        # Constant-size linear Q-function trained on a batch of environments
+        vec_env = OneMaxVecEnv(problem, n_envs=envs, max_steps=problem_size * 2)
+        solver = solvers.LinearQSolver(vec_env, actions=actions, alpha=0.01, gamma=0.9, epsilon=0.2,
+                               termination=termination)
+        solver.train(episodes=500)
+        final_state, path = solver.solve(max_steps=problem_size * 2)
+        print(f"Linear Q weights: {solver.weights.round(3).tolist()}")
+        print(f"Final Solution: {final_state}")
+        print(f"Fitness: {sum(final_state)}/{problem_size}")
+        print(f"Steps taken: {len(path) - 1}")
+        report_cache(problem)
+        return
     
-    solver = RLSolver(env, actions=actions, alpha=0.5, gamma=0.9, epsilon=0.2)
+    # Integer state indices address the Q-table rows directly
+    env = OneMaxEnv(problem, index_states=True)
     
-    solver.train(episodes=500, max_steps=problem_size * 2)
+    timestamp = run_timestamp(checkpoint_options)
+    solver = solvers.RLSolver(env, actions=actions, alpha=0.5, gamma=0.9, epsilon=0.2, backend=q_table,
+                      profiler=profiler, termination=termination,
+                      checkpointer=build_checkpointer(problem, timestamp, checkpoint_options))
+    restore_checkpoint(solver, checkpoint_options)
+    
+    if envs > 1:
+        vec_env = OneMaxVecEnv(problem, n_envs=envs, max_steps=problem_size * 2, index_states=True)
+        solver.train_vectorized(vec_env, episodes=500)
+    else:
+        solver.train(episodes=500, max_steps=problem_size * 2)
     final_state, path = solver.solve(max_steps=problem_size * 2)
+    print(f"Q-table: {type(solver.q_table).__name__}, {solver.q_table.nbytes / 2**20:.1f} MiB")
     
-    print(f"Final Solution: {final_state}")
-    print(f"Fitness: {problem.evaluate(list(final_state))}/{problem_size}")
+    print(f"Final Solution: {problem.decode(env.state)}")
+    print(f"Fitness: {env.current_fitness}/{problem_size}")
     print(f"Steps taken: {len(path) - 1}")
+    report_cache(problem)
+    if profiler is not None:
+        if not os.path.exists("logs"):
+            os.makedirs("logs")
+        save_profile(profiler, f"logs/rl_onemax_profile_{timestamp}.json")
 
-def run_sa(problem_name="onemax", problem_size=100):
+def run_sa(problem_name="onemax", problem_size=100, cache_size=0, packed=False, chains=0, log_options=None,
+           profile=False, stop_options=None, checkpoint_options=None, render="background"):
     print(f"Simulated Annealing Optimizer v{version.__version__}")
     
-    if problem_name == "knapsack":
-        problem = KnapsackProblem(size=problem_size)
-    else:
-        problem = OneMaxProblem(size=problem_size)
+    problem = build_problem(problem_name, problem_size, cache_size, packed=packed,
+                            base=resumed_problem(checkpoint_options))
         
-    logger = Logger()
-    visualizer = Visualizer()
+    if not os.path.exists("logs"):
+        os.makedirs("logs")
+    
+    timestamp = run_timestamp(checkpoint_options)
+    log_filename = f"logs/sa_{problem_name}_log_{timestamp}.csv"
+    logger = build_logger(log_filename, log_options, problem)
+    renderer = build_renderer(render, log_filename)
+    profiler = build_profiler(profile, supported=chains == 0)
+    termination = build_termination(problem, stop_options)
+    
+    if chains > 0:
+        solver = solvers.VectorizedSASolver(
+            problem=problem,
+            logger=logger,
+            n_chains=chains,
+            initial_temp=100.0,
+            cooling_rate=0.95,
+            min_temp=0.01,
+            max_steps=500,
+            termination=termination
+        )
+    else:
+        solver = solvers.SASolver(
+            problem=problem,
+            logger=logger,
+            initial_temp=100.0,
+            cooling_rate=0.95,
+            min_temp=0.01,
+            max_steps=500,
+            profiler=profiler,
+            termination=termination,
+            checkpointer=build_checkpointer(problem, timestamp, checkpoint_options)
+        )
+        restore_checkpoint(solver, checkpoint_options)
+    
+    print(f"Starting optimization for {problem_name}...")
+    best_solution = solver.solve()
+    print("Optimization complete.")
+    
+    
+    print(f"Best solution fitness: {problem.evaluate(best_solution)}")
+    report_gap(problem, best_solution)
+    if chains > 0:
+        chain_best = solver.chain_best_fitness
+        print(f"Chain best fitness over {chains} chains: min {chain_best.min()}, "
+              f"mean {chain_best.mean():.2f}, max {chain_best.max()}")
+    report_cache(problem)
+    save_profile(profiler, log_filename.replace(".csv", "_profile.json"))
+    
+    # Save plot to logs directory with timestamp
+    renderer.submit("plot_fitness", logger.get_stats(), f"logs/sa_{problem_name}_{problem_size}_fitness_{timestamp}.png")
+    
+    # Save CSV log
+    logger.save_to_csv(log_filename)
+    logger.close()
+    print(f"Logs saved to {log_filename}")
+    if logger.binary_path:
+        print(f"Binary history saved to {logger.binary_path}")
+    finish_rendering(renderer)
+
+def run_exact(problem_size=100, packed=False, render="background"):
+    print(f"Exact Knapsack Solver v{version.__version__}")
+    
+    problem = build_problem("knapsack", problem_size, packed=packed)
+    solver = solvers.ExactKnapsackSolver(problem)
+    
+    start = time.perf_counter()
+    best_solution = solver.solve()
+    elapsed = time.perf_counter() - start
+    
+    print(f"Optimum: {solver.optimum} (capacity {problem.capacity}, {solver.cells()} DP cells, {elapsed:.3f}s)")
+    print(f"Best solution fitness: {problem.evaluate(best_solution)}")
+    
+    if not os.path.exists("logs"):
+        os.makedirs("logs")
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    renderer = build_renderer(render, f"logs/exact_knapsack_{problem_size}_{timestamp}")
+    renderer.submit("plot_knapsack_solution", base_problem(problem), problem.decode(best_solution),
+                    f"logs/exact_knapsack_{problem_size}_solution_{timestamp}.png")
+    finish_rendering(renderer)
+
+def run_island(problem_name="onemax", problem_size=100, islands=4, migration_interval=5,
+               topology="ring", cache_size=0, packed=False, log_options=None, stop_options=None, render="background"):
+    print(f"Island-Model Genetic Algorithm Optimizer v{version.__version__}")
     
-    solver = SASolver(
+    problem = build_problem(problem_name, problem_size, cache_size, packed=packed)
+    if not os.path.exists("logs"):
+        os.makedirs("logs")
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_filename = f"logs/island_{problem_name}_log_{timestamp}.csv"
+    logger = build_logger(log_filename, log_options, problem)
+    renderer = build_renderer(render, log_filename)
+    
+    solver = solvers.IslandSolver(
         problem=problem,
         logger=logger,
-        initial_temp=100.0,
-        cooling_rate=0.95,
-        min_temp=0.01,
-        max_steps=500
+        n_islands=islands,
+        pop_size=50,
+        mutation_rate=0.01,
+        generations=50,
+        migration_interval=migration_interval,
+        migrants=2,
+        topology=topology,
+        termination=build_termination(problem, stop_options)
     )
     
-    print(f"Starting optimization for {problem_name}...")
+    print(f"Starting optimization for {problem_name} on {islands} islands ({topology} topology)...")
     best_solution = solver.solve()
     print("Optimization complete.")
     
-    
     print(f"Best solution fitness: {problem.evaluate(best_solution)}")
+    report_gap(problem, best_solution)
+    
+    renderer.submit("plot_fitness", logger.get_stats(), f"logs/island_{problem_name}_{problem_size}_fitness_{timestamp}.png")
+    renderer.submit("plot_population_heatmap", logger.get_history(), f"logs/island_{problem_name}_{problem_size}_heatmap_{timestamp}.png")
+    
+    if problem_name == "onemax":
+        renderer.submit("animate_best_individual", logger.get_history(), f"logs/island_{problem_name}_{problem_size}_animation_{timestamp}.gif", fps=2)
+    
+    if problem_name == "knapsack":
+        renderer.submit("plot_knapsack_solution", base_problem(problem), problem.decode(best_solution), f"logs/island_{problem_name}_{problem_size}_solution_{timestamp}.png")
+    
+    logger.save_to_csv(log_filename)
+    logger.close()
+    print(f"Logs saved to {log_filename}")
+    if logger.binary_path:
+        print(f"Binary history saved to {logger.binary_path}")
+    finish_rendering(renderer)
+
+def run_pt(problem_name="onemax", problem_size=100, replicas=4, cache_size=0, packed=False, log_options=None,
+           stop_options=None, render="background"):
+    print(f"Parallel Tempering Optimizer v{version.__version__}")
+    
+    problem = build_problem(problem_name, problem_size, cache_size, packed=packed)
     
     if not os.path.exists("logs"):
         os.makedirs("logs")
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_filename = f"logs/pt_{problem_name}_log_{timestamp}.csv"
+    logger = build_logger(log_filename, log_options, problem)
+    renderer = build_renderer(render, log_filename)
     
-    # Save plot to logs directory with timestamp
-    visualizer.plot_fitness(logger.get_history(), f"logs/sa_{problem_name}_{problem_size}_fitness_{timestamp}.png")
+    solver = solvers.ParallelTemperingSolver(
+        problem=problem,
+        logger=logger,
+        n_replicas=replicas,
+        min_temp=0.5,
+        max_temp=50.0,
+        sweep_steps=100,
+        rounds=50,
+        termination=build_termination(problem, stop_options)
+    )
+    
+    print(f"Starting optimization for {problem_name}...")
+    best_solution = solver.solve()
+    print("Optimization complete.")
+    
+    print(f"Best solution fitness: {problem.evaluate(best_solution)}")
+    report_gap(problem, best_solution)
+    for temp, rate in zip(solver.temperatures, solver.acceptance_rates):
+        print(f"  T={temp:8.3f}: acceptance rate {rate * 100:.1f}%")
+    print(f"Swap acceptance rates: {[round(rate, 2) for rate in solver.swap_rates]}")
+    
+    renderer.submit("plot_fitness", logger.get_stats(), f"logs/pt_{problem_name}_{problem_size}_fitness_{timestamp}.png")
+    
+    if problem_name == "knapsack":
+        renderer.submit("plot_knapsack_solution", base_problem(problem), problem.decode(best_solution), f"logs/pt_{problem_name}_{problem_size}_solution_{timestamp}.png")
     
-    # Save CSV log
-    log_filename = f"logs/sa_{problem_name}_log_{timestamp}.csv"
     logger.save_to_csv(log_filename)
+    logger.close()
     print(f"Logs saved to {log_filename}")
+    if logger.binary_path:
+        print(f"Binary history saved to {logger.binary_path}")
+    finish_rendering(renderer)
+
+def parse_target(value):
+    """argparse type for --target: a number or 'auto'."""
+    return value if value == "auto" else float(value)
 
 def main():
+    from solvers.selection import SELECTIONS
     parser = argparse.ArgumentParser(description="OptSim Optimizer")
-    parser.add_argument("--solver", choices=["ga", "rl", "sa"], default="ga", help="Solver to use")
+    parser.add_argument("--solver", choices=["ga", "ga-vec", "island", "rl", "sa", "sa-vec", "pt", "exact"], default="ga", help="Solver to use")
     parser.add_argument("--problem", choices=["onemax", "knapsack"], default="onemax", help="Problem to solve")
     parser.add_argument("--size", type=int, default=0, help="Problem size")
+    parser.add_argument("--packed", action="store_true", help="Store genomes bit-packed in Python ints (not for ga-vec)")
+    parser.add_argument("--cache-size", type=int, default=0, help="Fitness cache entries (0 disables caching)")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel workers for population evaluation (GA)")
+    parser.add_argument("--backend", choices=["thread", "process"], default="process",
+                        help="Worker pool type used when --workers > 1")
+    parser.add_argument("--log-every", type=int, default=1, help="Print every N-th generation/step (0 = never)")
+    parser.add_argument("--log-interval", type=float, default=None, help="Also print at most every T seconds")
+    parser.add_argument("--stream-log", action="store_true", help="Write the CSV log incrementally during the run")
+    parser.add_argument("--history-window", type=int, default=None,
+                        help="Keep only the last N log entries in memory (fitness plots stay complete)")
+    parser.add_argument("--binary-log", action="store_true",
+                        help="Also write a compact binary history (.hist directory) that can be re-plotted with --replot")
+    parser.add_argument("--render", choices=["background", "inline"], default="background",
+                        help="Write plots and animations in a detached worker process, or before exiting")
+    parser.add_argument("--no-plots", action="store_true",
+                        help="Skip plots and animations (matplotlib is never imported)")
+    parser.add_argument("--sweep", metavar="CONFIG", default=None,
+                        help="Run the JSON hyperparameter/size/seed grid in CONFIG and print one summary table")
+    parser.add_argument("--sweep-workers", type=int, default=os.cpu_count() or 1,
+                        help="Concurrent worker processes for --sweep")
+    parser.add_argument("--replot", metavar="HISTORY", default=None,
+                        help="Re-plot a saved binary history instead of running a solver")
+    parser.add_argument("--target", type=parse_target, default=None,
+                        help="Stop once this fitness is reached ('auto': the known optimum)")
+    parser.add_argument("--stagnation", type=int, default=None,
+                        help="Stop after N generations/steps without improvement")
+    parser.add_argument("--time-limit", type=float, default=None, help="Stop after this many seconds")
+    parser.add_argument("--max-evals", type=int, default=None, help="Stop after this many fitness evaluations")
+    parser.add_argument("--checkpoint", metavar="PATH", default=None,
+                        help="Periodically save the full solver state to PATH (ga, sa, tabular rl)")
+    parser.add_argument("--checkpoint-every", type=int, default=100,
+                        help="Generations/steps/episodes between checkpoints")
+    parser.add_argument("--resume", metavar="PATH", default=None,
+                        help="Continue the run saved in a checkpoint (its original options are reused)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time solver phases and write a profile summary next to the log (ga, sa, rl)")
+    parser.add_argument("--keep-population", action="store_true",
+                        help="Keep full population snapshots in the log history (default: per-gene statistics only)")
+    parser.add_argument("--selection", choices=list(SELECTIONS), default="tournament",
+                        help="Parent selection of the ga and ga-vec solvers")
+    parser.add_argument("--q-table", choices=["auto", "dense", "sparse"], default="auto",
+                        help="Q-table backend (rl solver): dense array, hashed rows, or dense when it fits")
+    parser.add_argument("--rl-method", choices=["tabular", "linear"], default="tabular",
+                        help="Q-function of the rl solver: Q-table or linear function approximation")
+    parser.add_argument("--envs", type=int, default=1,
+                        help="Number of environments stepped together during training (rl solver)")
+    parser.add_argument("--chains", type=int, default=32, help="Number of parallel annealing chains (sa-vec solver)")
+    parser.add_argument("--replicas", type=int, default=4, help="Number of temperature replicas (pt solver)")
+    parser.add_argument("--islands", type=int, default=4, help="Number of islands (island solver)")
+    parser.add_argument("--migration-interval", type=int, default=5, help="Generations between migrations (island solver)")
+    parser.add_argument("--topology", choices=["ring", "full"], default="ring", help="Migration topology (island solver)")
     
     args = parser.parse_args()
+    resume = None
+    if args.resume:
+        resume = load_checkpoint(args.resume)
+        resume_path = args.resume
+        args = argparse.Namespace(**resume["metadata"]["run"])
+        args.resume = resume_path
+    if (args.checkpoint or resume) and not (
+            args.solver in ("ga", "sa") or (args.solver == "rl" and args.rl_method == "tabular" and args.envs <= 1)):
+        parser.error("Checkpoints are supported by the ga, sa and tabular rl (--envs 1) solvers")
+    if args.packed and args.solver in ("ga-vec", "sa-vec"):
+        parser.error(f"--packed is not supported by {args.solver}, which already stores a uint8 matrix")
+    log_options = {
+        "stream": args.stream_log,
+        "print_every": args.log_every,
+        "print_interval": args.log_interval,
+        "window": args.history_window,
+        "keep_population": args.keep_population,
+        "binary": args.binary_log,
+    }
+    stop_options = {
+        "target": args.target,
+        "stagnation": args.stagnation,
+        "time_limit": args.time_limit,
+        "max_evals": args.max_evals,
+    }
+    checkpoint_options = {
+        "path": args.checkpoint,
+        "every": args.checkpoint_every,
+        "run": {**vars(args), "resume": None},
+        "resume": resume,
+    }
     
-    if args.solver == "ga":
+    if args.replot:
+        replot(args.replot)
+        return
+    if args.sweep:
+        import sweep
+        config = sweep.load_config(args.sweep)
+        try:
+            sweep.expand_grid(config)
+        except (KeyError, ValueError) as e:
+            parser.error(f"Invalid sweep configuration: {e}")
+        sweep.sweep(config, workers=args.sweep_workers)
+        return
+    render = "none" if args.no_plots else args.render
+    
+    if args.solver in ("ga", "ga-vec"):
+        size = args.size if args.size > 0 else 100
+        run_ga(args.problem, size, vectorized=args.solver == "ga-vec", cache_size=args.cache_size,
+               workers=args.workers, backend=args.backend, packed=args.packed,
+               log_options=log_options, profile=args.profile, stop_options=stop_options,
+               checkpoint_options=checkpoint_options, render=render, selection=args.selection)
+    elif args.solver == "island":
         size = args.size if args.size > 0 else 100
-        run_ga(args.problem, size)
+        run_island(args.problem, size, islands=args.islands, migration_interval=args.migration_interval,
+                   topology=args.topology, cache_size=args.cache_size, packed=args.packed,
+                   log_options=log_options, stop_options=stop_options, render=render)
     elif args.solver == "rl":
         if args.problem != "onemax":
             print("RL currently only supports OneMax.")
             return
         size = args.size if args.size > 0 else 8
-        run_rl(size)
-    elif args.solver == "sa":
+        run_rl(size, cache_size=args.cache_size, packed=args.packed, q_table=args.q_table,
+               envs=args.envs, method=args.rl_method, profile=args.profile, stop_options=stop_options,
+               checkpoint_options=checkpoint_options)
+    elif args.solver in ("sa", "sa-vec"):
+        size = args.size if args.size > 0 else 100
+        run_sa(args.problem, size, cache_size=args.cache_size, packed=args.packed,
+               chains=args.chains if args.solver == "sa-vec" else 0, log_options=log_options,
+               profile=args.profile, stop_options=stop_options, checkpoint_options=checkpoint_options,
+               render=render)
+    elif args.solver == "exact":
+        if args.problem != "knapsack":
+            print("The exact solver only supports Knapsack.")
+            return
+        size = args.size if args.size > 0 else 100
+        run_exact(size, packed=args.packed, render=render)
+    elif args.solver == "pt":
         size = args.size if args.size > 0 else 100
-        run_sa(args.problem, size)
+        run_pt(args.problem, size, replicas=args.replicas, cache_size=args.cache_size, packed=args.packed,
+               log_options=log_options, stop_options=stop_options, render=render)
 
 if __name__ == "__main__":
     main()
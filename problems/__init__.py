@@ -1,11 +1,37 @@
 """Problems Package"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
-from .base import Problem
-from .onemax import OneMaxProblem
-from .knapsack import KnapsackProblem
+import importlib
 
-__all__ = ['Problem', 'OneMaxProblem', 'KnapsackProblem']
+from .base import Problem, ProblemWrapper
+
+# Public name -> (module, attribute), imported on first access (PEP 562); the
+# evaluators in particular pull in concurrent.futures and multiprocessing.
+_EXPORTS = {
+    'OneMaxProblem': ('.onemax', 'OneMaxProblem'),
+    'KnapsackProblem': ('.knapsack', 'KnapsackProblem'),
+    'PackedOneMaxProblem': ('.packed', 'PackedOneMaxProblem'),
+    'PackedKnapsackProblem': ('.packed', 'PackedKnapsackProblem'),
+    'CachedProblem': ('.cache', 'CachedProblem'),
+    'CountingProblem': ('.counting', 'CountingProblem'),
+    'SerialEvaluator': ('.evaluator', 'SerialEvaluator'),
+    'ThreadPoolEvaluator': ('.evaluator', 'ThreadPoolEvaluator'),
+    'ProcessPoolEvaluator': ('.evaluator', 'ProcessPoolEvaluator'),
+    'make_evaluator': ('.evaluator', 'make_evaluator'),
+}
+
+__all__ = ['Problem', 'ProblemWrapper'] + list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(module, __name__), attribute)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,20 @@
 """Optimization Problem Definitions - Base Class"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
+import copy
 from abc import ABC, abstractmethod
-from typing import Any, Tuple
+from typing import Any, Sequence, Tuple
+import numpy as np
 
 class Problem(ABC):
     """Abstract base class for optimization problems."""
 
+    # True when individuals use a bit-packed representation (see problems/packed.py)
+    packed: bool = False
+
     @abstractmethod
     def create_individual(self) -> Any:
         """Create a random individual."""
@@ -20,6 +25,66 @@ class Problem(ABC):
         """Evaluate the fitness of an individual."""
         pass
 
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        """
+        Evaluate the fitness of every individual in a population.
+
+        The default loops over `evaluate`; problems with a natural array form
+        override it with a vectorized version.
+
+        Args:
+            population: Sequence of individuals, or a 2D array with one individual per row
+
+        Returns:
+            1D array of fitness values in population order
+        """
+        return np.array([self.evaluate(ind) for ind in population])
+
+    def decode(self, individual: Any) -> Any:
+        """Return the individual as a sequence of genes (for logging and plotting)."""
+        return individual
+
+    def gene_frequency(self, population: Sequence[Any]) -> np.ndarray:
+        """Share of ones at each gene position over `population` (for logging)."""
+        return np.asarray([self.decode(ind) for ind in population], dtype=np.uint8).mean(axis=0)
+
+    def gene(self, individual: Any, index: int) -> int:
+        """Return the value of gene `index`."""
+        return individual[index]
+
+    def flip(self, individual: Any, index: int, in_place: bool = False) -> Any:
+        """
+        Flip binary gene `index`.
+
+        Args:
+            individual: Individual to modify
+            index: Gene position
+            in_place: Modify `individual` itself instead of a copy (when the representation allows it)
+
+        Returns:
+            The flipped individual
+        """
+        new_ind = individual if in_place else list(individual)
+        new_ind[index] = 1 - new_ind[index]
+        return new_ind
+
+    def evaluate_flip(self, individual: Any, index: int, current_fitness: float) -> float:
+        """
+        Fitness of `individual` after flipping gene `index`, without modifying it.
+
+        The default re-evaluates the whole neighbor; problems whose fitness can
+        be updated from `current_fitness` alone override it with an O(1) version.
+        """
+        return self.evaluate(self.flip(individual, index))
+
+    def tracker(self, individual: Any) -> "FlipTracker":
+        """Return a `FlipTracker` for single-gene moves starting from `individual`."""
+        return FlipTracker(self, individual)
+
+    def batch_tracker(self, population: np.ndarray) -> "BatchFlipTracker":
+        """Return a `BatchFlipTracker` for one-flip-per-row moves on a `uint8` population matrix."""
+        return BatchFlipTracker(self, population)
+
     @abstractmethod
     def mutate(self, individual: Any, rate: float) -> Any:
         """Mutate an individual."""
@@ -29,3 +94,133 @@ class Problem(ABC):
     def crossover(self, parent1: Any, parent2: Any) -> Tuple[Any, Any]:
         """Perform crossover between two parents."""
         pass
+
+class FlipTracker:
+    """
+    Current individual of a local search plus its fitness, updated move by move.
+
+    Used by single-solution methods (SA, RL environments) that only ever flip
+    one gene at a time. The tracker owns a private copy of the individual and
+    flips it in place; the default scores moves through
+    `Problem.evaluate_flip`, and problems needing running totals (e.g. the
+    Knapsack weight and value) provide a subclass that keeps them up to date.
+
+    Args:
+        problem: Problem the individual belongs to
+        individual: Starting individual (copied)
+    """
+
+    def __init__(self, problem: Problem, individual: Any):
+        self.problem = problem
+        self.individual = copy.copy(individual)
+        self.fitness = problem.evaluate(self.individual)
+
+    def evaluate_flip(self, index: int) -> float:
+        """Fitness after flipping gene `index`, without applying the move."""
+        return self.problem.evaluate_flip(self.individual, index, self.fitness)
+
+    def apply_flip(self, index: int, fitness: float):
+        """Flip gene `index`; `fitness` is the value returned by `evaluate_flip`."""
+        self.individual = self.problem.flip(self.individual, index, in_place=True)
+        self.fitness = fitness
+
+    def snapshot(self) -> Any:
+        """Return a copy of the current individual."""
+        return copy.copy(self.individual)
+
+class BatchFlipTracker:
+    """
+    Batched counterpart of `FlipTracker` for K independent chains.
+
+    Holds a private ``(K, size)`` `uint8` population matrix and the fitness of
+    each row. Every move flips one gene per row; `evaluate_flips` scores all
+    K moves at once and `apply_flips` commits the accepted ones. The default
+    re-evaluates the flipped rows with `evaluate_batch`; problems override it
+    with O(K) updates from running totals.
+
+    Args:
+        problem: Problem the rows belong to
+        population: Starting population matrix (copied)
+    """
+
+    def __init__(self, problem: Problem, population: np.ndarray):
+        self.problem = problem
+        self.population = np.array(population, dtype=np.uint8)
+        self.fitness = np.asarray(problem.evaluate_batch(self.population))
+        self.rows = np.arange(len(self.population))
+
+    def evaluate_flips(self, indices: np.ndarray) -> np.ndarray:
+        """Fitness of every row after flipping gene `indices[row]`, without applying the moves."""
+        neighbors = self.population.copy()
+        neighbors[self.rows, indices] ^= 1
+        return np.asarray(self.problem.evaluate_batch(neighbors))
+
+    def apply_flips(self, accept: np.ndarray, indices: np.ndarray, fitness: np.ndarray):
+        """Apply the moves of rows where `accept` is True; `fitness` comes from `evaluate_flips`."""
+        rows = self.rows[accept]
+        self.population[rows, indices[accept]] ^= 1
+        self.fitness[accept] = fitness[accept]
+
+    def reset_rows(self, mask: np.ndarray, population: np.ndarray):
+        """Replace the rows where `mask` is True with `population` and score them."""
+        self.population[mask] = population
+        self.fitness[mask] = self.problem.evaluate_batch(self.population[mask])
+
+class ProblemWrapper(Problem):
+    """
+    Problem that forwards every call to a wrapped problem instance.
+
+    Subclasses override only the methods they change (e.g. caching fitness
+    values); problem attributes such as `size`, `weights` or `capacity` are
+    looked up on the wrapped problem, so a wrapper can be passed anywhere the
+    original problem is expected.
+    """
+
+    def __init__(self, problem: Problem):
+        self.problem = problem
+
+    def __getattr__(self, name: str) -> Any:
+        # Guard against recursion while unpickling, before `problem` is set
+        if name == 'problem':
+            raise AttributeError(name)
+        return getattr(self.problem, name)
+
+    @property
+    def packed(self) -> bool:
+        return self.problem.packed
+
+    def create_individual(self) -> Any:
+        return self.problem.create_individual()
+
+    def evaluate(self, individual: Any) -> float:
+        return self.problem.evaluate(individual)
+
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        return self.problem.evaluate_batch(population)
+
+    def decode(self, individual: Any) -> Any:
+        return self.problem.decode(individual)
+
+    def gene_frequency(self, population: Sequence[Any]) -> np.ndarray:
+        return self.problem.gene_frequency(population)
+
+    def gene(self, individual: Any, index: int) -> int:
+        return self.problem.gene(individual, index)
+
+    def flip(self, individual: Any, index: int, in_place: bool = False) -> Any:
+        return self.problem.flip(individual, index, in_place)
+
+    def evaluate_flip(self, individual: Any, index: int, current_fitness: float) -> float:
+        return self.problem.evaluate_flip(individual, index, current_fitness)
+
+    def tracker(self, individual: Any) -> "FlipTracker":
+        return self.problem.tracker(individual)
+
+    def batch_tracker(self, population: np.ndarray) -> "BatchFlipTracker":
+        return self.problem.batch_tracker(population)
+
+    def mutate(self, individual: Any, rate: float) -> Any:
+        return self.problem.mutate(individual, rate)
+
+    def crossover(self, parent1: Any, parent2: Any) -> Tuple[Any, Any]:
+        return self.problem.crossover(parent1, parent2)
@@ -0,0 +1,116 @@
+"""Fitness Cache"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Sequence
+import numpy as np
+from .base import Problem, ProblemWrapper
+
+class CachedProblem(ProblemWrapper):
+    """
+    Problem wrapper that memoizes fitness values per genotype.
+
+    Fitness values are stored in a bounded LRU cache keyed by the genotype,
+    so individuals that survive a generation (elites, tournament contenders,
+    the final population) are never scored twice. Share one instance between
+    solvers and environments to share the cache.
+
+    Args:
+        problem: Problem whose `evaluate`/`evaluate_batch` results are cached
+        maxsize: Maximum number of cached genotypes (least recently used are evicted)
+    """
+
+    def __init__(self, problem: Problem, maxsize: int = 100_000):
+        super().__init__(problem)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    @staticmethod
+    def _key(individual: Any) -> Hashable:
+        """Hashable genotype key; binary genomes map to the same bytes whether stored as list or array."""
+        if isinstance(individual, int):
+            # Bit-packed genome
+            return individual
+        if isinstance(individual, np.ndarray):
+            # Any integer/bool array of byte-sized genes (uint8 matrix rows,
+            # int64 arrays) shares the key of the equal list
+            if individual.dtype.kind in 'biu' and (
+                    individual.size == 0 or (individual.min() >= 0 and individual.max() <= 255)):
+                return individual.astype(np.uint8, copy=False).tobytes()
+            return tuple(individual.tolist())
+        try:
+            return bytes(individual)
+        except (TypeError, ValueError):
+            return tuple(individual)
+
+    def _store(self, key: Hashable, value: Any):
+        self._cache[key] = value
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def evaluate(self, individual: Any) -> float:
+        key = self._key(individual)
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        self.misses += 1
+        value = self.problem.evaluate(individual)
+        self._store(key, value)
+        return value
+
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        results: List[Any] = [None] * len(population)
+        pending: Dict[Hashable, List[int]] = {}
+
+        for i, ind in enumerate(population):
+            key = self._key(ind)
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                results[i] = self._cache[key]
+            elif key in pending:
+                # Duplicate genotype within the batch, evaluated once
+                self.hits += 1
+                pending[key].append(i)
+            else:
+                pending[key] = [i]
+
+        if pending:
+            first = [positions[0] for positions in pending.values()]
+            if isinstance(population, np.ndarray):
+                misses = population[first]
+            else:
+                misses = [population[i] for i in first]
+            values = self.problem.evaluate_batch(misses)
+            self.misses += len(first)
+
+            for (key, positions), value in zip(pending.items(), values):
+                self._store(key, value)
+                for i in positions:
+                    results[i] = value
+
+        return np.array(results)
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current cache occupancy."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """Drop all cached values and reset the counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,76 @@
+"""Fitness Evaluation Counter"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+from typing import Any, Sequence
+import numpy as np
+from .base import Problem, ProblemWrapper
+
+class CountingProblem(ProblemWrapper):
+    """
+    Problem wrapper that counts fitness evaluations.
+
+    Every scored genome counts once: `evaluate` adds one, `evaluate_batch`
+    adds the number of rows, and single-flip moves scored through
+    `evaluate_flip` or a (batch) tracker add one per move. Used by the
+    benchmark to report evaluations per second.
+
+    Args:
+        problem: Problem whose evaluations are counted
+    """
+
+    def __init__(self, problem: Problem):
+        super().__init__(problem)
+        self.evaluations = 0
+
+    def evaluate(self, individual: Any) -> float:
+        self.evaluations += 1
+        return self.problem.evaluate(individual)
+
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        fitness = self.problem.evaluate_batch(population)
+        self.evaluations += len(fitness)
+        return fitness
+
+    def evaluate_flip(self, individual: Any, index: int, current_fitness: float) -> float:
+        self.evaluations += 1
+        return self.problem.evaluate_flip(individual, index, current_fitness)
+
+    def tracker(self, individual: Any) -> "CountingTracker":
+        self.evaluations += 1
+        return CountingTracker(self, self.problem.tracker(individual))
+
+    def batch_tracker(self, population: np.ndarray) -> "CountingTracker":
+        tracker = self.problem.batch_tracker(population)
+        self.evaluations += len(tracker.fitness)
+        return CountingTracker(self, tracker)
+
+    def reset(self):
+        """Reset the evaluation count."""
+        self.evaluations = 0
+
+class CountingTracker:
+    """Forwards to a `FlipTracker` or `BatchFlipTracker`, counting the moves it scores."""
+
+    def __init__(self, counter: CountingProblem, tracker: Any):
+        self.counter = counter
+        self.tracker = tracker
+
+    def __getattr__(self, name: str) -> Any:
+        if name == 'tracker':
+            raise AttributeError(name)
+        return getattr(self.tracker, name)
+
+    def evaluate_flip(self, index: int) -> float:
+        self.counter.evaluations += 1
+        return self.tracker.evaluate_flip(index)
+
+    def evaluate_flips(self, indices: np.ndarray) -> np.ndarray:
+        self.counter.evaluations += len(indices)
+        return self.tracker.evaluate_flips(indices)
+
+    def reset_rows(self, mask: np.ndarray, population: np.ndarray):
+        self.counter.evaluations += int(np.count_nonzero(mask))
+        self.tracker.reset_rows(mask, population)
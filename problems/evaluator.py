@@ -0,0 +1,132 @@
+"""Population Evaluator Backends"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import math
+from abc import abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, List, Optional, Sequence
+import numpy as np
+from .base import Problem, ProblemWrapper
+
+# Problem instance held by each process-pool worker (set once by the initializer)
+_worker_problem: Optional[Problem] = None
+
+def _init_worker(problem: Problem):
+    global _worker_problem
+    _worker_problem = problem
+
+def _evaluate_chunk(chunk: Sequence[Any]) -> np.ndarray:
+    return _worker_problem.evaluate_batch(chunk)
+
+class SerialEvaluator(ProblemWrapper):
+    """Evaluates populations in the calling thread (the default behavior)."""
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class PoolEvaluator(SerialEvaluator):
+    """
+    Abstract base class for evaluators that split a population into chunks
+    and score them concurrently on an executor. Results are concatenated in the
+    original population order.
+
+    Args:
+        problem: Problem to evaluate
+        workers: Number of pool workers
+        chunk_size: Individuals per task (default: population split into ~4 chunks per worker)
+    """
+
+    def __init__(self, problem: Problem, workers: int = 2, chunk_size: Optional[int] = None):
+        super().__init__(problem)
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._executor: Optional[Executor] = None
+
+    @abstractmethod
+    def _create_executor(self) -> Executor:
+        """Start the worker pool."""
+        pass
+
+    @abstractmethod
+    def _submit_chunk(self, executor: Executor, chunk: Sequence[Any]):
+        """Submit one chunk for scoring and return its future."""
+        pass
+
+    def _chunks(self, population: Sequence[Any]) -> List[Sequence[Any]]:
+        size = self.chunk_size or max(1, math.ceil(len(population) / (self.workers * 4)))
+        return [population[i:i + size] for i in range(0, len(population), size)]
+
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        if len(population) == 0:
+            return np.array([])
+        if self._executor is None:
+            self._executor = self._create_executor()
+
+        futures = [self._submit_chunk(self._executor, chunk) for chunk in self._chunks(population)]
+        return np.concatenate([np.asarray(f.result()) for f in futures])
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+class ThreadPoolEvaluator(PoolEvaluator):
+    """Evaluates population chunks on a thread pool (for GIL-releasing fitness functions)."""
+
+    def _create_executor(self) -> Executor:
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def _submit_chunk(self, executor: Executor, chunk: Sequence[Any]):
+        return executor.submit(self.problem.evaluate_batch, chunk)
+
+class ProcessPoolEvaluator(PoolEvaluator):
+    """
+    Evaluates population chunks on a process pool.
+
+    The problem instance (e.g. the `KnapsackProblem` item arrays) is pickled to each
+    worker once, when the pool starts; afterwards only the individuals of each
+    chunk and their fitness values cross the process boundary.
+    """
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.problem,))
+
+    def _submit_chunk(self, executor: Executor, chunk: Sequence[Any]):
+        return executor.submit(_evaluate_chunk, chunk)
+
+EVALUATORS = {
+    "serial": SerialEvaluator,
+    "thread": ThreadPoolEvaluator,
+    "process": ProcessPoolEvaluator,
+}
+
+def make_evaluator(problem: Problem, workers: int = 1, backend: str = "process",
+                   chunk_size: Optional[int] = None) -> SerialEvaluator:
+    """
+    Wrap a problem in the requested evaluator backend.
+
+    Args:
+        problem: Problem to evaluate
+        workers: Number of workers; 1 or less always selects the serial backend
+        backend: One of "serial", "thread" or "process"
+        chunk_size: Individuals per task for pool backends
+
+    Returns:
+        Evaluator wrapping `problem`, usable wherever a `Problem` is expected
+    """
+    if backend not in EVALUATORS:
+        raise ValueError(f"Unknown evaluator backend '{backend}'. Choose from {list(EVALUATORS)}.")
+    if workers <= 1 or backend == "serial":
+        return SerialEvaluator(problem)
+    return EVALUATORS[backend](problem, workers=workers, chunk_size=chunk_size)
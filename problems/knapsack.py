@@ -1,15 +1,22 @@
 """Knapsack Problem Definition"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
 import random
-from typing import List, Tuple
-from .base import Problem
+from typing import Any, Dict, List, Sequence, Tuple
+import numpy as np
+from .base import BatchFlipTracker, FlipTracker, Problem
+from .mutation import flip_list
 
 class KnapsackProblem(Problem):
-    """0/1 Knapsack Problem: maximize value without exceeding weight capacity."""
+    """
+    0/1 Knapsack Problem: maximize value without exceeding weight capacity.
+
+    Item data is stored as contiguous `int64` arrays, `weights` and `values`
+    (item i is ``weights[i]``, ``values[i]``).
+    """
 
     def __init__(self, size: int = 50, capacity_ratio: float = 0.5):
         self.size = size
@@ -18,22 +25,25 @@ class KnapsackProblem(Problem):
         # Generate random items (value, weight)
         # Using a fixed seed for reproducibility across runs if needed, but here random is fine for demonstration
         # To make it fair/testable, we normally might load from file. Here we generate random instances.
-        self.items = []
+        weights, values = [], []
         for _ in range(size):
-            weight = random.randint(1, 20)
-            value = random.randint(1, 20)
-            self.items.append({'w': weight, 'v': value})
+            weights.append(random.randint(1, 20))
+            values.append(random.randint(1, 20))
+        self.weights = np.array(weights, dtype=np.int64)
+        self.values = np.array(values, dtype=np.int64)
+
+    @property
+    def items(self) -> List[Dict[str, int]]:
+        """Items as ``{'w': weight, 'v': value}`` dicts (built on access, for compatibility)."""
+        return [{'w': w, 'v': v} for w, v in zip(self.weights.tolist(), self.values.tolist())]
 
     def create_individual(self) -> List[int]:
         return [random.randint(0, 1) for _ in range(self.size)]
 
     def evaluate(self, individual: List[int]) -> float:
-        total_value = 0
-        total_weight = 0
-        for i, included in enumerate(individual):
-            if included:
-                total_value += self.items[i]['v']
-                total_weight += self.items[i]['w']
+        genes = np.asarray(individual, dtype=np.uint8)
+        total_value = int(genes @ self.values)
+        total_weight = int(genes @ self.weights)
         
         if total_weight > self.capacity:
             # Penalty for exceeding capacity. 
@@ -43,15 +53,75 @@ class KnapsackProblem(Problem):
             
         return total_value
 
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        """Matrix product with the value/weight vectors, zeroing overweight rows."""
+        pop = np.asarray(population, dtype=np.uint8).reshape(-1, self.size)
+        total_values = pop @ self.values
+        total_weights = pop @ self.weights
+        return np.where(total_weights > self.capacity, 0, total_values)
+
+    def tracker(self, individual: List[int]) -> "KnapsackTracker":
+        return KnapsackTracker(self, individual)
+
+    def batch_tracker(self, population: np.ndarray) -> "KnapsackBatchTracker":
+        return KnapsackBatchTracker(self, population)
+
     def mutate(self, individual: List[int], rate: float) -> List[int]:
-        new_ind = individual[:]
-        for i in range(len(new_ind)):
-            if random.random() < rate:
-                new_ind[i] = 1 - new_ind[i]
-        return new_ind
+        # Draws only the flipped positions (see problems/mutation.py)
+        return flip_list(individual, rate)
 
     def crossover(self, parent1: List[int], parent2: List[int]) -> Tuple[List[int], List[int]]:
         point = random.randint(1, self.size - 1)
         child1 = parent1[:point] + parent2[point:]
         child2 = parent2[:point] + parent1[point:]
         return child1, child2
+
+class KnapsackTracker(FlipTracker):
+    """Flip tracker keeping the running total weight and value, so each move costs O(1)."""
+
+    def __init__(self, problem: KnapsackProblem, individual: List[int]):
+        super().__init__(problem, individual)
+        genes = np.asarray(problem.decode(self.individual), dtype=np.uint8)
+        self.weight = int(genes @ problem.weights)
+        self.value = int(genes @ problem.values)
+
+    def _totals_after(self, index: int) -> Tuple[int, int]:
+        sign = 1 - 2 * self.problem.gene(self.individual, index)
+        return (self.weight + sign * self.problem.weights.item(index),
+                self.value + sign * self.problem.values.item(index))
+
+    def evaluate_flip(self, index: int) -> float:
+        weight, value = self._totals_after(index)
+        return 0 if weight > self.problem.capacity else value
+
+    def apply_flip(self, index: int, fitness: float):
+        self.weight, self.value = self._totals_after(index)
+        super().apply_flip(index, fitness)
+
+class KnapsackBatchTracker(BatchFlipTracker):
+    """Batch flip tracker keeping per-row total weight and value, so each batch of moves costs O(K)."""
+
+    def __init__(self, problem: KnapsackProblem, population: np.ndarray):
+        super().__init__(problem, population)
+        self.weight = self.population @ problem.weights
+        self.value = self.population @ problem.values
+
+    def _totals_after(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        sign = 1 - 2 * self.population[self.rows, indices].astype(np.int64)
+        return (self.weight + sign * self.problem.weights[indices],
+                self.value + sign * self.problem.values[indices])
+
+    def evaluate_flips(self, indices: np.ndarray) -> np.ndarray:
+        weight, value = self._totals_after(indices)
+        return np.where(weight > self.problem.capacity, 0, value)
+
+    def apply_flips(self, accept: np.ndarray, indices: np.ndarray, fitness: np.ndarray):
+        weight, value = self._totals_after(indices)
+        self.weight[accept] = weight[accept]
+        self.value[accept] = value[accept]
+        super().apply_flips(accept, indices, fitness)
+
+    def reset_rows(self, mask: np.ndarray, population: np.ndarray):
+        super().reset_rows(mask, population)
+        self.weight[mask] = self.population[mask] @ self.problem.weights
+        self.value[mask] = self.population[mask] @ self.problem.values
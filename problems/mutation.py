@@ -0,0 +1,61 @@
+"""Sparse Bit-Flip Mutation"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import math
+import random
+from typing import List
+import numpy as np
+
+def flip_positions(size: int, rate: float) -> List[int]:
+    """
+    Sorted gene positions to flip when each of `size` genes flips with probability `rate`.
+
+    The gap before the next flipped gene is geometric, so only the flipped
+    positions are drawn: about `size * rate + 1` calls to `random.random()`
+    instead of one per gene.
+    """
+    if rate <= 0:
+        return []
+    if rate >= 1:
+        return list(range(size))
+
+    positions = []
+    log_q = math.log(1.0 - rate)
+    i = int(math.log(1.0 - random.random()) / log_q)
+    while i < size:
+        positions.append(i)
+        i += 1 + int(math.log(1.0 - random.random()) / log_q)
+    return positions
+
+def flip_list(individual: List[int], rate: float) -> List[int]:
+    """Copy of a list-of-bits individual with each gene flipped with probability `rate`."""
+    new_ind = individual[:]
+    for i in flip_positions(len(new_ind), rate):
+        new_ind[i] = 1 - new_ind[i]
+    return new_ind
+
+def flip_batch(population: np.ndarray, rate: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    Copy of a `uint8` population matrix with each bit flipped with probability `rate`.
+
+    The number of flips over the whole matrix is drawn from a binomial
+    distribution and that many distinct cells are sampled, so the random
+    draws scale with the number of flips rather than with the matrix size.
+
+    Args:
+        population: 2D `uint8` matrix, one individual per row
+        rate: Per-bit flip probability
+        rng: NumPy generator supplying the randomness
+    """
+    children = population.copy()
+    if rate <= 0 or children.size == 0:
+        return children
+    if rate >= 1:
+        return children ^ np.uint8(1)
+    count = rng.binomial(children.size, rate)
+    cells = rng.choice(children.size, size=count, replace=False, shuffle=False)
+    children.reshape(-1)[cells] ^= 1
+    return children
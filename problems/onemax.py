@@ -1,12 +1,14 @@
 """OneMax Problem Definition"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
 import random
-from typing import List, Tuple
-from .base import Problem
+from typing import Any, List, Sequence, Tuple
+import numpy as np
+from .base import BatchFlipTracker, Problem
+from .mutation import flip_list
 
 class OneMaxProblem(Problem):
     """OneMax problem: maximize the number of 1s in a bitstring."""
@@ -20,15 +22,30 @@ class OneMaxProblem(Problem):
     def evaluate(self, individual: List[int]) -> float:
         return sum(individual)
 
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        """Row sums of the population matrix."""
+        return np.asarray(population, dtype=np.uint8).reshape(-1, self.size).sum(axis=1, dtype=np.int64)
+
+    def evaluate_flip(self, individual: Any, index: int, current_fitness: float) -> float:
+        """O(1): flipping a 0 adds one, flipping a 1 removes one."""
+        return current_fitness + 1 - 2 * self.gene(individual, index)
+
+    def batch_tracker(self, population: np.ndarray) -> "OneMaxBatchTracker":
+        return OneMaxBatchTracker(self, population)
+
     def mutate(self, individual: List[int], rate: float) -> List[int]:
-        new_ind = individual[:]
-        for i in range(len(new_ind)):
-            if random.random() < rate:
-                new_ind[i] = 1 - new_ind[i]
-        return new_ind
+        # Draws only the flipped positions (see problems/mutation.py)
+        return flip_list(individual, rate)
 
     def crossover(self, parent1: List[int], parent2: List[int]) -> Tuple[List[int], List[int]]:
         point = random.randint(1, self.size - 1)
         child1 = parent1[:point] + parent2[point:]
         child2 = parent2[:point] + parent1[point:]
         return child1, child2
+
+class OneMaxBatchTracker(BatchFlipTracker):
+    """Batch flip tracker for OneMax: each flip changes the fitness by +1 or -1."""
+
+    def evaluate_flips(self, indices: np.ndarray) -> np.ndarray:
+        bits = self.population[self.rows, indices].astype(self.fitness.dtype)
+        return self.fitness + 1 - 2 * bits
@@ -0,0 +1,111 @@
+"""Bit-Packed Binary Problem Definitions"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import random
+from typing import Any, List, Sequence, Tuple
+import numpy as np
+from .onemax import OneMaxProblem
+from .knapsack import KnapsackProblem
+from .mutation import flip_positions
+
+def pack(bits: Sequence[int]) -> int:
+    """Pack a bit sequence into an int (gene i is bit i)."""
+    packed = np.packbits(np.asarray(bits, dtype=np.uint8), bitorder='little')
+    return int.from_bytes(packed.tobytes(), 'little')
+
+def unpack(value: int, size: int) -> np.ndarray:
+    """Unpack an int into a `uint8` array of `size` genes (gene i is bit i)."""
+    raw = np.frombuffer(value.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder='little')[:size]
+
+def flip_mask(size: int, rate: float) -> int:
+    """
+    Random XOR mask where each of `size` bits is set with probability `rate`.
+
+    Set positions come from `flip_positions` (geometric gaps), so the cost
+    grows with the number of flipped bits instead of the genome length.
+    """
+    if rate >= 1:
+        return (1 << size) - 1
+
+    positions = flip_positions(size, rate)
+    if len(positions) <= 32:
+        mask = 0
+        for i in positions:
+            mask |= 1 << i
+        return mask
+    # Many flips: build the mask in one pass instead of one big-int OR per bit
+    bits = np.zeros(size, dtype=np.uint8)
+    bits[positions] = 1
+    return pack(bits)
+
+class PackedBinaryMixin:
+    """
+    Bit-packed genome operators shared by the packed binary problems.
+
+    Individuals are Python ints holding one gene per bit, which uses about
+    1/64 of the memory of a list of ints: mutation is an XOR with a random
+    mask and single-point crossover combines the parents with a bit mask.
+    """
+
+    packed = True
+    size: int
+
+    def create_individual(self) -> int:
+        return random.getrandbits(self.size)
+
+    def decode(self, individual: int) -> List[int]:
+        return unpack(individual, self.size).tolist()
+
+    def unpack_batch(self, population: Sequence[Any]) -> np.ndarray:
+        """Population as a `(len(population), size)` `uint8` matrix."""
+        if isinstance(population, np.ndarray):
+            return population
+        matrix = np.empty((len(population), self.size), dtype=np.uint8)
+        for row, individual in enumerate(population):
+            matrix[row] = unpack(individual, self.size)
+        return matrix
+
+    def gene_frequency(self, population: Sequence[Any]) -> np.ndarray:
+        # Unpacked row by row into one uint8 matrix, without per-gene Python lists
+        return self.unpack_batch(population).mean(axis=0)
+
+    def gene(self, individual: int, index: int) -> int:
+        return (individual >> index) & 1
+
+    def flip(self, individual: int, index: int, in_place: bool = False) -> int:
+        # Ints are immutable, so in_place has no effect
+        return individual ^ (1 << index)
+
+    def mutate(self, individual: int, rate: float) -> int:
+        return individual ^ flip_mask(self.size, rate)
+
+    def crossover(self, parent1: int, parent2: int) -> Tuple[int, int]:
+        point = random.randint(1, self.size - 1)
+        low = (1 << point) - 1
+        child1 = (parent1 & low) | (parent2 & ~low)
+        child2 = (parent2 & low) | (parent1 & ~low)
+        return child1, child2
+
+class PackedOneMaxProblem(PackedBinaryMixin, OneMaxProblem):
+    """OneMax problem on bit-packed genomes; fitness is a popcount."""
+
+    def evaluate(self, individual: int) -> float:
+        return individual.bit_count()
+
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        if isinstance(population, np.ndarray):
+            return super().evaluate_batch(population)
+        return np.array([individual.bit_count() for individual in population], dtype=np.int64)
+
+class PackedKnapsackProblem(PackedBinaryMixin, KnapsackProblem):
+    """0/1 Knapsack problem on bit-packed genomes."""
+
+    def evaluate(self, individual: int) -> float:
+        return self.evaluate_batch([individual])[0].item()
+
+    def evaluate_batch(self, population: Sequence[Any]) -> np.ndarray:
+        return super().evaluate_batch(self.unpack_batch(population))
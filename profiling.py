@@ -0,0 +1,145 @@
+"""Solver Instrumentation"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+PhaseCallback = Callable[[str, float], None]
+
+class _Phase:
+    """Context manager timing one entry into a profiler phase."""
+
+    __slots__ = ("profiler", "name", "start", "blocks")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        if self.profiler.track_allocations:
+            self.blocks = sys.getallocatedblocks()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        profiler.times[self.name] = profiler.times.get(self.name, 0.0) + elapsed
+        profiler.calls[self.name] = profiler.calls.get(self.name, 0) + 1
+        if profiler.track_allocations:
+            blocks = sys.getallocatedblocks() - self.blocks
+            profiler.allocations[self.name] = profiler.allocations.get(self.name, 0) + blocks
+        for callback in profiler.callbacks:
+            callback(self.name, elapsed)
+
+class Profiler:
+    """
+    Per-phase timers and event counters for solver hot paths.
+
+    Solvers wrap each phase of an iteration (evaluation, selection,
+    crossover, mutation, logging, ...) in ``with profiler.phase(name):`` and
+    count operations with `count`. Registered callbacks are called with
+    ``(phase, seconds)`` whenever a phase ends.
+
+    With `track_allocations`, each phase also accumulates the net change in
+    allocated interpreter memory blocks (`sys.getallocatedblocks`), a cheap
+    proxy for allocation pressure.
+
+    Solvers default to `NULL_PROFILER`, whose methods do nothing.
+
+    Args:
+        track_allocations: Record net allocated blocks per phase
+    """
+
+    enabled = True
+
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        self.times: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.allocations: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self.callbacks: List[PhaseCallback] = []
+        self.start = time.perf_counter()
+
+    def phase(self, name: str) -> _Phase:
+        """Context manager timing the enclosed block as phase `name`."""
+        return _Phase(self, name)
+
+    def count(self, name: str, n: int = 1):
+        """Add `n` to counter `name`."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_callback(self, callback: PhaseCallback):
+        """Call `callback(phase, seconds)` at the end of every phase."""
+        self.callbacks.append(callback)
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-phase totals, call counts and shares of the profiled time, plus counters."""
+        profiled = sum(self.times.values())
+        phases = {}
+        for name, seconds in sorted(self.times.items(), key=lambda item: -item[1]):
+            phases[name] = {
+                "time": seconds,
+                "calls": self.calls[name],
+                "mean": seconds / self.calls[name],
+                "share": seconds / profiled if profiled else 0.0,
+            }
+            if self.track_allocations:
+                phases[name]["allocated_blocks"] = self.allocations.get(name, 0)
+        return {
+            "wall_time": time.perf_counter() - self.start,
+            "profiled_time": profiled,
+            "phases": phases,
+            "counters": dict(self.counters),
+        }
+
+    def report(self) -> str:
+        """Summary formatted as a text table."""
+        summary = self.summary()
+        lines = [f"Profile: {summary['wall_time']:.3f}s wall, {summary['profiled_time']:.3f}s in phases"]
+        for name, phase in summary["phases"].items():
+            line = (f"  {name:<14} {phase['time']:>9.4f}s {phase['share'] * 100:>5.1f}% "
+                    f"{phase['calls']:>9} calls {phase['mean'] * 1e6:>9.2f}us/call")
+            if "allocated_blocks" in phase:
+                line += f" {phase['allocated_blocks']:>+9} blocks"
+            lines.append(line)
+        for name, value in summary["counters"].items():
+            lines.append(f"  {name:<14} {value:>9}")
+        return "\n".join(lines)
+
+    def save(self, path: str):
+        """Write the summary as JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+class NullProfiler:
+    """Profiler interface that records nothing (the default for every solver)."""
+
+    enabled = False
+    _phase = _NullPhase()
+
+    def phase(self, name: str) -> _NullPhase:
+        return self._phase
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+    def add_callback(self, callback: PhaseCallback):
+        pass
+
+NULL_PROFILER = NullProfiler()
@@ -0,0 +1,96 @@
+"""Background Plot Rendering"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from typing import Any, List, Optional, Tuple
+
+Job = Tuple[str, Tuple[Any, ...], dict]
+
+class PlotRenderer:
+    """
+    Runs `Visualizer` calls inline or in a detached worker process.
+
+    A job is a `Visualizer` method name plus its arguments. Inline, every
+    job runs as soon as it is submitted. In the background, jobs are
+    collected and `finish()` pickles them to a temporary file and starts
+    ``python rendering.py <file>`` in a new session: the caller can return
+    (or start its next run) while the plots and animation are written, and
+    the worker keeps going after the caller exits. Job arguments must be
+    picklable (logger stats/history, decoded solutions, plain problems).
+
+    `visualizer` (and with it matplotlib) is only imported by whichever
+    process renders; a disabled renderer drops every job.
+
+    Args:
+        background: Render in a worker process instead of inline
+        log_path: File receiving the worker's output (default: discarded)
+        enabled: Render at all (False for runs without plots)
+    """
+
+    def __init__(self, background: bool = False, log_path: Optional[str] = None, enabled: bool = True):
+        self.background = background
+        self.enabled = enabled
+        self.log_path = log_path
+        self.jobs: List[Job] = []
+        self.process: Optional[subprocess.Popen] = None
+
+    def submit(self, method: str, *args: Any, **kwargs: Any):
+        """Render `Visualizer.<method>(*args, **kwargs)` now (inline) or at `finish()` (background)."""
+        if not self.enabled:
+            return
+        if self.background:
+            self.jobs.append((method, args, kwargs))
+        else:
+            from visualizer import Visualizer
+            getattr(Visualizer(), method)(*args, **kwargs)
+
+    def finish(self) -> Optional[subprocess.Popen]:
+        """Start the worker for the submitted jobs (background mode); returns its process."""
+        if not self.jobs:
+            return None
+        fd, path = tempfile.mkstemp(prefix="optsim_render_", suffix=".pkl")
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(self.jobs, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.jobs = []
+
+        output = open(self.log_path, 'w') if self.log_path else subprocess.DEVNULL
+        try:
+            self.process = subprocess.Popen([sys.executable, os.path.abspath(__file__), path],
+                                            stdin=subprocess.DEVNULL, stdout=output, stderr=subprocess.STDOUT,
+                                            start_new_session=True)
+        finally:
+            if output is not subprocess.DEVNULL:
+                output.close()
+        return self.process
+
+    def wait(self) -> Optional[int]:
+        """Block until the worker has written every artifact; returns its exit code."""
+        return self.process.wait() if self.process is not None else None
+
+def render_jobs(path: str) -> int:
+    """Run the jobs pickled at `path` (then delete it); returns the number of failed jobs."""
+    with open(path, 'rb') as f:
+        jobs = pickle.load(f)
+    os.remove(path)
+
+    from visualizer import Visualizer
+    visualizer = Visualizer()
+    failed = 0
+    for method, args, kwargs in jobs:
+        try:
+            getattr(visualizer, method)(*args, **kwargs)
+        except Exception as e:
+            print(f"Rendering {method} failed: {e}")
+            failed += 1
+        sys.stdout.flush()
+    return failed
+
+if __name__ == "__main__":
+    sys.exit(1 if render_jobs(sys.argv[1]) else 0)
@@ -1,13 +1,15 @@
 """RL Environment Wrapper"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
 import random
 from abc import ABC, abstractmethod
-from typing import Any, Tuple, List
+from typing import Any, Tuple, Optional
+import numpy as np
 from problems import Problem, OneMaxProblem
+from problems.packed import pack
 
 class RLEnvironment(ABC):
     """Abstract base class for RL Environments."""
@@ -23,38 +25,153 @@ class RLEnvironment(ABC):
         pass
 
 class OneMaxEnv(RLEnvironment):
-    """OneMax problem as an RL environment."""
+    """
+    OneMax problem as an RL environment.
+
+    States are tuples of bits, or plain ints when the problem uses the
+    bit-packed representation (`problem.packed`); both are hashable and can
+    be used directly as Q-table keys. With `index_states` every state is
+    observed as its integer index in ``range(n_states)`` (bit i = gene i),
+    updated in O(1) per step.
+    """
     
-    def __init__(self, problem: OneMaxProblem):
+    def __init__(self, problem: OneMaxProblem, index_states: bool = False):
         self.problem = problem
-        self.state: List[int] = []
+        self.index_states = index_states
+        self.n_states = 2 ** problem.size
+        self.state: Any = []
+        self.index = 0
         self.current_fitness = 0.0
+        self.tracker = None
+        
+    def observe(self) -> Any:
+        """Return the current state in its hashable form."""
+        if self.index_states:
+            return self.index
+        return self.state if self.problem.packed else tuple(self.state)
         
-    def reset(self) -> Tuple[int, ...]:
-        self.state = self.problem.create_individual()
-        self.current_fitness = self.problem.evaluate(self.state)
-        return tuple(self.state)
+    def reset(self) -> Any:
+        # The tracker scores each bit flip in O(1) instead of re-evaluating the genome
+        self.tracker = self.problem.tracker(self.problem.create_individual())
+        self.state = self.tracker.individual
+        self.current_fitness = self.tracker.fitness
+        if self.index_states:
+            self.index = self.state if self.problem.packed else pack(self.state)
+        return self.observe()
     
-    def step(self, action: int) -> Tuple[Tuple[int, ...], float, bool]:
+    def step(self, action: int) -> Tuple[Any, float, bool]:
         """
         Action: Index of the bit to flip (0 to size-1).
         Reward: Change in fitness.
         Done: If maximum fitness is reached.
         """
-        # Copy state to avoid mutation if referenced elsewhere (optional safety)
-        new_state = list(self.state)
-        
         # Apply action: Flip bit at index 'action'
-        if 0 <= action < len(new_state):
-            new_state[action] = 1 - new_state[action]
+        new_fitness = self.current_fitness
+        if 0 <= action < self.problem.size:
+            new_fitness = self.tracker.evaluate_flip(action)
+            self.tracker.apply_flip(action, new_fitness)
+            self.index ^= 1 << action
             
-        new_fitness = self.problem.evaluate(new_state)
         reward = new_fitness - self.current_fitness
         
-        self.state = new_state
+        self.state = self.tracker.individual
         self.current_fitness = new_fitness
         
         # Check for termination (optional, OneMax relies on reaching size)
         done = self.current_fitness == self.problem.size
         
-        return tuple(self.state), reward, done
+        return self.observe(), reward, done
+
+class OneMaxVecEnv(RLEnvironment):
+    """
+    N OneMax environments stepped together.
+
+    States are the rows of one ``(n_envs, size)`` `uint8` matrix, scored by
+    the problem's `batch_tracker`. `step` takes one action per environment
+    and returns arrays of observations, rewards and done flags. Finished
+    environments (maximum fitness reached, or `max_steps` taken) are reset
+    automatically: their returned observation is already the new episode's
+    first state, while `final_observations` keeps the state they ended in
+    and `terminated` flags the environments that reached maximum fitness
+    (as opposed to being cut off).
+
+    Observations are the state matrix, or with `index_states` the integer
+    state indices (bit i = gene i, sizes up to 62 bits) as an `int64` array.
+
+    Args:
+        problem: OneMax problem (plain or bit-packed)
+        n_envs: Number of environments
+        max_steps: Steps after which an episode is cut off (None: run until done)
+        index_states: Observe integer state indices instead of the state matrix
+        seed: Seed for the random initial states
+    """
+
+    def __init__(self, problem: OneMaxProblem, n_envs: int = 16, max_steps: Optional[int] = None,
+                 index_states: bool = False, seed: Optional[int] = None):
+        if index_states and problem.size > 62:
+            raise ValueError("Integer state indices are limited to 62 bits; use the state matrix.")
+        self.problem = problem
+        self.n_envs = n_envs
+        self.max_steps = max_steps
+        self.index_states = index_states
+        self.n_states = 2 ** problem.size
+        self.rng = np.random.default_rng(seed)
+        self.tracker = None
+        self.indices = np.zeros(n_envs, dtype=np.int64)
+        self.steps = np.zeros(n_envs, dtype=np.int64)
+        self.final_observations: Any = None
+        self.terminated = np.zeros(n_envs, dtype=bool)
+        self._bit_values = 1 << np.arange(min(problem.size, 63), dtype=np.int64)
+
+    @property
+    def states(self) -> np.ndarray:
+        return self.tracker.population
+
+    @property
+    def current_fitness(self) -> np.ndarray:
+        return self.tracker.fitness
+
+    def observe(self) -> np.ndarray:
+        """Return the current observations of all environments."""
+        return self.indices.copy() if self.index_states else self.tracker.population.copy()
+
+    def _random_states(self, count: int) -> np.ndarray:
+        return self.rng.integers(0, 2, size=(count, self.problem.size), dtype=np.uint8)
+
+    def reset(self) -> np.ndarray:
+        self.tracker = self.problem.batch_tracker(self._random_states(self.n_envs))
+        if self.index_states:
+            self.indices = self.tracker.population @ self._bit_values
+        self.steps[:] = 0
+        return self.observe()
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Actions: Index of the bit to flip in each environment.
+        Rewards: Change in fitness.
+        Dones: Episode ended (maximum fitness or `max_steps` reached); those environments are reset.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        previous_fitness = self.tracker.fitness.copy()
+        new_fitness = self.tracker.evaluate_flips(actions)
+        self.tracker.apply_flips(np.ones(self.n_envs, dtype=bool), actions, new_fitness)
+        if self.index_states:
+            self.indices ^= np.left_shift(1, actions)
+        self.steps += 1
+
+        rewards = new_fitness - previous_fitness
+        self.terminated = new_fitness == self.problem.size
+        dones = self.terminated.copy()
+        if self.max_steps is not None:
+            dones |= self.steps >= self.max_steps
+        self.final_observations = self.observe()
+
+        # Auto-reset finished environments
+        if dones.any():
+            count = int(dones.sum())
+            self.tracker.reset_rows(dones, self._random_states(count))
+            if self.index_states:
+                self.indices[dones] = self.tracker.population[dones] @ self._bit_values
+            self.steps[dones] = 0
+
+        return self.observe(), rewards, dones
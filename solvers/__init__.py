@@ -1,11 +1,41 @@
 """Solvers Package"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
-from .ga_solver import Solver as GASolver
-from .rl_solver import RLSolver
-from .sa_solver import SASolver
+import importlib
 
-__all__ = ['GASolver', 'RLSolver', 'SASolver']
+# Public name -> (module, attribute). Modules are imported on first access
+# (PEP 562), so `import solvers` stays cheap and a run only loads the solver
+# it uses (the island and PT solvers pull in multiprocessing, for example).
+_EXPORTS = {
+    'GASolver': ('.ga_solver', 'Solver'),
+    'RLSolver': ('.rl_solver', 'RLSolver'),
+    'LinearQSolver': ('.linear_rl_solver', 'LinearQSolver'),
+    'SASolver': ('.sa_solver', 'SASolver'),
+    'VectorizedGASolver': ('.vec_ga_solver', 'VectorizedGASolver'),
+    'VectorizedSASolver': ('.vec_sa_solver', 'VectorizedSASolver'),
+    'IslandSolver': ('.island_solver', 'IslandSolver'),
+    'ParallelTemperingSolver': ('.pt_solver', 'ParallelTemperingSolver'),
+    'ExactKnapsackSolver': ('.exact_solver', 'ExactKnapsackSolver'),
+    'Termination': ('.termination', 'Termination'),
+    'TargetFitness': ('.termination', 'TargetFitness'),
+    'Stagnation': ('.termination', 'Stagnation'),
+    'TimeLimit': ('.termination', 'TimeLimit'),
+    'MaxEvaluations': ('.termination', 'MaxEvaluations'),
+    'AnyOf': ('.termination', 'AnyOf'),
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _EXPORTS[name]
+    value = getattr(importlib.import_module(module, __name__), attribute)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,73 @@
+"""Exact Solver for the 0/1 Knapsack Problem (Dynamic Programming)"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+from typing import Any, List, Optional
+import numpy as np
+from problems import Problem
+from problems.packed import pack
+from logger import Logger
+
+class ExactKnapsackSolver:
+    """
+    Exact 0/1 Knapsack Solver (dynamic programming over capacities).
+
+    Processes the items one at a time, keeping the best value for every
+    capacity ``0..capacity`` in one NumPy row, so an item costs one
+    vectorized pass. Take/skip decisions are kept as an
+    ``(n_items, capacity + 1)`` boolean table to reconstruct the solution.
+    Time and memory grow with ``n_items * capacity``; `max_cells` guards
+    against instances too large for that.
+
+    The result is the true optimum (`optimum`), used as the reference point
+    for optimality gaps of the heuristic solvers.
+    """
+
+    def __init__(self, problem: Problem, logger: Optional[Logger] = None, max_cells: int = 10 ** 8):
+        self.problem = problem
+        self.logger = logger
+        self.max_cells = max_cells
+        self.optimum: Optional[int] = None
+
+    def cells(self) -> int:
+        """Size of the decision table for this instance."""
+        return self.problem.size * (self.problem.capacity + 1)
+
+    def solve(self) -> Any:
+        """Compute an optimal selection; returns it in the problem's genome representation."""
+        weights = self.problem.weights.tolist()
+        values = self.problem.values.tolist()
+        capacity = self.problem.capacity
+        if self.cells() > self.max_cells:
+            raise ValueError(f"Knapsack instance needs {self.cells()} DP cells (limit {self.max_cells}).")
+
+        best = np.zeros(capacity + 1, dtype=np.int64)
+        take = np.zeros((len(weights), capacity + 1), dtype=bool)
+        for i, (weight, value) in enumerate(zip(weights, values)):
+            if weight > capacity:
+                continue
+            # best[c - weight] + value for every capacity c >= weight, from the previous row
+            candidate = best[:capacity + 1 - weight] + value
+            improved = candidate > best[weight:]
+            take[i, weight:] = improved
+            best[weight:] = np.where(improved, candidate, best[weight:])
+
+        # Walk the decisions backwards from the full capacity
+        solution: List[int] = [0] * len(weights)
+        remaining = capacity
+        for i in range(len(weights) - 1, -1, -1):
+            if take[i, remaining]:
+                solution[i] = 1
+                remaining -= weights[i]
+
+        self.optimum = best[capacity].item()
+        result = pack(solution) if self.problem.packed else solution
+        if self.logger is not None:
+            self.logger.log(1, self.optimum, self.optimum, result)
+        return result
+
+def optimality_gap(best_fitness: float, optimum: float) -> float:
+    """Relative distance of `best_fitness` below `optimum` (0.0 = optimal)."""
+    return (optimum - best_fitness) / optimum if optimum else 0.0
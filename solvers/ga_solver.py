@@ -1,66 +1,170 @@
 """Solver for Genetic Algorithm"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
 import random
-from typing import List, Any
+from typing import Any, Dict, List, Optional
+import numpy as np
 from problems import Problem
 from logger import Logger
+from profiling import NULL_PROFILER, Profiler
+from checkpoint import Checkpointer
+from .selection import check_selection, select
+from .termination import Termination, never
 
 class Solver:
-    """Genetic Algorithm Solver."""
+    """
+    Genetic Algorithm Solver.
+
+    An optional `Profiler` times the evaluation, selection, crossover,
+    mutation, copy (building the next population) and logging phases and
+    counts evaluate/crossover/mutate calls. An optional `Termination` is
+    checked after every generation and can end the run early.
+
+    Parents for a whole generation are picked in one batched call on the
+    generation's fitness array (see `solvers/selection.py`): k-tournament
+    (default, `tournament_size` contenders), roulette, stochastic universal
+    sampling or rank selection. Selection uses a NumPy generator seeded
+    from `random`, so seeding `random` still fixes the whole run.
+
+    With a `Checkpointer`, the population is saved every few generations;
+    after `set_state` the next `solve()` continues with the saved
+    population instead of starting over.
+    """
 
     def __init__(self, problem: Problem, logger: Logger, 
-                 pop_size: int = 50, mutation_rate: float = 0.01, generations: int = 100):
+                 pop_size: int = 50, mutation_rate: float = 0.01, generations: int = 100,
+                 profiler: Optional[Profiler] = None, termination: Optional[Termination] = None,
+                 checkpointer: Optional[Checkpointer] = None,
+                 selection: str = "tournament", tournament_size: int = 3):
+        check_selection(selection)
         self.problem = problem
         self.logger = logger
         self.pop_size = pop_size
         self.mutation_rate = mutation_rate
         self.generations = generations
+        self.profiler = profiler or NULL_PROFILER
+        self.termination = termination or never()
+        self.checkpointer = checkpointer
+        self.selection = selection
+        self.tournament_size = tournament_size
+        self.rng = np.random.default_rng(random.getrandbits(64))
         self.population: List[Any] = []
+        self.generation = 0
+        self.evaluations = 0
+        self.stop_reason: Optional[str] = None
+        self._resumed = False
 
     def initialize_population(self):
         """Initialize the population with random individuals."""
         self.population = [self.problem.create_individual() for _ in range(self.pop_size)]
 
     def select_parent(self) -> Any:
-        """Tournament selection."""
-        tournament = random.sample(self.population, 3)
+        """
+        Tournament selection of a single parent from the current population.
+
+        Scores only the `tournament_size` contenders; `evolve` selects a
+        whole generation at once with `select_parents` instead.
+        """
+        tournament = random.sample(self.population, self.tournament_size)
+        self.evaluations += self.tournament_size
+        self.profiler.count("evaluate", self.tournament_size)
         return max(tournament, key=self.problem.evaluate)
 
-    def solve(self):
-        """Run the genetic algorithm."""
-        self.initialize_population()
+    def select_parents(self, fitness_scores: np.ndarray, count: int) -> np.ndarray:
+        """Select `count` parents at once from the generation's fitness scores; returns population indices."""
+        return select(self.selection, fitness_scores, count, self.rng, self.tournament_size)
 
-        for gen in range(1, self.generations + 1):
-            # Evaluation
-            fitness_scores = [self.problem.evaluate(ind) for ind in self.population]
-            best_fitness = max(fitness_scores)
-            avg_fitness = sum(fitness_scores) / self.pop_size
-            best_ind = self.population[fitness_scores.index(best_fitness)]
-            
-            # Logging
-            self.logger.log(gen, best_fitness, avg_fitness, best_ind, population=self.population[:])
-            
-            # Selection and Reproduction
-            new_population = []
-            
-            # Elitism: keep the best individual
-            new_population.append(best_ind)
+    def evaluate_population(self) -> np.ndarray:
+        """Evaluate every individual of the current population."""
+        with self.profiler.phase("evaluation"):
+            self.evaluations += len(self.population)
+            self.profiler.count("evaluate", len(self.population))
+            return self.problem.evaluate_batch(self.population)
+
+    def evolve(self, fitness_scores: np.ndarray):
+        """Replace the population with the next generation."""
+        profiler = self.profiler
+        new_population = []
+        
+        # Elitism: keep the best individual
+        new_population.append(self.population[int(np.argmax(fitness_scores))])
+        
+        # Elite plus ceil((pop_size - 1) / 2) crossover pairs fills the next generation
+        n_pairs = self.pop_size // 2
+        with profiler.phase("selection"):
+            parent_idx = self.select_parents(fitness_scores, 2 * n_pairs).tolist()
+        
+        for pair in range(n_pairs):
+            parent1 = self.population[parent_idx[2 * pair]]
+            parent2 = self.population[parent_idx[2 * pair + 1]]
             
-            while len(new_population) < self.pop_size:
-                parent1 = self.select_parent()
-                parent2 = self.select_parent()
-                
+            with profiler.phase("crossover"):
                 child1, child2 = self.problem.crossover(parent1, parent2)
-                
+            
+            with profiler.phase("mutation"):
                 child1 = self.problem.mutate(child1, self.mutation_rate)
                 child2 = self.problem.mutate(child2, self.mutation_rate)
-                
-                new_population.extend([child1, child2])
+            profiler.count("crossover")
+            profiler.count("mutate", 2)
             
+            new_population.extend([child1, child2])
+        
+        with profiler.phase("copy"):
             self.population = new_population[:self.pop_size]
 
-        return max(self.population, key=self.problem.evaluate)
+    def get_state(self) -> Dict[str, Any]:
+        """Completed generations, the (not yet evaluated) next population, the evaluation count and the selection RNG."""
+        return {"generation": self.generation, "population": self.population, "evaluations": self.evaluations,
+                "rng": self.rng.bit_generator.state}
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore a state from `get_state`; the next `solve()` resumes from it."""
+        self.generation = state["generation"]
+        self.population = list(state["population"])
+        self.evaluations = state["evaluations"]
+        if "rng" in state:
+            self.rng.bit_generator.state = state["rng"]
+        self._resumed = True
+
+    def solve(self):
+        """Run the genetic algorithm (or resume it after `set_state`)."""
+        if not self._resumed:
+            self.initialize_population()
+            self.generation = 0
+            self.evaluations = 0
+        self._resumed = False
+        self.termination.start()
+        self.stop_reason = None
+
+        for gen in range(self.generation + 1, self.generations + 1):
+            # Evaluation
+            fitness_scores = self.evaluate_population()
+            best_idx = int(np.argmax(fitness_scores))
+            best_fitness = fitness_scores[best_idx].item()
+            avg_fitness = float(np.mean(fitness_scores))
+            best_ind = self.population[best_idx]
+            
+            # Logging
+            with self.profiler.phase("logging"):
+                self.logger.log(gen, best_fitness, avg_fitness, best_ind,
+                                population=self.population if self.logger.keep_population else None,
+                                gene_frequency=self.problem.gene_frequency(self.population))
+            
+            if self.termination.should_stop(gen, best_fitness, self.evaluations):
+                self.stop_reason = self.termination.reason
+                print(f"Stopped after generation {gen}: {self.stop_reason}")
+                break
+            
+            # Selection and Reproduction
+            self.evolve(fitness_scores)
+            self.generation = gen
+            
+            if self.checkpointer is not None and self.checkpointer.due(gen):
+                self.checkpointer.save(self, gen)
+        else:
+            # The last generation's offspring have not been scored yet
+            fitness_scores = self.evaluate_population()
+        return self.population[int(np.argmax(fitness_scores))]
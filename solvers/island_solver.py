@@ -0,0 +1,167 @@
+"""Solver for Island-Model Genetic Algorithm"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from problems import Problem
+from logger import Logger
+from .ga_solver import Solver
+from .termination import Termination, never
+
+# Problem and GA parameters held by each island worker (set once by the initializer)
+_worker_problem: Optional[Problem] = None
+_worker_params: Dict[str, Any] = {}
+
+def _init_island_worker(problem: Problem, params: Dict[str, Any]):
+    global _worker_problem, _worker_params
+    _worker_problem = problem
+    _worker_params = params
+
+def _run_epoch(population: List[Any], scores: Optional[np.ndarray], generations: int,
+               seed: int) -> Tuple[List[Any], np.ndarray, List[Tuple[float, float, Any, np.ndarray]], int]:
+    """
+    Evolve one island for `generations` generations with the regular GA.
+
+    `scores` are the known fitness values of `population` (carried over from
+    the previous epoch and migration), or None to evaluate it first.
+
+    Returns:
+        (final population, its fitness scores, per-generation (best, avg, best individual, gene frequency),
+        fitness evaluations spent)
+    """
+    random.seed(seed)
+    solver = Solver(_worker_problem, logger=None, **_worker_params)
+    solver.population = population
+
+    stats = []
+    for g in range(generations):
+        fitness_scores = scores if g == 0 and scores is not None else solver.evaluate_population()
+        best_idx = int(np.argmax(fitness_scores))
+        gene_frequency = _worker_problem.gene_frequency(solver.population)
+        stats.append((fitness_scores[best_idx].item(), float(np.mean(fitness_scores)), solver.population[best_idx],
+                      gene_frequency))
+        solver.evolve(fitness_scores)
+
+    return solver.population, solver.evaluate_population(), stats, solver.evaluations
+
+class IslandSolver:
+    """
+    Island-Model Genetic Algorithm Solver.
+
+    Runs `n_islands` independent GA populations in worker processes. Every
+    `migration_interval` generations the best `migrants` individuals of each
+    island replace the worst individuals of its neighbors:
+
+    - ``ring``: island i sends to island i+1
+    - ``full``: every island sends to every other island
+
+    Per-island and global statistics are merged into one `Logger` history.
+    An optional `Termination` is checked for every merged generation; since
+    islands run whole epochs, evaluation counts are updated once per epoch.
+    """
+
+    TOPOLOGIES = ("ring", "full")
+
+    def __init__(self, problem: Problem, logger: Logger,
+                 n_islands: int = 4, pop_size: int = 50, mutation_rate: float = 0.01, generations: int = 100,
+                 migration_interval: int = 5, migrants: int = 2, topology: str = "ring",
+                 workers: Optional[int] = None, termination: Optional[Termination] = None):
+        if topology not in self.TOPOLOGIES:
+            raise ValueError(f"Unknown topology '{topology}'. Choose from {list(self.TOPOLOGIES)}.")
+        self.problem = problem
+        self.logger = logger
+        self.n_islands = n_islands
+        self.pop_size = pop_size
+        self.mutation_rate = mutation_rate
+        self.generations = generations
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        self.workers = workers or n_islands
+        self.termination = termination or never()
+        self.islands: List[List[Any]] = []
+        self.evaluations = 0
+        self.stop_reason: Optional[str] = None
+
+    def initialize_islands(self):
+        """Create one random population per island."""
+        self.islands = [[self.problem.create_individual() for _ in range(self.pop_size)]
+                        for _ in range(self.n_islands)]
+
+    def neighbors(self, island: int) -> List[int]:
+        """Islands that send migrants to `island`."""
+        if self.topology == "ring":
+            return [(island - 1) % self.n_islands] if self.n_islands > 1 else []
+        return [i for i in range(self.n_islands) if i != island]
+
+    def migrate(self, fitness: List[np.ndarray]):
+        """
+        Copy the best individuals of each island over the worst individuals of its neighbors.
+
+        Migrants bring their fitness along: `fitness` is updated in place, so
+        the next epoch starts from scored populations.
+        """
+        emigrants = []
+        for population, scores in zip(self.islands, fitness):
+            best = np.argsort(scores)[::-1][:self.migrants]
+            emigrants.append([(population[i], scores[i]) for i in best])
+
+        for island in range(self.n_islands):
+            incoming = [migrant for source in self.neighbors(island) for migrant in emigrants[source]]
+            # Never overwrite the island's own best individual
+            incoming = incoming[:self.pop_size - 1]
+            worst = np.argsort(fitness[island])[:len(incoming)]
+            for i, (ind, score) in zip(worst, incoming):
+                self.islands[island][i] = ind
+                fitness[island][i] = score
+
+    def solve(self):
+        """Run the island-model genetic algorithm."""
+        self.initialize_islands()
+        params = {"pop_size": self.pop_size, "mutation_rate": self.mutation_rate}
+        # Fitness of the current island populations (None until first scored)
+        fitness: List[Optional[np.ndarray]] = [None] * self.n_islands
+        gen = 0
+        self.termination.start()
+        self.evaluations = 0
+        self.stop_reason = None
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_island_worker,
+                                 initargs=(self.problem, params)) as pool:
+            while gen < self.generations:
+                epoch = min(self.migration_interval, self.generations - gen)
+                seeds = [random.getrandbits(32) for _ in range(self.n_islands)]
+                results = list(pool.map(_run_epoch, self.islands, fitness, [epoch] * self.n_islands, seeds))
+
+                self.islands = [population for population, _, _, _ in results]
+                fitness = [scores for _, scores, _, _ in results]
+                self.evaluations += sum(evaluations for _, _, _, evaluations in results)
+
+                # Merge per-island statistics into one history entry per generation
+                for g in range(epoch):
+                    island_stats = [stats[g] for _, _, stats, _ in results]
+                    island_best = [stat[0] for stat in island_stats]
+                    island_avg = [stat[1] for stat in island_stats]
+                    best_island = int(np.argmax(island_best))
+                    self.logger.log(gen + g + 1, island_best[best_island], float(np.mean(island_avg)),
+                                    island_stats[best_island][2],
+                                    gene_frequency=np.mean([stat[3] for stat in island_stats], axis=0),
+                                    island_best=island_best, island_avg=island_avg)
+                    if self.termination.should_stop(gen + g + 1, island_best[best_island], self.evaluations):
+                        self.stop_reason = self.termination.reason
+                        print(f"Stopped after generation {gen + g + 1}: {self.stop_reason}")
+                        break
+
+                gen += epoch
+                if self.stop_reason is not None:
+                    break
+                if gen < self.generations:
+                    self.migrate(fitness)
+
+        best_island = int(np.argmax([scores.max() for scores in fitness]))
+        return self.islands[best_island][int(np.argmax(fitness[best_island]))]
@@ -0,0 +1,122 @@
+"""Solver for Reinforcement Learning (Linear Q-Function Approximation)"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import random
+from typing import List, Optional, Tuple
+import numpy as np
+from rl_env import OneMaxVecEnv
+from .termination import Termination, never
+
+class LinearQSolver:
+    """
+    Q-Learning Solver with a linear Q-function over state-action features.
+
+    Instead of one table entry per state, ``Q(s, a) = w . phi(s, a)`` with
+    features shared by all bit positions, so the learned weights have a
+    fixed size however long the genome is:
+
+    - ``1`` (bias)
+    - ``x_a``: current value of the bit the action flips
+    - ``m``: share of ones in the state
+    - ``x_a * m``: interaction of the two
+
+    Training runs semi-gradient Q-learning on a `OneMaxVecEnv` observing the
+    state matrix (``index_states=False``): features, Q-values and the weight
+    update are computed for all environments and actions with NumPy.
+    Subclasses can override `features` for other problems. An optional
+    `Termination` is checked as in `RLSolver` (budgets while training, the
+    current fitness while solving).
+    """
+
+    N_FEATURES = 4
+
+    def __init__(self, env: OneMaxVecEnv, actions: List[int],
+                 alpha: float = 0.01, gamma: float = 0.9, epsilon: float = 0.1,
+                 termination: Optional[Termination] = None):
+        if env.index_states:
+            raise ValueError("LinearQSolver needs the state matrix; use index_states=False.")
+        self.env = env
+        self.actions = actions
+        self.alpha = alpha  # Learning rate
+        self.gamma = gamma  # Discount factor
+        self.epsilon = epsilon  # Exploration rate
+        self.termination = termination or never()
+        self.stop_reason: Optional[str] = None
+        self.weights = np.zeros(self.N_FEATURES)
+        self._actions = np.asarray(actions, dtype=np.int64)
+
+    def features(self, states: np.ndarray) -> np.ndarray:
+        """Feature tensor of shape ``(n_states, n_actions, N_FEATURES)`` for a batch of states."""
+        bits = states[:, self._actions].astype(np.float64)
+        share = np.broadcast_to(states.mean(axis=1, keepdims=True), bits.shape)
+        return np.stack([np.ones_like(bits), bits, share, bits * share], axis=-1)
+
+    def q_values(self, states: np.ndarray) -> np.ndarray:
+        """Q-values of every action for a batch of states, shape ``(n_states, n_actions)``."""
+        return self.features(states) @ self.weights
+
+    def choose_actions(self, states: np.ndarray, rng: np.random.Generator, epsilon: float) -> np.ndarray:
+        """Epsilon-greedy action columns for a batch of states."""
+        greedy = np.argmax(self.q_values(states), axis=1)
+        explore = rng.random(len(states)) < epsilon
+        return np.where(explore, rng.integers(0, len(self._actions), size=len(states)), greedy)
+
+    def train(self, episodes: int = 1000):
+        """Run Q-learning until `episodes` episodes have finished across all environments."""
+        print(f"Training for {episodes} episodes on {self.env.n_envs} environments...")
+        rng = np.random.default_rng(random.getrandbits(32))
+        rows = np.arange(self.env.n_envs)
+        finished = 0
+        steps = 0
+        self.termination.start()
+        self.stop_reason = None
+
+        states = self.env.reset()
+        while finished < episodes:
+            phi = self.features(states)
+            chosen = self.choose_actions(states, rng, self.epsilon)
+            next_states, rewards, dones = self.env.step(self._actions[chosen])
+
+            # Semi-gradient TD update; terminal states have no future value
+            phi_taken = phi[rows, chosen]
+            max_next_q = self.q_values(self.env.final_observations).max(axis=1)
+            targets = rewards + self.gamma * np.where(self.env.terminated, 0.0, max_next_q)
+            td_errors = targets - phi_taken @ self.weights
+            self.weights += self.alpha * (td_errors[:, None] * phi_taken).mean(axis=0)
+
+            states = next_states
+            for _ in range(int(dones.sum())):
+                if finished % 100 == 0:
+                    self.epsilon = max(0.01, self.epsilon * 0.99)
+                finished += 1
+
+            steps += self.env.n_envs
+            if self.termination.should_stop(finished, None, steps):
+                self.stop_reason = self.termination.reason
+                print(f"Training stopped after {finished} episodes: {self.stop_reason}")
+                break
+
+        print("Training complete.")
+
+    def solve(self, max_steps: int = 50) -> Tuple[List[int], List[List[int]]]:
+        """Run a greedy episode in the first environment; returns (final state, path of states)."""
+        rng = np.random.default_rng(random.getrandbits(32))
+        states = self.env.reset()
+        state = states[0].tolist()
+        fitness = self.env.current_fitness[0].item()
+        path = [state]
+        self.termination.start()
+        for step in range(1, max_steps + 1):
+            states, rewards, dones = self.env.step(self._actions[self.choose_actions(states, rng, 0.0)])
+            state = self.env.final_observations[0].tolist()
+            fitness += rewards[0].item()
+            path.append(state)
+            if dones[0]:
+                break
+            if self.termination.should_stop(step, fitness, step * self.env.n_envs):
+                self.stop_reason = self.termination.reason
+                break
+        return state, path
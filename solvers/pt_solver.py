@@ -0,0 +1,147 @@
+"""Solver for Parallel Tempering (Replica-Exchange Simulated Annealing)"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Tuple
+import numpy as np
+from problems import Problem
+from logger import Logger
+from .termination import Termination, never
+
+# Problem instance held by each replica worker (set once by the initializer)
+_worker_problem: Optional[Problem] = None
+
+def _init_replica_worker(problem: Problem):
+    global _worker_problem
+    _worker_problem = problem
+
+def _run_replica(individual: Any, temperature: float, steps: int, seed: int) -> Tuple[Any, float, int, Any, float]:
+    """
+    Run `steps` Metropolis single-bit-flip moves at a fixed temperature.
+
+    Returns:
+        (final individual, its fitness, accepted moves, best individual seen, best fitness)
+    """
+    random.seed(seed)
+    tracker = _worker_problem.tracker(individual)
+    best_solution, best_fitness = tracker.snapshot(), tracker.fitness
+    accepted = 0
+
+    for _ in range(steps):
+        index = random.randrange(_worker_problem.size)
+        neighbor_fitness = tracker.evaluate_flip(index)
+        delta_fitness = neighbor_fitness - tracker.fitness
+
+        if delta_fitness > 0 or random.random() < math.exp(delta_fitness / temperature):
+            tracker.apply_flip(index, neighbor_fitness)
+            accepted += 1
+            if neighbor_fitness > best_fitness:
+                best_solution, best_fitness = tracker.snapshot(), neighbor_fitness
+
+    return tracker.individual, tracker.fitness, accepted, best_solution, best_fitness
+
+class ParallelTemperingSolver:
+    """
+    Parallel Tempering (Replica-Exchange) Solver.
+
+    Runs `n_replicas` SA chains at a geometric ladder of fixed temperatures
+    between `min_temp` and `max_temp`, each in a worker process. After every
+    `sweep_steps` moves, states of neighboring temperatures are swapped with
+    the Metropolis criterion ``min(1, exp((f_j - f_i) * (1/T_i - 1/T_j)))``,
+    alternating even and odd pairs between rounds. Hot replicas explore,
+    cold replicas refine, and good states migrate down the ladder.
+
+    Each round logs the global best, the mean replica fitness, the per-replica
+    move acceptance rates and the per-pair swap acceptance rates. An optional
+    `Termination` is checked after every round.
+    """
+
+    def __init__(self, problem: Problem, logger: Logger,
+                 n_replicas: int = 4, min_temp: float = 0.5, max_temp: float = 50.0,
+                 sweep_steps: int = 100, rounds: int = 100, workers: Optional[int] = None,
+                 termination: Optional[Termination] = None):
+        self.problem = problem
+        self.logger = logger
+        self.n_replicas = n_replicas
+        self.sweep_steps = sweep_steps
+        self.rounds = rounds
+        self.workers = workers or n_replicas
+        self.termination = termination or never()
+        self.stop_reason: Optional[str] = None
+        self.rounds_run = 0
+        if n_replicas > 1:
+            ratio = max_temp / min_temp
+            self.temperatures = [min_temp * ratio ** (i / (n_replicas - 1)) for i in range(n_replicas)]
+        else:
+            self.temperatures = [min_temp]
+        self.states: List[Any] = []
+        self.fitness: List[float] = []
+        self.acceptance_rates: List[float] = []
+        self.swap_rates: List[float] = []
+        self.best_solution = None
+
+    def exchange(self, round_index: int, swap_attempts: List[int], swap_accepts: List[int]):
+        """Attempt state swaps between neighboring temperatures (even or odd pairs)."""
+        for i in range(round_index % 2, self.n_replicas - 1, 2):
+            j = i + 1
+            log_ratio = (self.fitness[j] - self.fitness[i]) * (1 / self.temperatures[i] - 1 / self.temperatures[j])
+            swap_attempts[i] += 1
+            if log_ratio >= 0 or random.random() < math.exp(log_ratio):
+                self.states[i], self.states[j] = self.states[j], self.states[i]
+                self.fitness[i], self.fitness[j] = self.fitness[j], self.fitness[i]
+                swap_accepts[i] += 1
+
+    def solve(self):
+        """Run parallel tempering."""
+        self.states = [self.problem.create_individual() for _ in range(self.n_replicas)]
+        self.fitness = [self.problem.evaluate(state) for state in self.states]
+        best_idx = int(np.argmax(self.fitness))
+        self.best_solution, best_fitness = self.states[best_idx], self.fitness[best_idx]
+
+        accepted_total = [0] * self.n_replicas
+        swap_attempts = [0] * (self.n_replicas - 1)
+        swap_accepts = [0] * (self.n_replicas - 1)
+        self.termination.start()
+        self.stop_reason = None
+        self.rounds_run = 0
+
+        print(f"Starting PT: {self.n_replicas} replicas, T={[round(t, 3) for t in self.temperatures]}")
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_replica_worker,
+                                 initargs=(self.problem,)) as pool:
+            for round_index in range(1, self.rounds + 1):
+                seeds = [random.getrandbits(32) for _ in range(self.n_replicas)]
+                results = list(pool.map(_run_replica, self.states, self.temperatures,
+                                        [self.sweep_steps] * self.n_replicas, seeds))
+
+                acceptance = []
+                for i, (state, fitness, accepted, replica_best, replica_best_fitness) in enumerate(results):
+                    self.states[i], self.fitness[i] = state, fitness
+                    accepted_total[i] += accepted
+                    acceptance.append(accepted / self.sweep_steps)
+                    if replica_best_fitness > best_fitness:
+                        self.best_solution, best_fitness = replica_best, replica_best_fitness
+
+                self.exchange(round_index, swap_attempts, swap_accepts)
+                swap_rates = [a / n if n else 0.0 for a, n in zip(swap_accepts, swap_attempts)]
+
+                self.logger.log(round_index, best_fitness, float(np.mean(self.fitness)),
+                                self.best_solution,
+                                acceptance=acceptance, swap_rate=swap_rates)
+
+                self.rounds_run = round_index
+                evaluations = self.n_replicas * (1 + self.sweep_steps * round_index)
+                if self.termination.should_stop(round_index, best_fitness, evaluations):
+                    self.stop_reason = self.termination.reason
+                    print(f"Stopped after round {round_index}: {self.stop_reason}")
+                    break
+
+        total_steps = self.sweep_steps * self.rounds_run
+        self.acceptance_rates = [a / total_steps for a in accepted_total]
+        self.swap_rates = [a / n if n else 0.0 for a, n in zip(swap_accepts, swap_attempts)]
+        return self.best_solution
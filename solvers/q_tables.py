@@ -0,0 +1,225 @@
+"""Q-Table Backends for Tabular Q-Learning"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+import numpy as np
+from problems.packed import pack
+
+# Largest dense table `make_q_table` allocates in "auto" mode (16 MiB: up
+# to 17-bit OneMax states); bigger tables need backend="dense"
+DENSE_MAX_BYTES = 1 << 24
+
+# Bit sequences up to this many genes are folded into an int in Python;
+# longer ones (and all NumPy arrays) go through np.packbits, which is faster
+FOLD_MAX_GENES = 24
+
+class QTable(ABC):
+    """
+    Abstract Q-value store indexed by (state, action column).
+
+    States are encoded as integer indices: ints (index or bit-packed states)
+    are used as is, bit sequences are folded into an int with gene i as bit
+    i. Action columns are positions in the solver's action list.
+    """
+
+    def __init__(self, n_actions: int):
+        self.n_actions = n_actions
+
+    @staticmethod
+    def encode(state: Any) -> int:
+        """Integer index of a state."""
+        if type(state) is int:
+            return state
+        if isinstance(state, np.ndarray) or len(state) > FOLD_MAX_GENES:
+            return pack(state)
+        index = 0
+        for bit in reversed(state):
+            index = (index << 1) | int(bit)
+        return index
+
+    @abstractmethod
+    def row(self, index: int) -> np.ndarray:
+        """Q-values of all actions in state `index` (read-only view for unseen states)."""
+        pass
+
+    @abstractmethod
+    def update(self, index: int, column: int, value: float):
+        """Set the Q-value of action `column` in state `index`."""
+        pass
+
+    def get(self, index: int, column: int) -> float:
+        return float(self.row(index)[column])
+
+    def max_value(self, index: int) -> float:
+        return float(self.row(index).max())
+
+    def best_action(self, index: int) -> int:
+        """Greedy action column (ties go to the lowest column)."""
+        return int(np.argmax(self.row(index)))
+
+    def learn(self, index: int, column: int, reward: float, next_index: int, alpha: float, gamma: float):
+        """Q-learning update of (`index`, `column`) towards `reward` plus the discounted best value of `next_index`."""
+        old_q = self.get(index, column)
+        self.update(index, column, old_q + alpha * (reward + gamma * self.max_value(next_index) - old_q))
+
+    # Batched variants over arrays of state indices (and action columns)
+
+    def get_many(self, indices: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        return np.array([self.get(i, c) for i, c in zip(indices.tolist(), columns.tolist())], dtype=np.float32)
+
+    def max_many(self, indices: np.ndarray) -> np.ndarray:
+        return np.array([self.max_value(i) for i in indices.tolist()], dtype=np.float32)
+
+    def best_many(self, indices: np.ndarray) -> np.ndarray:
+        return np.array([self.best_action(i) for i in indices.tolist()], dtype=np.int64)
+
+    def update_many(self, indices: np.ndarray, columns: np.ndarray, values: np.ndarray):
+        """Set several Q-values; for repeated (state, action) pairs the last value wins."""
+        for i, c, v in zip(indices.tolist(), columns.tolist(), values.tolist()):
+            self.update(i, c, v)
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Memory held by the Q-values."""
+        pass
+
+class DenseQTable(QTable):
+    """
+    Q-table preallocated as one ``(n_states, n_actions)`` `float32` array.
+
+    Args:
+        n_states: Number of states (2 ** size for binary states)
+        n_actions: Number of actions
+    """
+
+    def __init__(self, n_states: int, n_actions: int):
+        super().__init__(n_actions)
+        self.values = np.zeros((n_states, n_actions), dtype=np.float32)
+        # Per-state greedy action and its value, kept in sync by `update` so
+        # the max/argmax of a row is a lookup rather than a scan
+        self.best_actions = np.zeros(n_states, dtype=np.int32)
+        self.best_values = np.zeros(n_states, dtype=np.float32)
+
+    def row(self, index: int) -> np.ndarray:
+        return self.values[index]
+
+    def get(self, index: int, column: int) -> float:
+        return self.values.item(index, column)
+
+    def max_value(self, index: int) -> float:
+        return self.best_values.item(index)
+
+    def best_action(self, index: int) -> int:
+        return self.best_actions.item(index)
+
+    def learn(self, index: int, column: int, reward: float, next_index: int, alpha: float, gamma: float):
+        # Inlined reads: this runs once per training step
+        old_q = self.values.item(index, column)
+        self.update(index, column, old_q + alpha * (reward + gamma * self.best_values.item(next_index) - old_q))
+
+    def update(self, index: int, column: int, value: float):
+        self.values[index, column] = value
+        value = self.values.item(index, column)  # rounded to float32
+        best = self.best_actions.item(index)
+        best_value = self.best_values.item(index)
+        if column == best and value < best_value:
+            # The greedy action got worse: rescan the row
+            best = int(np.argmax(self.values[index]))
+            self.best_actions[index] = best
+            self.best_values[index] = self.values[index, best]
+        elif column == best or value > best_value or (value == best_value and column < best):
+            self.best_actions[index] = column
+            self.best_values[index] = value
+
+    def get_many(self, indices: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        return self.values[indices, columns]
+
+    def max_many(self, indices: np.ndarray) -> np.ndarray:
+        return self.best_values[indices]
+
+    def best_many(self, indices: np.ndarray) -> np.ndarray:
+        return self.best_actions[indices].astype(np.int64)
+
+    def update_many(self, indices: np.ndarray, columns: np.ndarray, values: np.ndarray):
+        self.values[indices, columns] = values
+        rows = np.unique(indices)
+        self.best_actions[rows] = np.argmax(self.values[rows], axis=1)
+        self.best_values[rows] = self.values[rows, self.best_actions[rows]]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.best_actions.nbytes + self.best_values.nbytes
+
+class SparseQTable(QTable):
+    """
+    Hashed Q-table for state spaces too large to preallocate.
+
+    Rows are `float32` arrays keyed by integer state index and allocated on
+    the first update; unseen states read as zeros.
+
+    Args:
+        n_actions: Number of actions
+    """
+
+    def __init__(self, n_actions: int):
+        super().__init__(n_actions)
+        self.values: Dict[int, np.ndarray] = {}
+        self._zeros = np.zeros(n_actions, dtype=np.float32)
+        self._zeros.flags.writeable = False
+
+    def row(self, index: int) -> np.ndarray:
+        return self.values.get(index, self._zeros)
+
+    def best_action(self, index: int) -> int:
+        row = self.values.get(index)
+        return 0 if row is None else row.argmax().item()
+
+    def learn(self, index: int, column: int, reward: float, next_index: int, alpha: float, gamma: float):
+        next_row = self.values.get(next_index)
+        max_next_q = next_row.max().item() if next_row is not None else 0.0
+        row = self.values.get(index)
+        if row is None:
+            row = self.values[index] = np.zeros(self.n_actions, dtype=np.float32)
+        old_q = row.item(column)
+        row[column] = old_q + alpha * (reward + gamma * max_next_q - old_q)
+
+    def update(self, index: int, column: int, value: float):
+        row = self.values.get(index)
+        if row is None:
+            row = self.values[index] = np.zeros(self.n_actions, dtype=np.float32)
+        row[column] = value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.values) * self._zeros.nbytes
+
+Q_TABLES = ("auto", "dense", "sparse")
+
+def make_q_table(n_actions: int, n_states: Optional[int] = None, backend: str = "auto",
+                 max_bytes: int = DENSE_MAX_BYTES) -> QTable:
+    """
+    Create a Q-table backend.
+
+    ``auto`` preallocates a `DenseQTable` when the number of states is known
+    and the table fits in `max_bytes`, and falls back to a `SparseQTable`.
+    """
+    if backend not in Q_TABLES:
+        raise ValueError(f"Unknown Q-table backend '{backend}'. Choose from {list(Q_TABLES)}.")
+    # float32 values plus the cached greedy action (int32) and value (float32) per state
+    fits = n_states is not None and n_states * (n_actions + 2) * 4 <= max_bytes
+    if backend == "dense" and n_states is None:
+        raise ValueError("A dense Q-table needs the number of states.")
+    if backend == "dense" or (backend == "auto" and fits):
+        return DenseQTable(n_states, n_actions)
+    return SparseQTable(n_actions)
@@ -1,89 +1,206 @@
 """Solver for Reinforcement Learning (Q-Learning)"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
 import random
-from typing import Dict, Tuple, List, Any
-from rl_env import RLEnvironment
+from typing import List, Any, Dict, Optional
+import numpy as np
+from rl_env import RLEnvironment, OneMaxVecEnv
+from profiling import NULL_PROFILER, Profiler
+from checkpoint import Checkpointer
+from .q_tables import make_q_table
+from .termination import Termination, never
 
 class RLSolver:
-    """Tabular Q-Learning Solver."""
+    """
+    Tabular Q-Learning Solver.
+
+    Q-values live in a `QTable` backend (see q_tables.py): states are encoded
+    as integer indices and each state's action values are one `float32` row.
+    ``dense`` preallocates all rows (needs the number of states, taken from
+    `env.n_states` if not given), ``sparse`` hashes visited states only, and
+    ``auto`` picks dense whenever the table fits in memory.
+
+    An optional `Profiler` times the action choice, environment step and
+    Q-update phases of `train` and counts episodes and steps.
+
+    An optional `Termination` is checked after every training episode (or
+    batched step) with the number of environment steps as the evaluation
+    count; training has no best fitness, so only budget criteria apply there.
+    `solve` checks it after every greedy step with the current fitness.
+
+    With a `Checkpointer`, `train` saves the Q-table, epsilon and episode
+    count every few episodes; after `set_state` the next `train()` continues
+    with the remaining episodes.
+    """
     
     def __init__(self, env: RLEnvironment, actions: List[int], 
-                 alpha: float = 0.1, gamma: float = 0.9, epsilon: float = 0.1):
+                 alpha: float = 0.1, gamma: float = 0.9, epsilon: float = 0.1,
+                 backend: str = "auto", n_states: Optional[int] = None, profiler: Optional[Profiler] = None,
+                 termination: Optional[Termination] = None, checkpointer: Optional[Checkpointer] = None):
         self.env = env
         self.actions = actions
         self.alpha = alpha  # Learning rate
         self.gamma = gamma  # Discount factor
         self.epsilon = epsilon  # Exploration rate
-        self.q_table: Dict[Tuple[int, ...], Dict[int, float]] = {}
+        self.q_table = make_q_table(len(actions), n_states or getattr(env, "n_states", None), backend)
+        self._columns = {action: column for column, action in enumerate(actions)}
+        self.profiler = profiler or NULL_PROFILER
+        self.termination = termination or never()
+        self.checkpointer = checkpointer
+        self.stop_reason: Optional[str] = None
+        self.episode = 0
+        self.steps = 0
+        self._resumed = False
 
-    def get_q(self, state: Tuple[int, ...], action: int) -> float:
-        if state not in self.q_table:
-            self.q_table[state] = {a: 0.0 for a in self.actions}
-        return self.q_table[state][action]
+    def get_q(self, state: Any, action: int) -> float:
+        return self.q_table.get(self.q_table.encode(state), self._columns[action])
 
-    def update_q(self, state: Tuple[int, ...], action: int, reward: float, next_state: Tuple[int, ...]):
-        old_q = self.get_q(state, action)
-        
-        # Max Q for next state
-        if next_state not in self.q_table:
-            self.q_table[next_state] = {a: 0.0 for a in self.actions}
-        max_next_q = max(self.q_table[next_state].values())
-        
-        # Q-learning update rule
-        new_q = old_q + self.alpha * (reward + self.gamma * max_next_q - old_q)
-        self.q_table[state][action] = new_q
+    def update_q(self, state: Any, action: int, reward: float, next_state: Any):
+        # Q-learning update rule: Q += alpha * (reward + gamma * max Q(next) - Q)
+        encode = self.q_table.encode
+        self.q_table.learn(encode(state), self._columns[action], reward, encode(next_state), self.alpha, self.gamma)
 
-    def choose_action(self, state: Tuple[int, ...]) -> int:
+    def choose_action(self, state: Any) -> int:
         if random.random() < self.epsilon:
             return random.choice(self.actions)
         else:
             # Exploitation: best action
-            if state not in self.q_table:
-                self.q_table[state] = {a: 0.0 for a in self.actions}
-            return max(self.q_table[state], key=self.q_table[state].get)
+            return self.actions[self.q_table.best_action(self.q_table.encode(state))]
+
+    def get_state(self) -> Dict[str, Any]:
+        """Q-table, exploration rate and training progress (finished episodes, steps)."""
+        return {"q_table": self.q_table, "epsilon": self.epsilon, "episode": self.episode, "steps": self.steps}
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore a state from `get_state`; the next `train()` resumes from it."""
+        self.q_table = state["q_table"]
+        self.epsilon = state["epsilon"]
+        self.episode = state["episode"]
+        self.steps = state["steps"]
+        self._resumed = True
 
     def train(self, episodes: int = 1000, max_steps: int = 50):
-        print(f"Training for {episodes} episodes...")
-        for ep in range(episodes):
-            state = self.env.reset()
+        if not self._resumed:
+            self.episode = 0
+            self.steps = 0
+        self._resumed = False
+        print(f"Training for {episodes - self.episode} episodes...")
+        profiler = self.profiler
+        self.termination.start()
+        self.stop_reason = None
+        steps = self.steps
+        choose_action, env_step, update_q = self.choose_action, self.env.step, self.update_q
+        # Phase contexts are reusable, so bind them once instead of per step
+        choose_phase = profiler.phase("choose_action")
+        step_phase = profiler.phase("env_step")
+        update_phase = profiler.phase("update")
+        for ep in range(self.episode, episodes):
+            with profiler.phase("reset"):
+                state = self.env.reset()
+            profiler.count("episodes")
             total_reward = 0
+            episode_start = steps
             
             for _ in range(max_steps):
-                action = self.choose_action(state)
-                next_state, reward, done = self.env.step(action)
+                with choose_phase:
+                    action = choose_action(state)
+                with step_phase:
+                    next_state, reward, done = env_step(action)
                 
-                self.update_q(state, action, reward, next_state)
+                with update_phase:
+                    update_q(state, action, reward, next_state)
+                steps += 1
                 
                 state = next_state
                 total_reward += reward
                 
                 if done:
                     break
+            profiler.count("steps", steps - episode_start)
             
             # Decay epsilon (optional)
             if ep % 100 == 0:
                 self.epsilon = max(0.01, self.epsilon * 0.99)
+            
+            self.episode, self.steps = ep + 1, steps
+            if self.checkpointer is not None and self.checkpointer.due(ep + 1):
+                self.checkpointer.save(self, ep + 1)
+            
+            if self.termination.should_stop(ep + 1, None, steps):
+                self.stop_reason = self.termination.reason
+                print(f"Training stopped after episode {ep + 1}: {self.stop_reason}")
+                break
                 
         print("Training complete.")
 
+    def train_vectorized(self, env: OneMaxVecEnv, episodes: int = 1000):
+        """
+        Q-learning over a batch of environments stepped together.
+
+        `env` must observe integer state indices (``index_states=True``) and
+        end episodes after its own `max_steps`. Each step chooses epsilon-
+        greedy actions, applies the Q-learning update for all environments at
+        once and continues until `episodes` episodes have finished. Epsilon
+        decays every 100 finished episodes, as in `train`.
+        """
+        if not env.index_states:
+            raise ValueError("train_vectorized needs a vectorized environment with index_states=True.")
+        print(f"Training for {episodes} episodes on {env.n_envs} environments...")
+        rng = np.random.default_rng(random.getrandbits(32))
+        actions = np.asarray(self.actions, dtype=np.int64)
+        finished = 0
+        steps = 0
+        self.termination.start()
+        self.stop_reason = None
+
+        states = env.reset()
+        while finished < episodes:
+            # Epsilon-greedy action columns for all environments
+            explore = rng.random(env.n_envs) < self.epsilon
+            chosen = np.where(explore, rng.integers(0, len(actions), size=env.n_envs), self.q_table.best_many(states))
+            next_states, rewards, dones = env.step(actions[chosen])
+
+            # Bootstrap from the state each environment reached, before any auto-reset
+            old_q = self.q_table.get_many(states, chosen)
+            max_next_q = self.q_table.max_many(env.final_observations)
+            new_q = old_q + self.alpha * (rewards + self.gamma * max_next_q - old_q)
+            self.q_table.update_many(states, chosen, new_q)
+
+            states = next_states
+            for _ in range(int(dones.sum())):
+                if finished % 100 == 0:
+                    self.epsilon = max(0.01, self.epsilon * 0.99)
+                finished += 1
+
+            steps += env.n_envs
+            if self.termination.should_stop(finished, None, steps):
+                self.stop_reason = self.termination.reason
+                print(f"Training stopped after {finished} episodes: {self.stop_reason}")
+                break
+
+        print("Training complete.")
+
     def solve(self, max_steps: int = 50) -> Any:
         # Run a greedy episode without exploration
         state = self.env.reset()
         original_epsilon = self.epsilon
         self.epsilon = 0  # Force exploitation
         
+        self.termination.start()
         path = [state]
-        for _ in range(max_steps):
+        for step in range(1, max_steps + 1):
             action = self.choose_action(state)
             next_state, _, done = self.env.step(action)
             state = next_state
             path.append(state)
             if done:
                 break
+            if self.termination.should_stop(step, getattr(self.env, "current_fitness", None), step):
+                self.stop_reason = self.termination.reason
+                break
         
         self.epsilon = original_epsilon
         return state, path
@@ -1,54 +1,106 @@
 """Solver for Simulated Annealing"""
 
-__version__ = "0.5.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-24"
+__date__ = "2026-10-17"
 
 import random
 import math
-from typing import List, Any
+from typing import Any, Dict, Optional
 from problems import Problem
 from logger import Logger
+from profiling import NULL_PROFILER, Profiler
+from checkpoint import Checkpointer
+from .termination import Termination, never
 
 class SASolver:
-    """Simulated Annealing Solver."""
+    """
+    Simulated Annealing Solver.
+
+    An optional `Profiler` times the neighbor (propose and score a move),
+    acceptance and logging phases and counts evaluations and accepted moves.
+    Besides cooling and `max_steps`, an optional `Termination` is checked
+    after every step.
+
+    With a `Checkpointer`, the step, temperature and current/best solutions
+    are saved every few steps; after `set_state` the next `solve()`
+    continues from them (re-scoring only the current solution).
+    """
 
     def __init__(self, problem: Problem, logger: Logger, 
                  initial_temp: float = 100.0, cooling_rate: float = 0.95, 
-                 min_temp: float = 0.01, max_steps: int = 1000):
+                 min_temp: float = 0.01, max_steps: int = 1000, profiler: Optional[Profiler] = None,
+                 termination: Optional[Termination] = None, checkpointer: Optional[Checkpointer] = None):
         self.problem = problem
         self.logger = logger
+        self.profiler = profiler or NULL_PROFILER
+        self.termination = termination or never()
+        self.checkpointer = checkpointer
+        self.stop_reason: Optional[str] = None
         self.initial_temp = initial_temp
         self.cooling_rate = cooling_rate
         self.min_temp = min_temp
         self.max_steps = max_steps
         self.current_solution = None
         self.best_solution = None
+        self.best_fitness = None
+        self.step = 0
+        self.temp = initial_temp
+        self._resumed = False
+
+    def get_state(self) -> Dict[str, Any]:
+        """Completed steps, current temperature and the current and best solutions."""
+        return {
+            "step": self.step,
+            "temp": self.temp,
+            "current_solution": self.current_solution,
+            "best_solution": self.best_solution,
+            "best_fitness": self.best_fitness,
+        }
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore a state from `get_state`; the next `solve()` resumes from it."""
+        self.step = state["step"]
+        self.temp = state["temp"]
+        self.current_solution = state["current_solution"]
+        self.best_solution = state["best_solution"]
+        self.best_fitness = state["best_fitness"]
+        self._resumed = True
 
     def solve(self):
-        """Run the Simulated Annealing algorithm."""
-        # Initialize
-        self.current_solution = self.problem.create_individual()
-        self.best_solution = self.current_solution
-        
-        current_fitness = self.problem.evaluate(self.current_solution)
-        best_fitness = current_fitness
-        
-        temp = self.initial_temp
-        step = 0
+        """Run the Simulated Annealing algorithm (or resume it after `set_state`)."""
+        # Initialize: the tracker keeps the current solution and the running
+        # totals needed to score single-bit moves in O(1)
+        if self._resumed:
+            tracker = self.problem.tracker(self.current_solution)
+            best_fitness = self.best_fitness
+            temp = self.temp
+            step = self.step
+        else:
+            tracker = self.problem.tracker(self.problem.create_individual())
+            self.best_solution = tracker.snapshot()
+            best_fitness = tracker.fitness
+            temp = self.initial_temp
+            step = 0
+        self._resumed = False
+        self.current_solution = tracker.individual
+        current_fitness = tracker.fitness
+        checkpointer = self.checkpointer
         
         print(f"Starting SA: T={temp}, Max Steps={self.max_steps}")
+        profiler = self.profiler
+        self.termination.start()
+        self.stop_reason = None
 
         while temp > self.min_temp and step < self.max_steps:
             step += 1
             
-            # Generate neighbor (mutate 1 bit effectively)
-            # For SA we typically want a small change. The mutation rate for OneMax 
-            # usually flips bits with a prob. Here we'll ensure at least one change or use standard mutation behavior.
-            # Let's use the problem's mutate with a rate equivalent to 1/size to flip ~1 bit.
-            mutation_rate = 1.0 / len(self.current_solution)
-            neighbor = self.problem.mutate(self.current_solution, mutation_rate)
-            neighbor_fitness = self.problem.evaluate(neighbor)
+            # Generate neighbor: flip a single random bit and score the move
+            # incrementally instead of re-evaluating the whole genome.
+            with profiler.phase("neighbor"):
+                index = random.randrange(self.problem.size)
+                neighbor_fitness = tracker.evaluate_flip(index)
+            profiler.count("evaluate")
             
             # Calculate energy delta (we want to maximize fitness, so E = -Fitness)
             # Delta E = E_new - E_old = (-f_new) - (-f_old) = f_old - f_new
@@ -57,19 +109,35 @@ class SASolver:
             
             delta_fitness = neighbor_fitness - current_fitness
             
-            if delta_fitness > 0 or random.random() < math.exp(delta_fitness / temp):
-                self.current_solution = neighbor
-                current_fitness = neighbor_fitness
-                
-                if current_fitness > best_fitness:
-                    self.best_solution = self.current_solution
-                    best_fitness = current_fitness
+            with profiler.phase("acceptance"):
+                if delta_fitness > 0 or random.random() < math.exp(delta_fitness / temp):
+                    tracker.apply_flip(index, neighbor_fitness)
+                    current_fitness = neighbor_fitness
+                    profiler.count("accepted")
+                    
+                    if current_fitness > best_fitness:
+                        self.best_solution = tracker.snapshot()
+                        best_fitness = current_fitness
             
             # Logging (log every step or periodically? existing logger expects generations)
             # We'll treat 'step' as 'generation' for consistency with visualizer
-            self.logger.log(step, best_fitness, current_fitness, self.best_solution)
+            with profiler.phase("logging"):
+                self.logger.log(step, best_fitness, current_fitness, self.best_solution)
+            
+            # One evaluation for the initial solution plus one per move
+            if self.termination.should_stop(step, best_fitness, step + 1):
+                self.stop_reason = self.termination.reason
+                print(f"Stopped after step {step}: {self.stop_reason}")
+                break
             
             # Cool down
             temp *= self.cooling_rate
             
+            if checkpointer is not None and checkpointer.due(step):
+                self.step, self.temp, self.best_fitness = step, temp, best_fitness
+                self.current_solution = tracker.individual
+                checkpointer.save(self, step)
+            
+        self.step, self.temp, self.best_fitness = step, temp, best_fitness
+        self.current_solution = tracker.individual
         return self.best_solution
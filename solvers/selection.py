@@ -0,0 +1,113 @@
+"""Batched Parent Selection Operators"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import numpy as np
+
+def tournament(fitness: np.ndarray, count: int, rng: np.random.Generator, size: int = 3) -> np.ndarray:
+    """
+    k-tournament selection: `count` tournaments of `size` distinct random contenders.
+
+    Contenders of one tournament are drawn without replacement (as
+    `random.sample` would), column by column for all tournaments at once.
+
+    Returns:
+        Indices of the `count` winners
+    """
+    n = len(fitness)
+    if size > n:
+        raise ValueError(f"Tournament size {size} exceeds the population size {n}.")
+    contenders = np.empty((count, size), dtype=np.int64)
+    for j in range(size):
+        # Uniform over the n - j individuals not drawn yet: step over the
+        # earlier contenders of each row in increasing order
+        picks = rng.integers(0, n - j, size=count)
+        for drawn in np.sort(contenders[:, :j], axis=1).T:
+            picks += picks >= drawn
+        contenders[:, j] = picks
+    winners = np.argmax(fitness[contenders], axis=1)
+    return contenders[np.arange(count), winners]
+
+def _selection_weights(fitness: np.ndarray) -> np.ndarray:
+    """Non-negative selection weights: fitness shifted up when it has negative values."""
+    weights = np.asarray(fitness, dtype=float)
+    low = weights.min()
+    return weights - low if low < 0 else weights
+
+def _spin(cumulative: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Wheel slots hit by `points` in `[0, total)` (clamped in case rounding reaches the total)."""
+    picks = np.searchsorted(cumulative, points, side='right')
+    return np.minimum(picks, len(cumulative) - 1, out=picks)
+
+def roulette(fitness: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Fitness-proportionate selection: `count` independent spins of one wheel.
+
+    The wheel is the cumulative fitness; each spin is a `searchsorted` into
+    it. Populations whose fitness is all zero are sampled uniformly.
+    """
+    cumulative = np.cumsum(_selection_weights(fitness))
+    total = cumulative[-1]
+    if total <= 0:
+        return rng.integers(0, len(fitness), size=count)
+    return _spin(cumulative, rng.random(count) * total)
+
+def sus(fitness: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Stochastic universal sampling: `count` evenly spaced pointers on one wheel.
+
+    A single random offset places all pointers, so every individual is picked
+    within one of its expected number of times. The picks are shuffled so
+    that consecutive parents are not neighbours on the wheel.
+    """
+    cumulative = np.cumsum(_selection_weights(fitness))
+    total = cumulative[-1]
+    if total <= 0:
+        return rng.integers(0, len(fitness), size=count)
+    step = total / count
+    pointers = (rng.random() + np.arange(count)) * step
+    return rng.permutation(_spin(cumulative, pointers))
+
+def rank(fitness: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Linear rank selection: roulette over ranks (worst = 1, best = pop size).
+
+    Selection pressure depends only on the order of the fitness values, not on
+    their scale.
+    """
+    ranks = np.empty(len(fitness))
+    ranks[np.argsort(fitness, kind='stable')] = np.arange(1, len(fitness) + 1)
+    return roulette(ranks, count, rng)
+
+SELECTIONS = {
+    "tournament": tournament,
+    "roulette": roulette,
+    "sus": sus,
+    "rank": rank,
+}
+
+def select(method: str, fitness: np.ndarray, count: int, rng: np.random.Generator,
+           tournament_size: int = 3) -> np.ndarray:
+    """
+    Pick `count` parents from a population's fitness array in one batched call.
+
+    Args:
+        method: One of `SELECTIONS` ("tournament", "roulette", "sus", "rank")
+        fitness: 1D fitness array in population order
+        count: Number of parents to select
+        rng: NumPy generator supplying the randomness
+        tournament_size: Contenders per tournament (tournament selection only)
+
+    Returns:
+        `count` population indices
+    """
+    if method == "tournament":
+        return tournament(fitness, count, rng, tournament_size)
+    return SELECTIONS[method](fitness, count, rng)
+
+def check_selection(method: str):
+    """Raise ValueError for an unknown selection method."""
+    if method not in SELECTIONS:
+        raise ValueError(f"Unknown selection '{method}'. Choose from {list(SELECTIONS)}.")
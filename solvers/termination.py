@@ -0,0 +1,126 @@
+"""Termination Criteria for Solvers"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+class Termination(ABC):
+    """
+    Stopping rule checked by solvers once per iteration.
+
+    Solvers call `start()` when a run begins and then `should_stop()` after
+    every generation / step / round with the iteration number, the best
+    fitness so far and the number of fitness evaluations spent. When it
+    returns True, `reason` describes why.
+    """
+
+    def __init__(self):
+        self.reason: Optional[str] = None
+
+    def start(self):
+        """Reset the criterion for a new run."""
+        self.reason = None
+
+    @abstractmethod
+    def should_stop(self, iteration: int, best_fitness: Optional[float], evaluations: int) -> bool:
+        pass
+
+class TargetFitness(Termination):
+    """Stop once the best fitness reaches `target` (e.g. a known optimum)."""
+
+    def __init__(self, target: float):
+        super().__init__()
+        self.target = target
+
+    def should_stop(self, iteration: int, best_fitness: Optional[float], evaluations: int) -> bool:
+        if best_fitness is not None and best_fitness >= self.target:
+            self.reason = f"target fitness {self.target} reached"
+            return True
+        return False
+
+class Stagnation(Termination):
+    """Stop after `patience` iterations without the best fitness improving by more than `min_delta`."""
+
+    def __init__(self, patience: int, min_delta: float = 0.0):
+        super().__init__()
+        self.patience = patience
+        self.min_delta = min_delta
+        self.best: Optional[float] = None
+        self.since_improvement = 0
+
+    def start(self):
+        super().start()
+        self.best = None
+        self.since_improvement = 0
+
+    def should_stop(self, iteration: int, best_fitness: Optional[float], evaluations: int) -> bool:
+        if best_fitness is None:
+            return False
+        if self.best is None or best_fitness > self.best + self.min_delta:
+            self.best = best_fitness
+            self.since_improvement = 0
+            return False
+        self.since_improvement += 1
+        if self.since_improvement >= self.patience:
+            self.reason = f"no improvement for {self.patience} iterations"
+            return True
+        return False
+
+class TimeLimit(Termination):
+    """Stop once `seconds` of wall-clock time have passed since `start()`."""
+
+    def __init__(self, seconds: float):
+        super().__init__()
+        self.seconds = seconds
+        self.started = time.perf_counter()
+
+    def start(self):
+        super().start()
+        self.started = time.perf_counter()
+
+    def should_stop(self, iteration: int, best_fitness: Optional[float], evaluations: int) -> bool:
+        if time.perf_counter() - self.started >= self.seconds:
+            self.reason = f"time limit of {self.seconds}s reached"
+            return True
+        return False
+
+class MaxEvaluations(Termination):
+    """Stop once `limit` fitness evaluations have been spent."""
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+
+    def should_stop(self, iteration: int, best_fitness: Optional[float], evaluations: int) -> bool:
+        if evaluations >= self.limit:
+            self.reason = f"evaluation budget of {self.limit} reached"
+            return True
+        return False
+
+class AnyOf(Termination):
+    """Stop as soon as any of `criteria` is met (never, when empty)."""
+
+    def __init__(self, criteria: Optional[List[Termination]] = None):
+        super().__init__()
+        self.criteria = list(criteria or [])
+
+    def start(self):
+        super().start()
+        for criterion in self.criteria:
+            criterion.start()
+
+    def should_stop(self, iteration: int, best_fitness: Optional[float], evaluations: int) -> bool:
+        # Every criterion sees every iteration, so stateful ones (stagnation) stay up to date
+        stopped = [c for c in self.criteria if c.should_stop(iteration, best_fitness, evaluations)]
+        if stopped:
+            self.reason = stopped[0].reason
+            return True
+        return False
+
+def never() -> AnyOf:
+    """Criterion that never stops a run (the default for every solver)."""
+    return AnyOf()
@@ -0,0 +1,109 @@
+"""Solver for Genetic Algorithm (array-backed, vectorized)"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+from typing import List, Optional
+import numpy as np
+from problems import Problem
+from problems.mutation import flip_batch
+from logger import Logger
+from .selection import check_selection, select
+from .termination import Termination, never
+
+class VectorizedGASolver:
+    """Genetic Algorithm Solver operating on a 2D population matrix.
+
+    The population is stored as one ``(pop_size, size)`` ``uint8`` array and
+    every generation is produced with batched NumPy operations: parent
+    selection (any method from `solvers/selection.py`, tournament by
+    default), single-point crossover, bit-flip mutation and elitism. It is
+    restricted to binary problems exposing a ``size`` attribute (OneMax,
+    Knapsack) and follows the same contract as the list-based ``Solver``,
+    including the optional `Termination` checked after every generation.
+    """
+
+    def __init__(self, problem: Problem, logger: Logger,
+                 pop_size: int = 50, mutation_rate: float = 0.01, generations: int = 100,
+                 tournament_size: int = 3, seed: Optional[int] = None,
+                 termination: Optional[Termination] = None, selection: str = "tournament"):
+        check_selection(selection)
+        if problem.packed:
+            raise ValueError("VectorizedGASolver stores its own uint8 population matrix; use an unpacked problem.")
+        self.problem = problem
+        self.logger = logger
+        self.pop_size = pop_size
+        self.mutation_rate = mutation_rate
+        self.generations = generations
+        self.tournament_size = tournament_size
+        self.selection = selection
+        self.rng = np.random.default_rng(seed)
+        self.termination = termination or never()
+        self.population: np.ndarray = np.empty((0, problem.size), dtype=np.uint8)
+        self.evaluations = 0
+        self.stop_reason: Optional[str] = None
+
+    def initialize_population(self):
+        """Initialize the population matrix with random bits."""
+        self.population = self.rng.integers(0, 2, size=(self.pop_size, self.problem.size), dtype=np.uint8)
+
+    def evaluate_population(self) -> np.ndarray:
+        """Return the fitness of every row of the population."""
+        self.evaluations += len(self.population)
+        return self.problem.evaluate_batch(self.population)
+
+    def select_parents(self, fitness_scores: np.ndarray, count: int) -> np.ndarray:
+        """Select `count` parents at once, returns row indices."""
+        return select(self.selection, fitness_scores, count, self.rng, self.tournament_size)
+
+    def crossover(self, parents1: np.ndarray, parents2: np.ndarray):
+        """Single-point crossover applied row-wise to two parent matrices."""
+        size = self.problem.size
+        points = self.rng.integers(1, size, size=(len(parents1), 1))
+        mask = np.arange(size) < points
+        children1 = np.where(mask, parents1, parents2)
+        children2 = np.where(mask, parents2, parents1)
+        return children1, children2
+
+    def mutate(self, children: np.ndarray) -> np.ndarray:
+        """Flip each bit of the matrix with probability `mutation_rate` (sampling only the flipped cells)."""
+        return flip_batch(children, self.mutation_rate, self.rng)
+
+    def solve(self) -> List[int]:
+        """Run the genetic algorithm."""
+        self.initialize_population()
+        self.termination.start()
+        self.evaluations = 0
+        self.stop_reason = None
+        # Elite plus ceil((pop_size - 1) / 2) crossover pairs fills the next generation
+        n_pairs = self.pop_size // 2
+
+        for gen in range(1, self.generations + 1):
+            # Evaluation
+            fitness_scores = self.evaluate_population()
+            best_idx = int(np.argmax(fitness_scores))
+            best_fitness = fitness_scores[best_idx].item()
+            avg_fitness = float(fitness_scores.mean())
+            best_ind = self.population[best_idx].copy()
+
+            # Logging
+            self.logger.log(gen, best_fitness, avg_fitness, best_ind.tolist(), population=self.population)
+
+            if self.termination.should_stop(gen, best_fitness, self.evaluations):
+                self.stop_reason = self.termination.reason
+                print(f"Stopped after generation {gen}: {self.stop_reason}")
+                break
+
+            # Selection and Reproduction for the whole generation at once
+            parent_idx = self.select_parents(fitness_scores, 2 * n_pairs)
+            children1, children2 = self.crossover(self.population[parent_idx[:n_pairs]],
+                                                  self.population[parent_idx[n_pairs:]])
+            children = self.mutate(np.concatenate([children1, children2]))
+
+            # Elitism: keep the best individual in the first row
+            self.population = np.concatenate([best_ind[None, :], children])[:self.pop_size]
+        else:
+            # The last generation's offspring have not been scored yet
+            fitness_scores = self.evaluate_population()
+        return self.population[int(np.argmax(fitness_scores))].tolist()
@@ -0,0 +1,92 @@
+"""Solver for Simulated Annealing (multi-chain, vectorized)"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+from typing import List, Optional
+import numpy as np
+from problems import Problem
+from logger import Logger
+from .termination import Termination, never
+
+class VectorizedSASolver:
+    """
+    Simulated Annealing Solver advancing many independent chains at once.
+
+    The chains are the rows of one ``(n_chains, size)`` ``uint8`` matrix. Each
+    step proposes one random bit flip per chain, scores all proposals with the
+    problem's `batch_tracker` (O(n_chains) for OneMax and Knapsack) and applies
+    the Metropolis test to the whole batch, sharing one cooling schedule.
+
+    Each step logs the best fitness found by any chain and the mean current
+    fitness. After `solve`, `chain_best_fitness` / `chain_best_solutions` hold
+    every chain's best state and `traces` its current fitness per step. An
+    optional `Termination` is checked after every step.
+    """
+
+    def __init__(self, problem: Problem, logger: Logger, n_chains: int = 32,
+                 initial_temp: float = 100, cooling_rate: float = 0.95, min_temp: float = 0.01,
+                 max_steps: int = 1000, seed: Optional[int] = None, termination: Optional[Termination] = None):
+        if problem.packed:
+            raise ValueError("VectorizedSASolver stores its own uint8 chain matrix; use an unpacked problem.")
+        self.problem = problem
+        self.logger = logger
+        self.n_chains = n_chains
+        self.initial_temp = initial_temp
+        self.cooling_rate = cooling_rate
+        self.min_temp = min_temp
+        self.max_steps = max_steps
+        self.rng = np.random.default_rng(seed)
+        self.termination = termination or never()
+        self.stop_reason: Optional[str] = None
+        self.chain_best_fitness: np.ndarray = np.empty(0)
+        self.chain_best_solutions: np.ndarray = np.empty((0, problem.size), dtype=np.uint8)
+        self.traces: np.ndarray = np.empty((0, n_chains))
+
+    def solve(self) -> List[int]:
+        """Run multi-chain simulated annealing."""
+        size = self.problem.size
+        tracker = self.problem.batch_tracker(
+            self.rng.integers(0, 2, size=(self.n_chains, size), dtype=np.uint8))
+        self.chain_best_fitness = tracker.fitness.copy()
+        self.chain_best_solutions = tracker.population.copy()
+        best_chain = int(np.argmax(self.chain_best_fitness))
+        traces = []
+        self.termination.start()
+        self.stop_reason = None
+
+        temp = self.initial_temp
+        step = 0
+
+        while temp > self.min_temp and step < self.max_steps:
+            step += 1
+            indices = self.rng.integers(0, size, size=self.n_chains)
+            neighbor_fitness = tracker.evaluate_flips(indices)
+            delta_fitness = neighbor_fitness - tracker.fitness
+
+            # Metropolis acceptance for all chains; exp() only sees non-positive deltas
+            accept = (delta_fitness > 0) | (self.rng.random(self.n_chains) < np.exp(np.minimum(delta_fitness, 0) / temp))
+            tracker.apply_flips(accept, indices, neighbor_fitness)
+
+            improved = tracker.fitness > self.chain_best_fitness
+            if improved.any():
+                self.chain_best_fitness[improved] = tracker.fitness[improved]
+                self.chain_best_solutions[improved] = tracker.population[improved]
+                best_chain = int(np.argmax(self.chain_best_fitness))
+            traces.append(tracker.fitness.copy())
+
+            self.logger.log(step, self.chain_best_fitness[best_chain].item(), float(tracker.fitness.mean()),
+                            self.chain_best_solutions[best_chain].tolist())
+
+            if self.termination.should_stop(step, self.chain_best_fitness[best_chain].item(),
+                                            (step + 1) * self.n_chains):
+                self.stop_reason = self.termination.reason
+                print(f"Stopped after step {step}: {self.stop_reason}")
+                break
+
+            temp *= self.cooling_rate
+
+        if traces:
+            self.traces = np.stack(traces)
+        return self.chain_best_solutions[best_chain].tolist()
@@ -0,0 +1,284 @@
+"""Experiment Sweep Runner for OptSim"""
+
+__version__ = "0.8.0"
+__author__ = "ariadie@gmail.com"
+__date__ = "2026-10-17"
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from problems import Problem, OneMaxProblem, KnapsackProblem, CountingProblem
+from logger import Logger
+
+PROBLEMS = {"onemax": OneMaxProblem, "knapsack": KnapsackProblem}
+
+# Solver runners take a (counting) problem, a silent logger, the case
+# hyperparameters and seed, and return the best individual
+
+def _run_ga(problem: Problem, logger: Logger, params: Dict[str, Any], seed: int) -> Any:
+    from solvers import GASolver
+    return GASolver(problem, logger, **params).solve()
+
+def _run_ga_vec(problem: Problem, logger: Logger, params: Dict[str, Any], seed: int) -> Any:
+    from solvers import VectorizedGASolver
+    return VectorizedGASolver(problem, logger, seed=seed, **params).solve()
+
+def _run_sa(problem: Problem, logger: Logger, params: Dict[str, Any], seed: int) -> Any:
+    from solvers import SASolver
+    return SASolver(problem, logger, **params).solve()
+
+def _run_sa_vec(problem: Problem, logger: Logger, params: Dict[str, Any], seed: int) -> Any:
+    from solvers import VectorizedSASolver
+    return VectorizedSASolver(problem, logger, seed=seed, **params).solve()
+
+def _run_rl(problem: Problem, logger: Logger, params: Dict[str, Any], seed: int) -> Any:
+    from solvers import RLSolver
+    from rl_env import OneMaxEnv
+    params = dict(params)
+    episodes = params.pop("episodes")
+    env = OneMaxEnv(problem, index_states=True)
+    solver = RLSolver(env, actions=list(range(problem.size)), **params)
+    solver.train(episodes=episodes, max_steps=problem.size * 2)
+    solver.solve(max_steps=problem.size * 2)
+    return env.state
+
+# name -> (runner, default hyperparameters as used by main.py, supported problems).
+# The island and parallel-tempering solvers start their own process pools and
+# are not run inside sweep workers.
+SOLVERS: Dict[str, Tuple[Callable[..., Any], Dict[str, Any], Tuple[str, ...]]] = {
+    "ga": (_run_ga, {"pop_size": 50, "mutation_rate": 0.01, "generations": 50, "selection": "tournament"},
+           ("onemax", "knapsack")),
+    "ga-vec": (_run_ga_vec, {"pop_size": 50, "mutation_rate": 0.01, "generations": 50, "selection": "tournament"},
+               ("onemax", "knapsack")),
+    "sa": (_run_sa, {"initial_temp": 100.0, "cooling_rate": 0.95, "min_temp": 0.01, "max_steps": 500},
+           ("onemax", "knapsack")),
+    "sa-vec": (_run_sa_vec, {"n_chains": 32, "initial_temp": 100.0, "cooling_rate": 0.95, "min_temp": 0.01,
+                             "max_steps": 500}, ("onemax", "knapsack")),
+    "rl": (_run_rl, {"alpha": 0.5, "gamma": 0.9, "epsilon": 0.2, "episodes": 500}, ("onemax",)),
+}
+
+def expand_grid(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    All cases of a sweep configuration.
+
+    `config` maps ``solvers`` to ``{solver: {param: [values, ...]}}``
+    (a scalar counts as a single value, unlisted parameters keep their
+    defaults) plus lists of ``problems``, ``sizes`` and ``seeds``. Every
+    combination of hyperparameters, problem, size and seed is one case;
+    solver/problem pairs the solver does not support are skipped.
+    """
+    cases = []
+    for solver_name, grid in config["solvers"].items():
+        if solver_name not in SOLVERS:
+            raise ValueError(f"Unknown solver {solver_name!r}; choose from {', '.join(SOLVERS)}")
+        defaults = SOLVERS[solver_name][1]
+        grid = grid or {}
+        unknown = set(grid) - set(defaults)
+        if unknown:
+            raise ValueError(f"Unknown {solver_name} parameters: {', '.join(sorted(unknown))}")
+        names = list(grid)
+        values = [grid[name] if isinstance(grid[name], list) else [grid[name]] for name in names]
+        for combination in itertools.product(*values):
+            params = {**defaults, **dict(zip(names, combination))}
+            for problem_name in config["problems"]:
+                if problem_name not in SOLVERS[solver_name][2]:
+                    continue
+                for size in config["sizes"]:
+                    for seed in config["seeds"]:
+                        cases.append({"solver": solver_name, "problem": problem_name, "size": size,
+                                      "seed": seed, "params": params})
+    return cases
+
+def run_case(case: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one sweep case and return its final fitness, timing and evaluation count.
+
+    The `random` and NumPy generators are seeded with the case seed before
+    the problem is built, so every solver and hyperparameter setting with
+    the same size and seed sees the same problem instance.
+    """
+    random.seed(case["seed"])
+    np.random.seed(case["seed"])
+    problem = PROBLEMS[case["problem"]](case["size"])
+    counter = CountingProblem(problem)
+    logger = Logger(print_every=0)
+
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        best = SOLVERS[case["solver"]][0](counter, logger, case["params"], case["seed"])
+    wall_time = time.perf_counter() - start
+
+    return {**case, "final_fitness": problem.evaluate(best), "wall_time": wall_time,
+            "evaluations": counter.evaluations}
+
+def run_sweep(cases: List[Dict[str, Any]], workers: int = 1,
+              progress: Optional[Callable[[Dict[str, Any], int, int], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Run `cases` on a pool of `workers` processes (inline when 1).
+
+    At most twice as many cases as workers are queued at a time, so large
+    grids do not pile up pending tasks. Results are returned in case order;
+    `progress(result, done, total)` is called as each case finishes.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(cases)
+    if workers <= 1:
+        for index, case in enumerate(cases):
+            results[index] = run_case(case)
+            if progress:
+                progress(results[index], index + 1, len(cases))
+        return results
+
+    pending = {}
+    queue = iter(enumerate(cases))
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            for index, case in itertools.islice(queue, 2 * workers - len(pending)):
+                pending[executor.submit(run_case, case)] = index
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = pending.pop(future)
+                results[index] = future.result()
+                done += 1
+                if progress:
+                    progress(results[index], done, len(cases))
+    return results
+
+def format_params(params: Dict[str, Any]) -> str:
+    return " ".join(f"{name}={value}" for name, value in params.items())
+
+def summarize(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Aggregate runs over seeds: one row per solver, hyperparameters, problem and size."""
+    groups: Dict[Tuple[str, str, str, int], List[Dict[str, Any]]] = {}
+    for result in results:
+        key = (result["solver"], format_params(result["params"]), result["problem"], result["size"])
+        groups.setdefault(key, []).append(result)
+    rows = []
+    for (solver_name, params, problem_name, size), runs in groups.items():
+        fitness = [run["final_fitness"] for run in runs]
+        rows.append({
+            "solver": solver_name,
+            "params": params,
+            "problem": problem_name,
+            "size": size,
+            "runs": len(runs),
+            "fitness_mean": statistics.mean(fitness),
+            "fitness_std": statistics.stdev(fitness) if len(fitness) > 1 else 0.0,
+            "fitness_min": min(fitness),
+            "fitness_max": max(fitness),
+            "time_median": statistics.median(run["wall_time"] for run in runs),
+            "evaluations_mean": statistics.mean(run["evaluations"] for run in runs),
+        })
+    return rows
+
+def format_summary(rows: List[Dict[str, Any]]) -> str:
+    """Summary rows as a text table, best mean fitness first within each problem and size."""
+    rows = sorted(rows, key=lambda row: (row["problem"], row["size"], -row["fitness_mean"]))
+    width = max([len(row["params"]) for row in rows] + [6])
+    lines = [f"{'solver':<7} {'problem':<9} {'size':>6} {'params':<{width}} {'runs':>4} "
+             f"{'fitness':>10} {'std':>8} {'min':>8} {'max':>8} {'time':>8} {'evals':>10}"]
+    for row in rows:
+        lines.append(f"{row['solver']:<7} {row['problem']:<9} {row['size']:>6} {row['params']:<{width}} "
+                     f"{row['runs']:>4} {row['fitness_mean']:>10.2f} {row['fitness_std']:>8.2f} "
+                     f"{row['fitness_min']:>8} {row['fitness_max']:>8} {row['time_median']:>7.3f}s "
+                     f"{row['evaluations_mean']:>10.0f}")
+    return "\n".join(lines)
+
+def save_summary(rows: List[Dict[str, Any]], results: List[Dict[str, Any]], path: str):
+    """Write the summary table to `path` (CSV) and the individual runs next to it (`_runs.csv`)."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    runs_path = os.path.splitext(path)[0] + "_runs.csv"
+    with open(runs_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=["solver", "params", "problem", "size", "seed",
+                                               "final_fitness", "wall_time", "evaluations"])
+        writer.writeheader()
+        for result in results:
+            writer.writerow({**result, "params": format_params(result["params"])})
+
+def load_config(path: str) -> Dict[str, Any]:
+    """Read a JSON sweep configuration (see `expand_grid`)."""
+    with open(path) as f:
+        return json.load(f)
+
+def parse_param(text: str) -> Tuple[str, str, List[Any]]:
+    """Parse ``solver.param=v1,v2,...`` (values are JSON where possible)."""
+    name, _, values = text.partition("=")
+    solver_name, _, param = name.partition(".")
+    if not values or not param:
+        raise argparse.ArgumentTypeError(f"expected solver.param=v1,v2,... got {text!r}")
+    parsed = []
+    for value in values.split(","):
+        try:
+            parsed.append(json.loads(value))
+        except ValueError:
+            parsed.append(value)
+    return solver_name, param, parsed
+
+def sweep(config: Dict[str, Any], workers: int = 1, output: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Run a sweep configuration, print the summary table and save it as CSV; returns the summary rows."""
+    cases = expand_grid(config)
+    print(f"Running {len(cases)} cases on {workers} worker(s)...")
+
+    def progress(result: Dict[str, Any], done: int, total: int):
+        print(f"[{done}/{total}] {result['solver']} {result['problem']} n={result['size']} "
+              f"seed={result['seed']} {format_params(result['params'])}: "
+              f"fitness={result['final_fitness']} time={result['wall_time']:.3f}s")
+
+    results = run_sweep(cases, workers, progress)
+    rows = summarize(results)
+    print(format_summary(rows))
+
+    if output is None:
+        if not os.path.exists("logs"):
+            os.makedirs("logs")
+        output = f"logs/sweep_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    save_summary(rows, results, output)
+    print(f"Sweep summary saved to {output}")
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="OptSim Experiment Sweep")
+    parser.add_argument("--config", help="JSON sweep configuration (overrides the grid options below)")
+    parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), default=["ga", "sa"], help="Solvers to run")
+    parser.add_argument("--problems", nargs="+", choices=list(PROBLEMS), default=["onemax"], help="Problems to run")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100], help="Problem sizes")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[0, 1, 2], help="Random seeds")
+    parser.add_argument("--param", action="append", type=parse_param, default=[],
+                        metavar="SOLVER.PARAM=V1,V2", help="Hyperparameter values to sweep (repeatable)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Concurrent worker processes")
+    parser.add_argument("--output", help="Summary CSV path (default: logs/sweep_<timestamp>.csv)")
+    args = parser.parse_args()
+
+    if args.config:
+        config = load_config(args.config)
+    else:
+        config = {"solvers": {name: {} for name in args.solvers}, "problems": args.problems,
+                  "sizes": args.sizes, "seeds": args.seeds}
+        for solver_name, param, values in args.param:
+            if solver_name not in config["solvers"]:
+                parser.error(f"--param {solver_name}.{param}: {solver_name} is not among --solvers")
+            config["solvers"][solver_name][param] = values
+    try:
+        expand_grid(config)
+    except (KeyError, ValueError) as e:
+        parser.error(f"Invalid sweep configuration: {e}")
+    sweep(config, args.workers, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Bit-packed genome tests."""
+
+import contextlib
+import io
+import random
+import tracemalloc
+
+from logger import Logger
+from problems import OneMaxProblem, PackedOneMaxProblem
+from solvers import SASolver
+
+def _sa_peak_memory(problem) -> int:
+    """Peak traced memory (bytes) of a logged SA run on `problem`."""
+    random.seed(0)
+    logger = Logger(print_every=0, decode=problem.decode if problem.packed else None)
+    solver = SASolver(problem, logger, initial_temp=100.0, cooling_rate=0.9999, min_temp=0.001, max_steps=2000)
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            solver.solve()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_packed_sa_run_uses_less_memory_than_unpacked():
+    size = 20000
+    assert _sa_peak_memory(PackedOneMaxProblem(size)) < _sa_peak_memory(OneMaxProblem(size))
+
+def test_logger_decodes_packed_individuals_on_output(tmp_path):
+    problem = PackedOneMaxProblem(16)
+    individual = problem.create_individual()
+    logger = Logger(print_every=0, decode=problem.decode)
+    logger.log(1, 1.0, 1.0, individual, population=[individual])
+
+    assert logger.history[0]["best_solution"] == individual
+    assert logger.get_history()[0]["best_solution"] == problem.decode(individual)
+    assert list(logger.history[0]["gene_frequency"]) == problem.decode(individual)
+
+    path = tmp_path / "log.csv"
+    logger.save_to_csv(str(path))
+    assert str(problem.decode(individual)) in path.read_text()
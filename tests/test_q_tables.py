@@ -0,0 +1,18 @@
+"""Q-table state encoding tests."""
+
+import numpy as np
+
+from solvers.q_tables import QTable
+
+def test_array_states_encode_like_tuples():
+    rng = np.random.default_rng(0)
+    for size in (9, 24, 25, 40, 70):
+        state = rng.integers(0, 2, size=size).astype(np.uint8)
+        assert QTable.encode(state) == QTable.encode(tuple(int(b) for b in state))
+        assert QTable.encode(state) == QTable.encode(tuple(state))
+
+def test_uint8_states_do_not_wrap():
+    high = np.zeros(9, dtype=np.uint8)
+    high[8] = 1
+    assert QTable.encode(high) == 256
+    assert QTable.encode(np.ones(40, dtype=np.uint8)) == 2 ** 40 - 1
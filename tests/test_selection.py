@@ -0,0 +1,48 @@
+"""Parent selection tests."""
+
+import random
+
+import numpy as np
+import pytest
+
+from logger import Logger
+from problems import OneMaxProblem
+from solvers import GASolver
+from solvers.selection import SELECTIONS, select, tournament
+
+def test_tournament_contenders_are_distinct():
+    # With every individual in the tournament, distinct contenders always include the best
+    fitness = np.arange(5.0)
+    rng = np.random.default_rng(0)
+    assert (tournament(fitness, 1000, rng, size=5) == 4).all()
+
+def test_tournament_win_rates_match_sampling_without_replacement():
+    fitness = np.arange(5.0)
+    rng = np.random.default_rng(1)
+    shares = np.bincount(tournament(fitness, 200_000, rng, size=3), minlength=5) / 200_000
+    # P(i wins) = P(i drawn and no better one drawn) = C(i, 2) / C(5, 3)
+    np.testing.assert_allclose(shares, [0.0, 0.0, 0.1, 0.3, 0.6], atol=0.01)
+
+def test_tournament_larger_than_population_is_rejected():
+    with pytest.raises(ValueError):
+        tournament(np.ones(2), 4, np.random.default_rng(0), size=3)
+
+@pytest.mark.parametrize("method", list(SELECTIONS))
+def test_select_returns_valid_indices(method):
+    fitness = np.array([3.0, 0.0, 1.0, 7.0, 2.0, 5.0])
+    picks = select(method, fitness, 11, np.random.default_rng(2))
+    assert picks.shape == (11,)
+    assert ((picks >= 0) & (picks < len(fitness))).all()
+
+def test_sus_picks_each_individual_its_expected_number_of_times():
+    fitness = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+    counts = np.bincount(select("sus", fitness, 10, np.random.default_rng(3)), minlength=5)
+    assert counts.tolist() == [0, 1, 2, 3, 4]
+
+def test_select_parent_returns_a_population_member():
+    random.seed(0)
+    solver = GASolver(OneMaxProblem(10), Logger(print_every=0), pop_size=8)
+    solver.initialize_population()
+    parent = solver.select_parent()
+    assert parent in solver.population
+    assert solver.evaluations == solver.tournament_size
@@ -0,0 +1,33 @@
+"""Termination criteria tests."""
+
+import contextlib
+import io
+import random
+
+import pytest
+
+from logger import Logger
+from problems import OneMaxProblem
+from solvers import GASolver, MaxEvaluations, VectorizedGASolver
+
+POP_SIZE = 20
+
+@pytest.mark.parametrize("solver_class", [GASolver, VectorizedGASolver])
+@pytest.mark.parametrize("limit", [1, 50, 205])
+def test_max_evaluations_overshoots_by_at_most_one_generation(solver_class, limit):
+    random.seed(0)
+    solver = solver_class(OneMaxProblem(30), Logger(print_every=0), pop_size=POP_SIZE, generations=100,
+                          termination=MaxEvaluations(limit))
+    with contextlib.redirect_stdout(io.StringIO()):
+        solver.solve()
+    assert solver.stop_reason is not None
+    assert solver.evaluations <= limit + POP_SIZE
+
+@pytest.mark.parametrize("solver_class", [GASolver, VectorizedGASolver])
+def test_full_run_scores_the_last_offspring(solver_class):
+    random.seed(0)
+    solver = solver_class(OneMaxProblem(30), Logger(print_every=0), pop_size=POP_SIZE, generations=5)
+    with contextlib.redirect_stdout(io.StringIO()):
+        solver.solve()
+    assert solver.stop_reason is None
+    assert solver.evaluations == POP_SIZE * 6
@@ -1,23 +1,49 @@
 """Visualization Utility"""
 
-__version__ = "0.7.0"
+__version__ = "0.8.0"
 __author__ = "ariadie@gmail.com"
-__date__ = "2025-12-25"
+__date__ = "2026-10-17"
 
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.animation import PillowWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import ListedColormap
 import numpy as np
-from typing import List, Dict, Any
+from PIL import Image
+from typing import List, Dict, Any, Mapping, Optional, Sequence, Union
 
 class Visualizer:
     """Class for visualizing evolutionary progress."""
 
-    def plot_fitness(self, history: List[Dict[str, Any]], filename: str = "evolution_plot.png"):
-        """Plot the fitness history."""
-        generations = [entry['generation'] for entry in history]
-        best_fitness = [entry['best_fitness'] for entry in history]
-        avg_fitness = [entry['avg_fitness'] for entry in history]
+    # Genomes up to this length get their bit values printed in the animation
+    LABELED_BITS = 100
+
+    @staticmethod
+    def _stride(length: int, max_points: Optional[int]) -> int:
+        """Step that keeps at most `max_points` of `length` samples."""
+        if not max_points or length <= max_points:
+            return 1
+        return -(-length // max_points)
+
+    def plot_fitness(self, history: Union[List[Dict[str, Any]], Mapping[str, Sequence[float]]], filename: str = "evolution_plot.png",
+                     max_points: Optional[int] = None):
+        """
+        Plot the fitness history.
+
+        Args:
+            history: Logger history entries, columns as returned by `Logger.get_stats()`,
+                or a `history.HistoryReader`
+            filename: Output image filename
+            max_points: Plot at most this many evenly strided points (for very long runs)
+        """
+        if isinstance(history, Mapping):
+            stride = self._stride(len(history['generation']), max_points)
+            generations = history['generation'][::stride]
+            best_fitness = history['best_fitness'][::stride]
+            avg_fitness = history['avg_fitness'][::stride]
+        else:
+            generations = [entry['generation'] for entry in history]
+            best_fitness = [entry['best_fitness'] for entry in history]
+            avg_fitness = [entry['avg_fitness'] for entry in history]
 
         plt.figure(figsize=(10, 6))
         plt.plot(generations, best_fitness, label='Best Fitness', color='green')
@@ -32,36 +58,37 @@ class Visualizer:
         print(f"Fitness plot saved to {filename}")
         plt.close()
 
-    def plot_population_heatmap(self, history: List[Dict[str, Any]], filename: str = "population_heatmap.png"):
+    def plot_population_heatmap(self, history: Union[List[Dict[str, Any]], Mapping[str, Any]], filename: str = "population_heatmap.png",
+                                max_points: Optional[int] = None):
         """
         Plot a heatmap showing the convergence of genes/bits over generations.
         X-axis: Generation
         Y-axis: Gene Position
         Color: Average value of that gene in the population (0.0 to 1.0)
-        """
-        if not history or 'population' not in history[0]:
-            print("No population data available for heatmap.")
-            return
 
-        # Prepare grid: rows=Gene Position, cols=Generation
-        # Assuming all individuals have same length
-        ind_length = len(history[0]['population'][0])
-        grid = []
+        Accepts Logger history entries or a `history.HistoryReader`; with
+        `max_points`, at most that many (strided) generations are drawn.
+        """
+        if isinstance(history, Mapping):
+            if 'gene_frequency' not in history or len(history['gene_frequency']) == 0:
+                print("No population data available for heatmap.")
+                return
+            frequencies = history['gene_frequency']
+            grid_t = np.asarray(frequencies[::self._stride(len(frequencies), max_points)]).T
+        else:
+            if not history or (history[0].get('gene_frequency') is None and history[0].get('population') is None):
+                print("No population data available for heatmap.")
+                return
 
-        for entry in history:
-            pop = entry['population']
-            # Calculate average for each gene position
-            gene_avgs = [0.0] * ind_length
-            for ind in pop:
-                for i, gene in enumerate(ind):
-                    gene_avgs[i] += gene
+            # Per-gene frequencies are aggregated by the Logger at log time; fall
+            # back to reducing full snapshots when only those were kept.
+            entries = history[::self._stride(len(history), max_points)]
+            grid = [entry['gene_frequency'] if entry.get('gene_frequency') is not None
+                    else np.asarray(entry['population'], dtype=float).mean(axis=0)
+                    for entry in entries]
             
-            gene_avgs = [x / len(pop) for x in gene_avgs]
-            grid.append(gene_avgs)
-        
-        # Transpose so X is generation (currently grid is [gen][gene])
-        # We want matrix [gene][gen] for imshow where X is col index
-        grid_t = list(zip(*grid))
+            # Stack as [gene][gen] so X is the generation (column index) for imshow
+            grid_t = np.stack(grid, axis=1)
 
         plt.figure(figsize=(12, 6))
         plt.imshow(grid_t, aspect='auto', cmap='RdYlGn', vmin=0, vmax=1, origin='lower')
@@ -81,12 +108,11 @@ class Visualizer:
         Actually simpler: Bar chart of weights of selected items.
         """
         # Data prep
-        items = problem.items
+        weights = problem.weights
+        values = problem.values
         capacity = problem.capacity
         
-        indices = range(len(items))
-        weights = [item['w'] for item in items]
-        values = [item['v'] for item in items]
+        indices = np.arange(len(weights))
         
         # Colors: Green if selected, Gray if not
         colors = ['green' if bit == 1 else 'lightgray' for bit in solution]
@@ -113,120 +139,135 @@ class Visualizer:
         print(f"Knapsack solution plot saved to {filename}")
         plt.close()
 
-    def animate_best_individual(self, history: List[Dict[str, Any]], filename: str = "best_individual_animation.gif", fps: int = 2):
+    def animate_best_individual(self, history: Union[List[Dict[str, Any]], Mapping[str, Any]], filename: str = "best_individual_animation.gif", fps: int = 2,
+                                max_frames: Optional[int] = 200):
         """
         Create an animated visualization showing how the best individual evolves over generations.
+
+        The genome is drawn as one image artist whose data is replaced every
+        frame; frames are blitted onto a background rendered once (axes,
+        titles, static patches), so a frame costs about the same for 10 or
+        10,000 bits. Bit values are printed on the squares for genomes of up to
+        `LABELED_BITS` genes. Long runs are strided down to `max_frames`
+        frames; the final generation is always included.
         
         Args:
-            history: Logger history containing best_solution for each generation
-            filename: Output filename (.gif or .mp4)
+            history: Logger history containing best_solution for each generation, or a `history.HistoryReader`
+            filename: Output filename (an animated format Pillow can write, e.g. .gif)
             fps: Frames per second (default: 2 for educational viewing)
+            max_frames: Frame budget (None renders every logged generation)
         """
-        if not history or 'best_solution' not in history[0]:
-            print("No best_solution data available for animation.")
-            return
+        if isinstance(history, Mapping):
+            if 'best_solution' not in history or len(history['best_solution']) == 0:
+                print("No best_solution data available for animation.")
+                return
+            generations = history['generation']
+            best_solutions = history['best_solution']
+            best_fitness = history['best_fitness']
+        else:
+            if not history or 'best_solution' not in history[0]:
+                print("No best_solution data available for animation.")
+                return
+            
+            # Extract data
+            generations = [entry['generation'] for entry in history]
+            best_solutions = [entry['best_solution'] for entry in history]
+            best_fitness = [entry['best_fitness'] for entry in history]
         
-        # Extract data
-        generations = [entry['generation'] for entry in history]
-        best_solutions = [entry['best_solution'] for entry in history]
-        best_fitness = [entry['best_fitness'] for entry in history]
+        # Frame budget: evenly strided generations plus the last one
+        frames = list(range(0, len(generations), self._stride(len(generations), max_frames)))
+        if frames[-1] != len(generations) - 1:
+            frames.append(len(generations) - 1)
         
-        # Get problem size
+        # Get problem size; wide genomes get a roughly square grid
         problem_size = len(best_solutions[0])
         max_fitness = max(best_fitness)
+        cols = min(problem_size, max(20, int(np.ceil(np.sqrt(problem_size)))))
+        rows = -(-problem_size // cols)  # Ceiling division
+        
+        def grid(solution) -> np.ma.MaskedArray:
+            cells = np.zeros(rows * cols)
+            cells[:problem_size] = np.asarray(solution, dtype=float)
+            # Padding after the last gene is masked (drawn blank)
+            return np.ma.masked_array(cells, mask=np.arange(rows * cols) >= problem_size).reshape(rows, cols)
         
         # Setup figure
         fig = plt.figure(figsize=(12, 6))
+        canvas = FigureCanvasAgg(fig)
         gs = fig.add_gridspec(3, 1, height_ratios=[1, 3, 1], hspace=0.3)
         
         ax_title = fig.add_subplot(gs[0])
         ax_bits = fig.add_subplot(gs[1])
         ax_progress = fig.add_subplot(gs[2])
         
-        # Remove axes for title and progress
+        # Static elements are drawn once into the background
         ax_title.axis('off')
         ax_progress.set_xlim(0, 1)
         ax_progress.set_ylim(0, 1)
         ax_progress.axis('off')
+        ax_bits.set_xticks([])
+        ax_bits.set_yticks([])
+        ax_bits.set_title('Best Individual (Green=1, Red=0)', fontsize=12, pad=10)
+        ax_progress.add_patch(plt.Rectangle((0.1, 0.3), 0.8, 0.4, 
+                                            facecolor='lightgray', edgecolor='black', linewidth=2))
         
-        def update(frame):
-            """Update function for each animation frame."""
-            gen = generations[frame]
-            solution = best_solutions[frame]
-            fitness = best_fitness[frame]
-            
-            # Clear axes
-            ax_title.clear()
-            ax_bits.clear()
-            ax_progress.clear()
-            
-            ax_title.axis('off')
-            ax_progress.axis('off')
-            
-            # Title with generation and fitness
-            ax_title.text(0.5, 0.5, f'Generation: {gen}    Fitness: {int(fitness)}/{problem_size}', 
-                         ha='center', va='center', fontsize=16, fontweight='bold')
-            
-            # Draw binary string as colored squares
-            colors = ['#2ecc71' if bit == 1 else '#e74c3c' for bit in solution]
-            
-            # Calculate grid dimensions for better layout
-            cols = min(20, problem_size)  # Max 20 columns
-            rows = (problem_size + cols - 1) // cols  # Ceiling division
-            
-            ax_bits.set_xlim(-0.5, cols - 0.5)
-            ax_bits.set_ylim(-0.5, rows - 0.5)
-            ax_bits.set_aspect('equal')
-            ax_bits.invert_yaxis()
-            
-            # Draw squares
-            for i, (bit, color) in enumerate(zip(solution, colors)):
-                row = i // cols
-                col = i % cols
-                
-                # Draw square
-                square = plt.Rectangle((col - 0.4, row - 0.4), 0.8, 0.8, 
-                                       facecolor=color, edgecolor='black', linewidth=1)
-                ax_bits.add_patch(square)
-                
-                # Add bit value as text
-                ax_bits.text(col, row, str(bit), ha='center', va='center', 
-                           fontsize=10, fontweight='bold', color='white')
+        # Per-frame artists: one image for all bits plus a few labels
+        cmap = ListedColormap(['#e74c3c', '#2ecc71'])
+        cmap.set_bad('white')
+        image = ax_bits.imshow(grid(best_solutions[frames[0]]), cmap=cmap, vmin=0, vmax=1,
+                               interpolation='nearest', aspect='equal')
+        title = ax_title.text(0.5, 0.5, '', ha='center', va='center', fontsize=16, fontweight='bold')
+        progress_bar = ax_progress.add_patch(plt.Rectangle((0.1, 0.3), 0.0, 0.4, 
+                                                           facecolor='#3498db', edgecolor='black', linewidth=2))
+        progress_text = ax_progress.text(0.5, 0.5, '', ha='center', va='center', fontsize=12, fontweight='bold')
+        artists = [image]
+        if cols <= 50:
+            # Cell borders, drawn over the image
+            artists.append(ax_bits.vlines(np.arange(-0.5, cols), -0.5, rows - 0.5, colors='black', linewidth=1))
+            artists.append(ax_bits.hlines(np.arange(-0.5, rows), -0.5, cols - 0.5, colors='black', linewidth=1))
+        labels = []
+        if problem_size <= self.LABELED_BITS:
+            labels = [ax_bits.text(i % cols, i // cols, '', ha='center', va='center',
+                                   fontsize=10, fontweight='bold', color='white')
+                      for i in range(problem_size)]
+        artists += [title, progress_bar, progress_text] + labels
+        for artist in artists:
+            artist.set_animated(True)
+        
+        def update(index):
+            """Update the artists for one animation frame."""
+            solution = best_solutions[index]
+            fitness = best_fitness[index]
             
-            # Remove ticks and labels
-            ax_bits.set_xticks([])
-            ax_bits.set_yticks([])
-            ax_bits.set_title('Best Individual (Green=1, Red=0)', fontsize=12, pad=10)
+            image.set_data(grid(solution))
+            for label, bit in zip(labels, solution):
+                label.set_text(str(bit))
+            title.set_text(f'Generation: {generations[index]}    Fitness: {int(fitness)}/{problem_size}')
             
-            # Progress bar
             progress = fitness / max_fitness if max_fitness > 0 else 0
-            
-            # Background bar
-            ax_progress.add_patch(plt.Rectangle((0.1, 0.3), 0.8, 0.4, 
-                                               facecolor='lightgray', edgecolor='black', linewidth=2))
-            
-            # Progress bar
-            ax_progress.add_patch(plt.Rectangle((0.1, 0.3), 0.8 * progress, 0.4, 
-                                               facecolor='#3498db', edgecolor='black', linewidth=2))
-            
-            # Progress text
-            ax_progress.text(0.5, 0.5, f'{progress*100:.1f}% Optimal', 
-                           ha='center', va='center', fontsize=12, fontweight='bold')
-            
-            return []
-        
-        # Create animation
-        print(f"Creating animation with {len(generations)} frames...")
-        anim = animation.FuncAnimation(fig, update, frames=len(generations), 
-                                      interval=1000/fps, repeat=True, blit=False)
+            progress_bar.set_width(0.8 * progress)
+            progress_text.set_text(f'{progress*100:.1f}% Optimal')
         
-        # Save animation
+        # Blitting: restore the cached background and redraw only the animated
+        # artists, then hand the RGB buffer to Pillow
+        print(f"Creating animation with {len(frames)} frames ({len(generations)} generations logged)...")
         try:
-            writer = PillowWriter(fps=fps)
-            anim.save(filename, writer=writer)
+            canvas.draw()
+            background = canvas.copy_from_bbox(fig.bbox)
+            images = []
+            for index in frames:
+                update(index)
+                canvas.restore_region(background)
+                for artist in artists:
+                    fig.draw_artist(artist)
+                rgb = np.asarray(canvas.buffer_rgba())[:, :, :3]
+                # Few distinct colors: a fast per-frame palette without dithering
+                images.append(Image.fromarray(rgb).quantize(colors=64, method=Image.Quantize.FASTOCTREE,
+                                                            dither=Image.Dither.NONE))
+            images[0].save(filename, save_all=True, append_images=images[1:], duration=int(1000 / fps),
+                           loop=0, optimize=False)
             print(f"Animation saved to {filename}")
         except Exception as e:
             print(f"Error saving animation: {e}")
-            print("Make sure 'pillow' is installed: pip install pillow")
         finally:
             plt.close(fig)